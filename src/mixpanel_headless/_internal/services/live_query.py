@@ -12,6 +12,7 @@ from __future__ import annotations
 import re
 import warnings
 from datetime import datetime, timezone
+from itertools import pairwise
 from typing import TYPE_CHECKING, Any, Literal
 
 from mixpanel_headless._internal.expressions import normalize_on_expression
@@ -123,38 +124,37 @@ def _transform_funnel(
     """
     data = raw.get("data", {})
 
-    # Aggregate steps across all dates
-    aggregated_counts: dict[
-        int, tuple[str, int]
-    ] = {}  # step_idx -> (event, total_count)
+    # Aggregate steps across all dates into parallel per-step columns; the
+    # last date's event name wins for each step index.
+    events: list[str] = []
+    counts: list[int] = []
 
     for date_data in data.values():
         steps_data = _extract_steps_from_date_data(date_data)
         for idx, step in enumerate(steps_data):
             event = step.get("event", step.get("goal", f"Step {idx + 1}"))
             count = step.get("count", 0)
-            if idx in aggregated_counts:
-                _, existing = aggregated_counts[idx]
-                aggregated_counts[idx] = (event, existing + count)
+            if idx < len(counts):
+                events[idx] = event
+                counts[idx] += count
             else:
-                aggregated_counts[idx] = (event, count)
-
-    # Build FunnelResultStep list with recalculated conversion rates
-    steps: list[FunnelResultStep] = []
-    prev_count = 0
-    for idx in sorted(aggregated_counts.keys()):
-        event, count = aggregated_counts[idx]
-        conv_rate = 1.0 if idx == 0 else (count / prev_count if prev_count > 0 else 0.0)
-        steps.append(
-            FunnelResultStep(event=event, count=count, conversion_rate=conv_rate)
+                events.append(event)
+                counts.append(count)
+
+    # Step conversion: 1.0 for the first step, then count / previous count
+    rates: list[float] = []
+    if counts:
+        rates.append(1.0)
+        rates.extend(
+            count / prev if prev > 0 else 0.0 for prev, count in pairwise(counts)
         )
-        prev_count = count
+    steps = [
+        FunnelResultStep(event=event, count=count, conversion_rate=rate)
+        for event, count, rate in zip(events, counts, rates, strict=True)
+    ]
 
     # Overall conversion rate: last step / first step
-    if steps:
-        overall_rate = steps[-1].count / steps[0].count if steps[0].count > 0 else 0.0
-    else:
-        overall_rate = 0.0
+    overall_rate = counts[-1] / counts[0] if counts and counts[0] > 0 else 0.0
 
     return FunnelResult(
         funnel_id=funnel_id,
@@ -202,14 +202,17 @@ def _transform_retention(
     """
     cohorts: list[CohortInfo] = []
 
-    # Sort by date for consistent ordering
-    for date in sorted(raw.keys()):
+    # Sort by date for consistent ordering (ISO-8601 keys sort
+    # chronologically as plain strings)
+    for date in sorted(raw):
         cohort_data = raw[date]
         size = cohort_data.get("first", 0)
         counts = cohort_data.get("counts", [])
 
         # Calculate retention percentages
-        retention = [count / size if size > 0 else 0.0 for count in counts]
+        retention = (
+            [count / size for count in counts] if size > 0 else [0.0] * len(counts)
+        )
 
         cohorts.append(
             CohortInfo(
@@ -299,21 +299,20 @@ class SegmentationResult(ResultWithDataFrame):
         if self._df_cache is not None:
             return self._df_cache
 
-        rows: list[dict[str, Any]] = []
+        # Build the three columns directly rather than one dict per
+        # (segment, date) pair; each segment extends them in bulk
+        dates: list[str] = []
+        segments: list[str] = []
+        counts: list[int] = []
 
         for segment_name, date_counts in self.series.items():
-            for date_str, count in date_counts.items():
-                rows.append(
-                    {
-                        "date": date_str,
-                        "segment": segment_name,
-                        "count": count,
-                    }
-                )
+            dates.extend(date_counts.keys())
+            segments.extend([segment_name] * len(date_counts))
+            counts.extend(date_counts.values())
 
         result_df = (
-            pd.DataFrame(rows)
-            if rows
+            pd.DataFrame({"date": dates, "segment": segments, "count": counts})
+            if dates
             else pd.DataFrame(columns=["date", "segment", "count"])
         )
 
@@ -333,7 +332,7 @@ class SegmentationResult(ResultWithDataFrame):
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunnelResultStep:
     """Single step result in a legacy funnel query response."""
 
@@ -423,7 +422,7 @@ class FunnelResult(ResultWithDataFrame):
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CohortInfo:
     """Retention data for a single cohort."""
 
@@ -584,30 +583,39 @@ class JQLResult(ResultWithDataFrame):
         if not raw:
             return pd.DataFrame()
 
-        # Detect groupBy structure: {key: [...], value: X}
-        if self._is_groupby_structure(raw):
-            return self._expand_groupby_structure(raw)
+        # Dispatch once on the first row's type; every structured pattern
+        # below requires the first row to be a dict or a list
+        first = raw[0]
+        if isinstance(first, dict):
+            # Detect groupBy structure: {key: [...], value: X}
+            if self._is_groupby_structure(raw):
+                return self._expand_groupby_structure(raw)
+
+            # Handle list of dicts (already good structure or after .map())
+            # But first check if ALL items are dicts to avoid pandas errors
+            if all(isinstance(item, dict) for item in raw):
+                # pandas' list-of-dicts constructor is already as fast as
+                # from_records(columns=...) for uniform records, and it also
+                # keeps keys that only appear in later rows
+                try:
+                    return pd.DataFrame(raw)
+                except (ValueError, TypeError):
+                    # Mixed dict structures, wrap safely
+                    return pd.DataFrame({"value": raw})
 
         # Special case: nested list of dicts (e.g., from percentiles after flatten)
         # Structure: [[{percentile: 50, value: 118}, ...]]
-        if (
-            len(raw) == 1
-            and isinstance(raw[0], list)
-            and raw[0]
-            and isinstance(raw[0][0], dict)
+        elif (
+            isinstance(first, list)
+            and len(raw) == 1
+            and first
+            and isinstance(first[0], dict)
         ):
-            return pd.DataFrame(raw[0])
-
-        # Handle list of dicts (already good structure or after .map())
-        # But first check if ALL items are dicts to avoid pandas errors
-        if isinstance(raw[0], dict) and all(isinstance(item, dict) for item in raw):
-            try:
-                return pd.DataFrame(raw)
-            except (ValueError, TypeError):
-                # Mixed dict structures, wrap safely
-                return pd.DataFrame({"value": raw})
+            return pd.DataFrame(first)
 
-        # For other structures (lists, scalars, mixed types), wrap in value column
+        # For other structures (lists, scalars, mixed types), wrap in value column.
+        # Single-scalar reduce() results ([42]) land here directly; the
+        # dict-of-list constructor already skips row-wise inference.
         return pd.DataFrame({"value": raw})
 
     def _is_groupby_structure(self, raw: list[Any]) -> bool:
@@ -648,15 +656,19 @@ class JQLResult(ResultWithDataFrame):
         Raises:
             ValueError: If value types are inconsistent across rows.
         """
-        # Validate consistent value types
-        value_is_list = [isinstance(item["value"], list) for item in raw]
-        if not (all(value_is_list) or not any(value_is_list)):
+        # Validate consistent value types in a single pass against the first row
+        value_is_list = isinstance(raw[0]["value"], list)
+        if any(isinstance(item["value"], list) is not value_is_list for item in raw):
             raise ValueError(
                 "Inconsistent value types in groupBy results: "
                 "some rows have scalar values, others have arrays. "
                 "This typically indicates a malformed JQL query result."
             )
 
+        columns = self._groupby_columns(raw, value_is_list)
+        if columns is not None:
+            return pd.DataFrame(columns)
+
         rows = []
         for item in raw:
             row_dict: dict[str, Any] = {}
@@ -685,6 +697,54 @@ class JQLResult(ResultWithDataFrame):
 
         return pd.DataFrame(rows)
 
+    @staticmethod
+    def _groupby_columns(
+        raw: list[dict[str, Any]], value_is_list: bool
+    ) -> dict[str, list[Any]] | None:
+        """Build groupBy columns directly when every row has the same shape.
+
+        The common groupBy result has identical fields, key length and
+        reducer count on every row. For that shape each output column is a
+        single comprehension over ``raw``, avoiding a dict per row. Column
+        order and overwrite behavior match the row-by-row expansion.
+
+        Args:
+            raw: List of groupBy result objects with consistent value types.
+            value_is_list: Whether values are reducer arrays.
+
+        Returns:
+            Mapping of column name to values, or None if rows differ in
+            shape and must be expanded row by row.
+        """
+        first = raw[0]
+        fields = first.keys()
+        n_keys = len(first["key"])
+        n_values = len(first["value"]) if value_is_list else 0
+        if not all(
+            item.keys() == fields
+            and len(item["key"]) == n_keys
+            and (not value_is_list or len(item["value"]) == n_values)
+            for item in raw
+        ):
+            return None
+        if n_keys == 0 and value_is_list and n_values == 0 and len(fields) == 2:
+            # No cells at all; let the row path build the empty-column frame
+            return None
+
+        columns: dict[str, list[Any]] = {
+            name: [item[name] for item in raw]
+            for name in fields
+            if name not in {"key", "value"}
+        }
+        for i in range(n_keys):
+            columns[f"key_{i}"] = [item["key"][i] for item in raw]
+        if value_is_list:
+            for i in range(n_values):
+                columns[f"value_{i}"] = [item["value"][i] for item in raw]
+        else:
+            columns["value"] = [item["value"] for item in raw]
+        return columns
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize for JSON output."""
         return {
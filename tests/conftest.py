@@ -27,12 +27,15 @@ settings.register_profile(
     suppress_health_check=[HealthCheck.differing_executors],
 )
 
+# CI runs without a per-example deadline, which only adds flakiness on slow
+# runners.
 settings.register_profile(
     "ci",
     max_examples=200,
     verbosity=Verbosity.normal,
     phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target, Phase.shrink],
     derandomize=True,  # Reproducible in CI
+    deadline=None,
     suppress_health_check=[HealthCheck.differing_executors],
 )
 
@@ -57,6 +60,9 @@ settings.register_profile(
 settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
 
 if TYPE_CHECKING:
+    from click import Command
+    from click.testing import CliRunner
+
     from mixpanel_headless._internal.api_client import MixpanelAPIClient
     from mixpanel_headless._internal.auth.session import Session
     from mixpanel_headless._internal.config import ConfigManager
@@ -335,3 +341,37 @@ def rate_limit_handler() -> Callable[[httpx.Request], httpx.Response]:
         return httpx.Response(429, headers={"Retry-After": "60"})
 
     return handler
+
+
+# =============================================================================
+# CLI Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def cli_command() -> Command:
+    """Compile the ``mp`` Typer app to its Click command tree once per session.
+
+    ``typer.testing.CliRunner.invoke`` re-runs ``get_command(app)`` on every
+    call, rebuilding the full command-group tree (~180ms for ``mp``).
+    Invoking the pre-built Click command skips that per-test cost.
+    """
+    from typer.main import get_command
+
+    from mixpanel_headless.cli.main import app
+
+    return get_command(app)
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """Create one Click CLI runner for invoking ``cli_command``.
+
+    ``CliRunner`` holds no per-invocation state, so a single instance is
+    shared across the session. ``catch_exceptions=False`` lets unexpected
+    exceptions propagate with their original traceback; ``SystemExit``
+    from handled CLI errors is still captured as ``result.exit_code``.
+    """
+    from click.testing import CliRunner
+
+    return CliRunner(catch_exceptions=False)
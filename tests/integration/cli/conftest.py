@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
-from typer.testing import CliRunner
 
+from mixpanel_headless.cli.commands import alerts as alerts_mod
+from mixpanel_headless.cli.commands import annotations as annotations_mod
+from mixpanel_headless.cli.commands import cohorts as cohorts_mod
+from mixpanel_headless.cli.commands import dashboards as dashboards_mod
+from mixpanel_headless.cli.commands import experiments as experiments_mod
+from mixpanel_headless.cli.commands import flags as flags_mod
+from mixpanel_headless.cli.commands import inspect as inspect_mod
+from mixpanel_headless.cli.commands import query as query_mod
+from mixpanel_headless.cli.commands import reports as reports_mod
+from mixpanel_headless.cli.commands import webhooks as webhooks_mod
 from mixpanel_headless.types import (
     AlertCount,
     AlertHistoryPagination,
@@ -38,26 +49,24 @@ from mixpanel_headless.types import (
 )
 
 
-@pytest.fixture
-def cli_runner() -> CliRunner:
-    """Create a CLI runner for testing commands."""
-    return CliRunner()
+@pytest.fixture(scope="session")
+def _workspace_return_values() -> dict[str, Any]:
+    """Build the canned return value of each mocked Workspace method once.
 
-
-@pytest.fixture
-def mock_workspace() -> MagicMock:
-    """Create a mock Workspace for testing commands."""
-    workspace = MagicMock()
+    Returns:
+        Mapping of Workspace method name to the value its mock returns.
+    """
+    returns: dict[str, Any] = {}
 
     # Set up common return values
-    workspace.events.return_value = ["Event1", "Event2", "Event3"]
-    workspace.properties.return_value = ["property1", "property2"]
-    workspace.property_values.return_value = ["value1", "value2", "value3"]
-    workspace.funnels.return_value = []
-    workspace.cohorts.return_value = []
-    workspace.top_events.return_value = []
-
-    workspace.segmentation.return_value = SegmentationResult(
+    returns["events"] = ["Event1", "Event2", "Event3"]
+    returns["properties"] = ["property1", "property2"]
+    returns["property_values"] = ["value1", "value2", "value3"]
+    returns["funnels"] = []
+    returns["cohorts"] = []
+    returns["top_events"] = []
+
+    returns["segmentation"] = SegmentationResult(
         event="Signup",
         from_date="2024-01-01",
         to_date="2024-01-31",
@@ -69,76 +78,74 @@ def mock_workspace() -> MagicMock:
 
     # Phase 024: Dashboard CRUD mocks
     mock_dash = Dashboard(id=1, title="Test Dashboard")
-    workspace.list_dashboards.return_value = [mock_dash]
-    workspace.create_dashboard.return_value = mock_dash
-    workspace.get_dashboard.return_value = mock_dash
-    workspace.update_dashboard.return_value = mock_dash
-    workspace.delete_dashboard.return_value = None
-    workspace.bulk_delete_dashboards.return_value = None
-    workspace.favorite_dashboard.return_value = None
-    workspace.unfavorite_dashboard.return_value = None
-    workspace.pin_dashboard.return_value = None
-    workspace.unpin_dashboard.return_value = None
-    workspace.remove_report_from_dashboard.return_value = mock_dash
-    workspace.add_report_to_dashboard.return_value = mock_dash
-    workspace.list_blueprint_templates.return_value = [
+    returns["list_dashboards"] = [mock_dash]
+    returns["create_dashboard"] = mock_dash
+    returns["get_dashboard"] = mock_dash
+    returns["update_dashboard"] = mock_dash
+    returns["delete_dashboard"] = None
+    returns["bulk_delete_dashboards"] = None
+    returns["favorite_dashboard"] = None
+    returns["unfavorite_dashboard"] = None
+    returns["pin_dashboard"] = None
+    returns["unpin_dashboard"] = None
+    returns["remove_report_from_dashboard"] = mock_dash
+    returns["add_report_to_dashboard"] = mock_dash
+    returns["list_blueprint_templates"] = [
         BlueprintTemplate(title_key="onboarding", description_key="Get started")
     ]
-    workspace.create_blueprint.return_value = mock_dash
-    workspace.get_blueprint_config.return_value = BlueprintConfig(
-        variables={"event": "Signup"}
-    )
-    workspace.update_blueprint_cohorts.return_value = None
-    workspace.finalize_blueprint.return_value = mock_dash
-    workspace.create_rca_dashboard.return_value = mock_dash
-    workspace.get_bookmark_dashboard_ids.return_value = [1, 2]
-    workspace.get_dashboard_erf.return_value = {"metrics": []}
-    workspace.update_report_link.return_value = None
-    workspace.update_text_card.return_value = None
+    returns["create_blueprint"] = mock_dash
+    returns["get_blueprint_config"] = BlueprintConfig(variables={"event": "Signup"})
+    returns["update_blueprint_cohorts"] = None
+    returns["finalize_blueprint"] = mock_dash
+    returns["create_rca_dashboard"] = mock_dash
+    returns["get_bookmark_dashboard_ids"] = [1, 2]
+    returns["get_dashboard_erf"] = {"metrics": []}
+    returns["update_report_link"] = None
+    returns["update_text_card"] = None
 
     # Phase 024: Bookmark/Report CRUD mocks
     mock_bookmark = Bookmark(
         id=1, name="Test Report", bookmark_type="insights", params={}
     )
-    workspace.list_bookmarks_v2.return_value = [mock_bookmark]
-    workspace.create_bookmark.return_value = mock_bookmark
-    workspace.get_bookmark.return_value = mock_bookmark
-    workspace.update_bookmark.return_value = mock_bookmark
-    workspace.delete_bookmark.return_value = None
-    workspace.bulk_delete_bookmarks.return_value = None
-    workspace.bulk_update_bookmarks.return_value = None
-    workspace.bookmark_linked_dashboard_ids.return_value = [10, 20]
-    workspace.get_bookmark_history.return_value = BookmarkHistoryResponse(
+    returns["list_bookmarks_v2"] = [mock_bookmark]
+    returns["create_bookmark"] = mock_bookmark
+    returns["get_bookmark"] = mock_bookmark
+    returns["update_bookmark"] = mock_bookmark
+    returns["delete_bookmark"] = None
+    returns["bulk_delete_bookmarks"] = None
+    returns["bulk_update_bookmarks"] = None
+    returns["bookmark_linked_dashboard_ids"] = [10, 20]
+    returns["get_bookmark_history"] = BookmarkHistoryResponse(
         results=[],
         pagination=BookmarkHistoryPagination(page_size=20),
     )
 
     # Phase 024: Cohort CRUD mocks
     mock_cohort = Cohort(id=1, name="Power Users")
-    workspace.list_cohorts_full.return_value = [mock_cohort]
-    workspace.get_cohort.return_value = mock_cohort
-    workspace.create_cohort.return_value = mock_cohort
-    workspace.update_cohort.return_value = mock_cohort
-    workspace.delete_cohort.return_value = None
-    workspace.bulk_delete_cohorts.return_value = None
-    workspace.bulk_update_cohorts.return_value = None
+    returns["list_cohorts_full"] = [mock_cohort]
+    returns["get_cohort"] = mock_cohort
+    returns["create_cohort"] = mock_cohort
+    returns["update_cohort"] = mock_cohort
+    returns["delete_cohort"] = None
+    returns["bulk_delete_cohorts"] = None
+    returns["bulk_update_cohorts"] = None
 
     # Phase 025: Experiment CRUD mocks
     mock_experiment = Experiment(
         id="xyz-456", name="Test Experiment", status=ExperimentStatus.DRAFT
     )
-    workspace.list_experiments.return_value = [mock_experiment]
-    workspace.create_experiment.return_value = mock_experiment
-    workspace.get_experiment.return_value = mock_experiment
-    workspace.update_experiment.return_value = mock_experiment
-    workspace.delete_experiment.return_value = None
-    workspace.launch_experiment.return_value = mock_experiment
-    workspace.conclude_experiment.return_value = mock_experiment
-    workspace.decide_experiment.return_value = mock_experiment
-    workspace.archive_experiment.return_value = None
-    workspace.restore_experiment.return_value = mock_experiment
-    workspace.duplicate_experiment.return_value = mock_experiment
-    workspace.list_erf_experiments.return_value = [{"id": "xyz-456", "name": "Test"}]
+    returns["list_experiments"] = [mock_experiment]
+    returns["create_experiment"] = mock_experiment
+    returns["get_experiment"] = mock_experiment
+    returns["update_experiment"] = mock_experiment
+    returns["delete_experiment"] = None
+    returns["launch_experiment"] = mock_experiment
+    returns["conclude_experiment"] = mock_experiment
+    returns["decide_experiment"] = mock_experiment
+    returns["archive_experiment"] = None
+    returns["restore_experiment"] = mock_experiment
+    returns["duplicate_experiment"] = mock_experiment
+    returns["list_erf_experiments"] = [{"id": "xyz-456", "name": "Test"}]
 
     # Phase 025: Feature Flag mocks
     mock_flag = FeatureFlag(
@@ -153,17 +160,17 @@ def mock_workspace() -> MagicMock:
         created="2026-01-01T00:00:00Z",
         modified="2026-01-01T00:00:00Z",
     )
-    workspace.list_feature_flags.return_value = [mock_flag]
-    workspace.create_feature_flag.return_value = mock_flag
-    workspace.get_feature_flag.return_value = mock_flag
-    workspace.update_feature_flag.return_value = mock_flag
-    workspace.delete_feature_flag.return_value = None
-    workspace.archive_feature_flag.return_value = None
-    workspace.restore_feature_flag.return_value = mock_flag
-    workspace.duplicate_feature_flag.return_value = mock_flag
-    workspace.set_flag_test_users.return_value = None
-    workspace.get_flag_history.return_value = FlagHistoryResponse(events=[], count=0)
-    workspace.get_flag_limits.return_value = FlagLimitsResponse(
+    returns["list_feature_flags"] = [mock_flag]
+    returns["create_feature_flag"] = mock_flag
+    returns["get_feature_flag"] = mock_flag
+    returns["update_feature_flag"] = mock_flag
+    returns["delete_feature_flag"] = None
+    returns["archive_feature_flag"] = None
+    returns["restore_feature_flag"] = mock_flag
+    returns["duplicate_feature_flag"] = mock_flag
+    returns["set_flag_test_users"] = None
+    returns["get_flag_history"] = FlagHistoryResponse(events=[], count=0)
+    returns["get_flag_limits"] = FlagLimitsResponse(
         limit=100,
         is_trial=False,
         current_usage=5,
@@ -178,15 +185,15 @@ def mock_workspace() -> MagicMock:
         description="Test annotation",
         tags=[],
     )
-    workspace.list_annotations.return_value = [mock_annotation]
-    workspace.create_annotation.return_value = mock_annotation
-    workspace.get_annotation.return_value = mock_annotation
-    workspace.update_annotation.return_value = mock_annotation
-    workspace.delete_annotation.return_value = None
-    workspace.list_annotation_tags.return_value = [
+    returns["list_annotations"] = [mock_annotation]
+    returns["create_annotation"] = mock_annotation
+    returns["get_annotation"] = mock_annotation
+    returns["update_annotation"] = mock_annotation
+    returns["delete_annotation"] = None
+    returns["list_annotation_tags"] = [
         AnnotationTag(id=1, name="releases"),
     ]
-    workspace.create_annotation_tag.return_value = AnnotationTag(id=2, name="new-tag")
+    returns["create_annotation_tag"] = AnnotationTag(id=2, name="new-tag")
 
     # Phase 026: Webhook mocks
     mock_webhook = ProjectWebhook(
@@ -195,17 +202,17 @@ def mock_workspace() -> MagicMock:
         url="https://example.com/webhook",
         is_enabled=True,
     )
-    workspace.list_webhooks.return_value = [mock_webhook]
-    workspace.create_webhook.return_value = WebhookMutationResult(
+    returns["list_webhooks"] = [mock_webhook]
+    returns["create_webhook"] = WebhookMutationResult(
         id="wh-uuid-123",
         name="Test Webhook",
     )
-    workspace.update_webhook.return_value = WebhookMutationResult(
+    returns["update_webhook"] = WebhookMutationResult(
         id="wh-uuid-123",
         name="Updated Webhook",
     )
-    workspace.delete_webhook.return_value = None
-    workspace.test_webhook.return_value = WebhookTestResult(
+    returns["delete_webhook"] = None
+    returns["test_webhook"] = WebhookTestResult(
         success=True,
         status_code=200,
         message="OK",
@@ -223,35 +230,93 @@ def mock_workspace() -> MagicMock:
         modified="2026-01-01T00:00:00Z",
         valid=True,
     )
-    workspace.list_alerts.return_value = [mock_alert]
-    workspace.create_alert.return_value = mock_alert
-    workspace.get_alert.return_value = mock_alert
-    workspace.update_alert.return_value = mock_alert
-    workspace.delete_alert.return_value = None
-    workspace.bulk_delete_alerts.return_value = None
-    workspace.get_alert_count.return_value = AlertCount(
+    returns["list_alerts"] = [mock_alert]
+    returns["create_alert"] = mock_alert
+    returns["get_alert"] = mock_alert
+    returns["update_alert"] = mock_alert
+    returns["delete_alert"] = None
+    returns["bulk_delete_alerts"] = None
+    returns["get_alert_count"] = AlertCount(
         anomaly_alerts_count=5,
         alert_limit=100,
         is_below_limit=True,
     )
-    workspace.get_alert_history.return_value = AlertHistoryResponse(
+    returns["get_alert_history"] = AlertHistoryResponse(
         results=[],
         pagination=AlertHistoryPagination(page_size=20),
     )
-    workspace.test_alert.return_value = {"status": "sent"}
-    workspace.get_alert_screenshot_url.return_value = AlertScreenshotResponse(
+    returns["test_alert"] = {"status": "sent"}
+    returns["get_alert_screenshot_url"] = AlertScreenshotResponse(
         signed_url="https://storage.googleapis.com/screenshot.png",
     )
-    workspace.validate_alerts_for_bookmark.return_value = (
-        ValidateAlertsForBookmarkResponse(
-            alert_validations=[],
-            invalid_count=0,
-        )
+    returns["validate_alerts_for_bookmark"] = ValidateAlertsForBookmarkResponse(
+        alert_validations=[],
+        invalid_count=0,
+    )
+
+    return returns
+
+
+def _configure_workspace(workspace: MagicMock, return_values: dict[str, Any]) -> None:
+    """Apply ``return_values`` to the matching methods of ``workspace``.
+
+    Args:
+        workspace: Mock Workspace to configure.
+        return_values: Mapping of method name to return value.
+    """
+    workspace.configure_mock(
+        **{f"{name}.return_value": value for name, value in return_values.items()}
     )
 
+
+@pytest.fixture(scope="session")
+def mock_workspace(_workspace_return_values: dict[str, Any]) -> MagicMock:
+    """Create one mock Workspace shared by every CLI integration test.
+
+    Building the mock and its ~100 configured children costs ~15ms, so it
+    is created once per session; ``_reset_mock_workspace`` restores the
+    canned return values and clears call history after each test.
+    """
+    workspace = MagicMock()
+    _configure_workspace(workspace, _workspace_return_values)
     return workspace
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_workspace(
+    mock_workspace: MagicMock, _workspace_return_values: dict[str, Any]
+) -> Generator[None, None, None]:
+    """Undo per-test overrides and call records on the shared mock Workspace."""
+    yield
+    mock_workspace.reset_mock(return_value=True, side_effect=True)
+    _configure_workspace(mock_workspace, _workspace_return_values)
+
+
+# Command modules whose ``get_workspace`` the integration tests route to the
+# shared mock Workspace
+_WORKSPACE_COMMAND_MODULES = (
+    alerts_mod,
+    annotations_mod,
+    cohorts_mod,
+    dashboards_mod,
+    experiments_mod,
+    flags_mod,
+    inspect_mod,
+    query_mod,
+    reports_mod,
+    webhooks_mod,
+)
+
+
+@pytest.fixture(autouse=True)
+def _patch_get_workspace(
+    monkeypatch: pytest.MonkeyPatch, mock_workspace: MagicMock
+) -> None:
+    """Route every command module's ``get_workspace`` to ``mock_workspace``."""
+    for module in _WORKSPACE_COMMAND_MODULES:
+        monkeypatch.setattr(module, "get_workspace", lambda _ctx: mock_workspace)
+
+
 # mock_config_manager / patch_config_manager fixtures removed in B1 (Fix 9):
 # the legacy ``mp auth`` CLI commands they targeted (and the AccountInfo
 # dataclass they returned) are gone. Use the v3 ``mp account`` /
@@ -5,12 +5,12 @@ Phase 015: Bookmarks API - Tests for inspect bookmarks, query saved-report, quer
 
 from __future__ import annotations
 
-import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
-from typer.testing import CliRunner
+import orjson
+from click import Command
+from click.testing import CliRunner
 
-from mixpanel_headless.cli.main import app
 from mixpanel_headless.types import BookmarkInfo, FlowsResult, SavedReportResult
 
 
@@ -18,7 +18,7 @@ class TestInspectBookmarks:
     """Tests for mp inspect bookmarks command."""
 
     def test_bookmarks_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing bookmarks in JSON format."""
         mock_workspace.list_bookmarks.return_value = [
@@ -40,23 +40,19 @@ class TestInspectBookmarks:
             ),
         ]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["inspect", "bookmarks", "--format", "json"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["inspect", "bookmarks", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert len(data) == 2
         assert data[0]["id"] == 12345
         assert data[0]["name"] == "Weekly Users"
         assert data[1]["type"] == "funnels"
 
     def test_bookmarks_with_type_filter(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing bookmarks with type filter."""
         mock_workspace.list_bookmarks.return_value = [
@@ -70,19 +66,16 @@ class TestInspectBookmarks:
             ),
         ]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["inspect", "bookmarks", "--type", "insights", "--format", "json"]
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            ["inspect", "bookmarks", "--type", "insights", "--format", "json"],
+        )
 
         assert result.exit_code == 0
         mock_workspace.list_bookmarks.assert_called_once_with(bookmark_type="insights")
 
     def test_bookmarks_plain_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing bookmarks in plain format."""
         mock_workspace.list_bookmarks.return_value = [
@@ -96,33 +89,25 @@ class TestInspectBookmarks:
             ),
         ]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["inspect", "bookmarks", "--format", "plain"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["inspect", "bookmarks", "--format", "plain"]
+        )
 
         assert result.exit_code == 0
         assert "Weekly Users" in result.stdout
 
     def test_bookmarks_empty_result(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing bookmarks with no results."""
         mock_workspace.list_bookmarks.return_value = []
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["inspect", "bookmarks", "--format", "json"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["inspect", "bookmarks", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data == []
 
 
@@ -130,7 +115,7 @@ class TestQuerySavedReport:
     """Tests for mp query saved-report command."""
 
     def test_saved_report_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test querying saved report in JSON format."""
         mock_workspace.query_saved_report.return_value = SavedReportResult(
@@ -142,22 +127,18 @@ class TestQuerySavedReport:
             series={"Page View": {"2024-01-01": 100}},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["query", "saved-report", "12345", "--format", "json"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["query", "saved-report", "12345", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["bookmark_id"] == 12345
         assert data["report_type"] == "insights"
         mock_workspace.query_saved_report.assert_called_once_with(bookmark_id=12345)
 
     def test_saved_report_retention_type(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test querying retention saved report."""
         mock_workspace.query_saved_report.return_value = SavedReportResult(
@@ -169,20 +150,16 @@ class TestQuerySavedReport:
             series={},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["query", "saved-report", "12346", "--format", "json"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["query", "saved-report", "12346", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["report_type"] == "retention"
 
     def test_saved_report_funnel_type(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test querying funnel saved report."""
         mock_workspace.query_saved_report.return_value = SavedReportResult(
@@ -194,16 +171,12 @@ class TestQuerySavedReport:
             series={},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["query", "saved-report", "12347", "--format", "json"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["query", "saved-report", "12347", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["report_type"] == "funnel"
 
 
@@ -211,7 +184,7 @@ class TestQueryFlows:
     """Tests for mp query flows command."""
 
     def test_flows_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test querying flows report in JSON format."""
         mock_workspace.query_saved_flows.return_value = FlowsResult(
@@ -225,23 +198,19 @@ class TestQueryFlows:
             overall_conversion_rate=0.5,
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["query", "flows", "12345", "--format", "json"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["query", "flows", "12345", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["bookmark_id"] == 12345
         assert len(data["steps"]) == 2
         assert data["overall_conversion_rate"] == 0.5
         mock_workspace.query_saved_flows.assert_called_once_with(bookmark_id=12345)
 
     def test_flows_with_metadata(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test querying flows report with metadata."""
         mock_workspace.query_saved_flows.return_value = FlowsResult(
@@ -253,20 +222,16 @@ class TestQueryFlows:
             metadata={"version": "2.0"},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["query", "flows", "12345", "--format", "json"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["query", "flows", "12345", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["metadata"] == {"version": "2.0"}
 
     def test_flows_plain_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test querying flows report in plain format."""
         mock_workspace.query_saved_flows.return_value = FlowsResult(
@@ -277,13 +242,9 @@ class TestQueryFlows:
             overall_conversion_rate=0.5,
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["query", "flows", "12345", "--format", "plain"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["query", "flows", "12345", "--format", "plain"]
+        )
 
         assert result.exit_code == 0
         assert "Page View" in result.stdout or "12345" in result.stdout
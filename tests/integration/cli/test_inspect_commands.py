@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
-from typer.testing import CliRunner
+import orjson
+from click import Command
+from click.testing import CliRunner
 
-from mixpanel_headless.cli.main import app
 from mixpanel_headless.types import (
     DailyCount,
     DailyCountsResult,
@@ -31,32 +31,28 @@ class TestInspectEvents:
     """Tests for mp inspect events command."""
 
     def test_events_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing events in JSON format."""
         mock_workspace.events.return_value = ["Event A", "Event B", "Event C"]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(app, ["inspect", "events", "--format", "json"])
+        result = cli_runner.invoke(
+            cli_command, ["inspect", "events", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data == ["Event A", "Event B", "Event C"]
 
     def test_events_plain_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing events in plain format."""
         mock_workspace.events.return_value = ["Event A", "Event B"]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(app, ["inspect", "events", "--format", "plain"])
+        result = cli_runner.invoke(
+            cli_command, ["inspect", "events", "--format", "plain"]
+        )
 
         assert result.exit_code == 0
         assert "Event A" in result.stdout
@@ -67,21 +63,18 @@ class TestInspectProperties:
     """Tests for mp inspect properties command."""
 
     def test_properties_for_event(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing properties for an event."""
         mock_workspace.properties.return_value = ["prop1", "prop2", "prop3"]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["inspect", "properties", "--event", "Sign Up", "--format", "json"]
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            ["inspect", "properties", "--event", "Sign Up", "--format", "json"],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data == ["prop1", "prop2", "prop3"]
         mock_workspace.properties.assert_called_once_with("Sign Up")
 
@@ -90,52 +83,44 @@ class TestInspectValues:
     """Tests for mp inspect values command."""
 
     def test_values_with_all_options(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing values with event and limit options."""
         mock_workspace.property_values.return_value = ["value1", "value2"]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "inspect",
-                    "values",
-                    "--property",
-                    "country",
-                    "--event",
-                    "Purchase",
-                    "--limit",
-                    "50",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "inspect",
+                "values",
+                "--property",
+                "country",
+                "--event",
+                "Purchase",
+                "--limit",
+                "50",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data == ["value1", "value2"]
         mock_workspace.property_values.assert_called_once_with(
             property_name="country", event="Purchase", limit=50
         )
 
     def test_values_without_event(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing values without event filter."""
         mock_workspace.property_values.return_value = ["US", "EU", "APAC"]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                ["inspect", "values", "--property", "region", "--format", "json"],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            ["inspect", "values", "--property", "region", "--format", "json"],
+        )
 
         assert result.exit_code == 0
         mock_workspace.property_values.assert_called_once_with(
@@ -147,7 +132,7 @@ class TestInspectFunnels:
     """Tests for mp inspect funnels command."""
 
     def test_funnels_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing funnels in JSON format."""
         mock_workspace.funnels.return_value = [
@@ -155,14 +140,12 @@ class TestInspectFunnels:
             FunnelInfo(funnel_id=456, name="Signup Flow"),
         ]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(app, ["inspect", "funnels", "--format", "json"])
+        result = cli_runner.invoke(
+            cli_command, ["inspect", "funnels", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert len(data) == 2
         assert data[0]["funnel_id"] == 123
         assert data[0]["name"] == "Checkout Funnel"
@@ -172,7 +155,7 @@ class TestInspectCohorts:
     """Tests for mp inspect cohorts command."""
 
     def test_cohorts_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing cohorts in JSON format."""
         mock_workspace.cohorts.return_value = [
@@ -194,14 +177,12 @@ class TestInspectCohorts:
             ),
         ]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(app, ["inspect", "cohorts", "--format", "json"])
+        result = cli_runner.invoke(
+            cli_command, ["inspect", "cohorts", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert len(data) == 2
         assert data[0]["id"] == 1
         assert data[0]["name"] == "Power Users"
@@ -212,7 +193,7 @@ class TestInspectTopEvents:
     """Tests for mp inspect top-events command."""
 
     def test_top_events_default_options(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing top events with default options."""
         mock_workspace.top_events.return_value = [
@@ -220,44 +201,36 @@ class TestInspectTopEvents:
             TopEvent(event="Sign Up", count=500, percent_change=-2.1),
         ]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["inspect", "top-events", "--format", "json"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["inspect", "top-events", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert len(data) == 2
         assert data[0]["event"] == "Page View"
         assert data[0]["count"] == 10000
         mock_workspace.top_events.assert_called_once_with(type="general", limit=10)
 
     def test_top_events_with_type_and_limit(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing top events with custom type and limit."""
         mock_workspace.top_events.return_value = []
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "inspect",
-                    "top-events",
-                    "--type",
-                    "unique",
-                    "--limit",
-                    "5",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "inspect",
+                "top-events",
+                "--type",
+                "unique",
+                "--limit",
+                "5",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
         mock_workspace.top_events.assert_called_once_with(type="unique", limit=5)
@@ -267,7 +240,7 @@ class TestInspectLexiconSchemas:
     """Tests for mp inspect lexicon-schemas command."""
 
     def test_lexicon_schemas_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test listing Lexicon schemas in JSON format."""
         mock_workspace.lexicon_schemas.return_value = [
@@ -295,16 +268,12 @@ class TestInspectLexiconSchemas:
             ),
         ]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["inspect", "lexicon-schemas", "--format", "json"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["inspect", "lexicon-schemas", "--format", "json"]
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert len(data) == 2
         assert data[0]["entity_type"] == "event"
         assert data[0]["name"] == "Purchase"
@@ -312,7 +281,7 @@ class TestInspectLexiconSchemas:
         assert data[1]["entity_type"] == "profile"
 
     def test_lexicon_schemas_with_type_filter(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test filtering Lexicon schemas by entity type."""
         mock_workspace.lexicon_schemas.return_value = [
@@ -327,29 +296,21 @@ class TestInspectLexiconSchemas:
             ),
         ]
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                ["inspect", "lexicon-schemas", "--type", "event", "--format", "json"],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            ["inspect", "lexicon-schemas", "--type", "event", "--format", "json"],
+        )
 
         assert result.exit_code == 0
         mock_workspace.lexicon_schemas.assert_called_once_with(entity_type="event")
 
     def test_lexicon_schemas_invalid_type(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test invalid entity type returns error."""
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app, ["inspect", "lexicon-schemas", "--type", "invalid"]
-            )
+        result = cli_runner.invoke(
+            cli_command, ["inspect", "lexicon-schemas", "--type", "invalid"]
+        )
 
         assert result.exit_code == 3  # INVALID_ARGS
 
@@ -358,7 +319,7 @@ class TestInspectLexiconSchema:
     """Tests for mp inspect lexicon-schema command."""
 
     def test_lexicon_schema_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test getting single Lexicon schema in JSON format."""
         mock_workspace.lexicon_schema.return_value = LexiconSchema(
@@ -378,26 +339,22 @@ class TestInspectLexiconSchema:
             ),
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "inspect",
-                    "lexicon-schema",
-                    "--type",
-                    "event",
-                    "--name",
-                    "Purchase",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "inspect",
+                "lexicon-schema",
+                "--type",
+                "event",
+                "--name",
+                "Purchase",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["entity_type"] == "event"
         assert data["name"] == "Purchase"
         assert "amount" in data["schema_json"]["properties"]
@@ -405,24 +362,20 @@ class TestInspectLexiconSchema:
         mock_workspace.lexicon_schema.assert_called_once_with("event", "Purchase")
 
     def test_lexicon_schema_invalid_type(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test invalid entity type returns error."""
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "inspect",
-                    "lexicon-schema",
-                    "--type",
-                    "invalid",
-                    "--name",
-                    "Test",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "inspect",
+                "lexicon-schema",
+                "--type",
+                "invalid",
+                "--name",
+                "Test",
+            ],
+        )
 
         assert result.exit_code == 3  # INVALID_ARGS
 
@@ -436,7 +389,7 @@ class TestInspectDistribution:
     """Tests for mp inspect distribution command."""
 
     def test_distribution_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test property distribution in JSON format."""
         mock_workspace.property_distribution.return_value = PropertyDistributionResult(
@@ -452,30 +405,26 @@ class TestInspectDistribution:
             ),
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "inspect",
-                    "distribution",
-                    "--event",
-                    "Purchase",
-                    "--property",
-                    "country",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "inspect",
+                "distribution",
+                "--event",
+                "Purchase",
+                "--property",
+                "country",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["event"] == "Purchase"
         assert data["property_name"] == "country"
         assert data["total_count"] == 1000
@@ -494,7 +443,7 @@ class TestInspectNumeric:
     """Tests for mp inspect numeric command."""
 
     def test_numeric_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test numeric property summary in JSON format."""
         mock_workspace.numeric_summary.return_value = NumericPropertySummaryResult(
@@ -511,30 +460,26 @@ class TestInspectNumeric:
             percentiles={25: 12.99, 50: 19.99, 75: 49.99, 90: 99.99},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "inspect",
-                    "numeric",
-                    "--event",
-                    "Purchase",
-                    "--property",
-                    "amount",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "inspect",
+                "numeric",
+                "--event",
+                "Purchase",
+                "--property",
+                "amount",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["event"] == "Purchase"
         assert data["property_name"] == "amount"
         assert data["count"] == 5000
@@ -554,7 +499,7 @@ class TestInspectDaily:
     """Tests for mp inspect daily command."""
 
     def test_daily_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test daily counts in JSON format."""
         mock_workspace.daily_counts.return_value = DailyCountsResult(
@@ -569,26 +514,22 @@ class TestInspectDaily:
             ),
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "inspect",
-                    "daily",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-07",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "inspect",
+                "daily",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-07",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["from_date"] == "2024-01-01"
         assert data["to_date"] == "2024-01-07"
         assert len(data["counts"]) == 4
@@ -604,7 +545,7 @@ class TestInspectEngagement:
     """Tests for mp inspect engagement command."""
 
     def test_engagement_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test engagement distribution in JSON format."""
         mock_workspace.engagement_distribution.return_value = (
@@ -639,26 +580,22 @@ class TestInspectEngagement:
             )
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "inspect",
-                    "engagement",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "inspect",
+                "engagement",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["from_date"] == "2024-01-01"
         assert data["to_date"] == "2024-01-31"
         assert data["total_users"] == 8500
@@ -676,7 +613,7 @@ class TestInspectCoverage:
     """Tests for mp inspect coverage command."""
 
     def test_coverage_json_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test property coverage in JSON format."""
         mock_workspace.property_coverage.return_value = PropertyCoverageResult(
@@ -700,30 +637,26 @@ class TestInspectCoverage:
             ),
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.inspect.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "inspect",
-                    "coverage",
-                    "--event",
-                    "Purchase",
-                    "--properties",
-                    "amount,coupon_code",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "inspect",
+                "coverage",
+                "--event",
+                "Purchase",
+                "--properties",
+                "amount,coupon_code",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["event"] == "Purchase"
         assert data["total_events"] == 5000
         assert len(data["coverage"]) == 2
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
-from typer.testing import CliRunner
+import orjson
+from click import Command
+from click.testing import CliRunner
 
-from mixpanel_headless.cli.main import app
 from mixpanel_headless.types import (
     ActivityFeedResult,
     CohortInfo,
@@ -34,7 +34,7 @@ class TestQuerySegmentation:
     """Tests for mp query segmentation command."""
 
     def test_segmentation_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test segmentation query with required options."""
         mock_workspace.segmentation.return_value = SegmentationResult(
@@ -47,33 +47,29 @@ class TestQuerySegmentation:
             series={"$overall": {"2024-01-01": 100}},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "segmentation",
-                    "--event",
-                    "Signup",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "segmentation",
+                "--event",
+                "Signup",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["event"] == "Signup"
         assert data["total"] == 500
 
     def test_segmentation_with_segment_property(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test segmentation with --on option."""
         mock_workspace.segmentation.return_value = SegmentationResult(
@@ -86,34 +82,30 @@ class TestQuerySegmentation:
             series={"US": {"2024-01-01": 50}, "EU": {"2024-01-01": 30}},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "segmentation",
-                    "--event",
-                    "Signup",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--on",
-                    "country",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "segmentation",
+                "--event",
+                "Signup",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--on",
+                "country",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
         call_kwargs = mock_workspace.segmentation.call_args.kwargs
         assert call_kwargs["on"] == "country"
 
     def test_segmentation_table_format_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data with date/segment/count columns."""
         mock_workspace.segmentation.return_value = SegmentationResult(
@@ -129,27 +121,23 @@ class TestQuerySegmentation:
             },
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "segmentation",
-                    "--event",
-                    "Purchase",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-02",
-                    "--on",
-                    "country",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "segmentation",
+                "--event",
+                "Purchase",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-02",
+                "--on",
+                "country",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain column headers for normalized data
@@ -160,7 +148,7 @@ class TestQuerySegmentation:
         assert "series" not in result.stdout.lower()
 
     def test_segmentation_json_format_unchanged(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """JSON format should still use nested series structure."""
         mock_workspace.segmentation.return_value = SegmentationResult(
@@ -176,30 +164,26 @@ class TestQuerySegmentation:
             },
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "segmentation",
-                    "--event",
-                    "Purchase",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-02",
-                    "--on",
-                    "country",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "segmentation",
+                "--event",
+                "Purchase",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-02",
+                "--on",
+                "country",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         # JSON format should have nested series structure
         assert "series" in data
         assert isinstance(data["series"], dict)
@@ -207,7 +191,7 @@ class TestQuerySegmentation:
         assert "2024-01-01" in data["series"]["US"]
 
     def test_segmentation_table_without_segments(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should work without segmentation (unsegmented query)."""
         mock_workspace.segmentation.return_value = SegmentationResult(
@@ -222,25 +206,21 @@ class TestQuerySegmentation:
             },
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "segmentation",
-                    "--event",
-                    "Purchase",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-02",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "segmentation",
+                "--event",
+                "Purchase",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-02",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Should still have normalized columns
@@ -253,7 +233,7 @@ class TestQueryFunnel:
     """Tests for mp query funnel command."""
 
     def test_funnel_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test funnel query with required options."""
         mock_workspace.funnel.return_value = FunnelResult(
@@ -276,32 +256,28 @@ class TestQueryFunnel:
             ],
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "funnel",
-                    "123",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "funnel",
+                "123",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["funnel_id"] == 123
         assert len(data["steps"]) == 2
 
     def test_funnel_table_format_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data with step/event/count/conversion_rate columns."""
         mock_workspace.funnel.return_value = FunnelResult(
@@ -316,24 +292,20 @@ class TestQueryFunnel:
             ],
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "funnel",
-                    "123",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "funnel",
+                "123",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain column headers for normalized data
@@ -349,7 +321,7 @@ class TestQueryRetention:
     """Tests for mp query retention command."""
 
     def test_retention_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test retention query with required options."""
         mock_workspace.retention.return_value = RetentionResult(
@@ -361,35 +333,31 @@ class TestQueryRetention:
             cohorts=[],
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "retention",
-                    "--born",
-                    "Signup",
-                    "--return",
-                    "Login",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "retention",
+                "--born",
+                "Signup",
+                "--return",
+                "Login",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["born_event"] == "Signup"
         assert data["return_event"] == "Login"
 
     def test_retention_table_format_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data with cohort_date/cohort_size/period_N columns."""
         mock_workspace.retention.return_value = RetentionResult(
@@ -404,27 +372,23 @@ class TestQueryRetention:
             ],
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "retention",
-                    "--born",
-                    "Signup",
-                    "--return",
-                    "Login",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "retention",
+                "--born",
+                "Signup",
+                "--return",
+                "Login",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain column headers for normalized data
@@ -441,31 +405,31 @@ class TestQueryJql:
     """Tests for mp query jql command."""
 
     def test_jql_with_inline_script(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test JQL with inline script."""
         mock_workspace.jql.return_value = JQLResult(_raw=[])
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "jql",
-                    "--script",
-                    "function main() { return []; }",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "jql",
+                "--script",
+                "function main() { return []; }",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
 
     def test_jql_with_file(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock, tmp_path: Path
+        self,
+        cli_runner: CliRunner,
+        cli_command: Command,
+        mock_workspace: MagicMock,
+        tmp_path: Path,
     ) -> None:
         """Test JQL with script file."""
 
@@ -474,65 +438,63 @@ class TestQueryJql:
 
         mock_workspace.jql.return_value = JQLResult(_raw=[{"event": "Test"}])
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                ["query", "jql", str(jql_file), "--format", "json"],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            ["query", "jql", str(jql_file), "--format", "json"],
+        )
 
         assert result.exit_code == 0
 
-    def test_jql_file_not_found(self, cli_runner: CliRunner) -> None:
+    def test_jql_file_not_found(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Test error when JQL file doesn't exist."""
         result = cli_runner.invoke(
-            app,
+            cli_command,
             ["query", "jql", "/nonexistent/query.js", "--format", "json"],
         )
 
         assert result.exit_code == 4  # NOT_FOUND
 
-    def test_jql_no_script_or_file(self, cli_runner: CliRunner) -> None:
+    def test_jql_no_script_or_file(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Test error when neither script nor file provided."""
-        result = cli_runner.invoke(app, ["query", "jql", "--format", "json"])
+        result = cli_runner.invoke(cli_command, ["query", "jql", "--format", "json"])
 
         assert result.exit_code == 3
-        assert "Provide a file or use --script" in result.output
+        assert b"Provide a file or use --script" in result.stderr_bytes
 
     def test_jql_with_params(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test JQL with parameters."""
         mock_workspace.jql.return_value = JQLResult(_raw=["Signup"])
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "jql",
-                    "--script",
-                    "function main() { return params.event; }",
-                    "--param",
-                    "event=Signup",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "jql",
+                "--script",
+                "function main() { return params.event; }",
+                "--param",
+                "event=Signup",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
         call_kwargs = mock_workspace.jql.call_args.kwargs
         assert call_kwargs["params"] == {"event": "Signup"}
 
-    def test_jql_invalid_param_format(self, cli_runner: CliRunner) -> None:
+    def test_jql_invalid_param_format(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Test error with invalid parameter format."""
         result = cli_runner.invoke(
-            app,
+            cli_command,
             [
                 "query",
                 "jql",
@@ -546,10 +508,10 @@ class TestQueryJql:
         )
 
         assert result.exit_code == 3
-        assert "Invalid parameter format" in result.output
+        assert b"Invalid parameter format" in result.stderr_bytes
 
     def test_jql_table_format_groupby_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data for groupBy results."""
         # Simulate groupBy result: Events.groupBy(['country'], reducer.count())
@@ -561,21 +523,17 @@ class TestQueryJql:
             ]
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "jql",
-                    "--script",
-                    "function main() { return []; }",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "jql",
+                "--script",
+                "function main() { return []; }",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain normalized columns from groupBy expansion
@@ -585,7 +543,7 @@ class TestQueryJql:
         assert '"key"' not in result.stdout.lower()
 
     def test_jql_table_format_simple_dicts(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should handle simple list of dicts."""
         # Simulate simple dict result from .map()
@@ -596,21 +554,17 @@ class TestQueryJql:
             ]
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "jql",
-                    "--script",
-                    "function main() { return []; }",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "jql",
+                "--script",
+                "function main() { return []; }",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain columns from dict keys
@@ -618,31 +572,27 @@ class TestQueryJql:
         assert "COUNT" in result.stdout
 
     def test_jql_json_format_unchanged(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """JSON format should still use nested raw structure."""
         mock_workspace.jql.return_value = JQLResult(
             _raw=[{"key": ["US"], "value": 1000}]
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "jql",
-                    "--script",
-                    "function main() { return []; }",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "jql",
+                "--script",
+                "function main() { return []; }",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         # JSON format should preserve raw structure
         assert "raw" in data
         assert data["raw"] == [{"key": ["US"], "value": 1000}]
@@ -652,7 +602,7 @@ class TestQueryEventCounts:
     """Tests for mp query event-counts command."""
 
     def test_event_counts_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test event-counts with required options."""
         mock_workspace.event_counts.return_value = EventCountsResult(
@@ -664,32 +614,28 @@ class TestQueryEventCounts:
             series={"Signup": {"2024-01-01": 100}, "Login": {"2024-01-01": 200}},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "event-counts",
-                    "--events",
-                    "Signup,Login",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "event-counts",
+                "--events",
+                "Signup,Login",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["events"] == ["Signup", "Login"]
 
     def test_event_counts_table_format_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data with date/event/count columns."""
         mock_workspace.event_counts.return_value = EventCountsResult(
@@ -704,25 +650,21 @@ class TestQueryEventCounts:
             },
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "event-counts",
-                    "--events",
-                    "Login,Purchase",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-02",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "event-counts",
+                "--events",
+                "Login,Purchase",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-02",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain column headers for normalized data
@@ -737,7 +679,7 @@ class TestQueryPropertyCounts:
     """Tests for mp query property-counts command."""
 
     def test_property_counts_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test property-counts with required options."""
         mock_workspace.property_counts.return_value = PropertyCountsResult(
@@ -750,35 +692,31 @@ class TestQueryPropertyCounts:
             series={"US": {"2024-01-01": 50}},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "property-counts",
-                    "--event",
-                    "Signup",
-                    "--property",
-                    "country",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "property-counts",
+                "--event",
+                "Signup",
+                "--property",
+                "country",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["event"] == "Signup"
         assert data["property_name"] == "country"
 
     def test_property_counts_table_format_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data with date/value/count columns."""
         mock_workspace.property_counts.return_value = PropertyCountsResult(
@@ -794,27 +732,23 @@ class TestQueryPropertyCounts:
             },
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "property-counts",
-                    "--event",
-                    "Purchase",
-                    "--property",
-                    "country",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-02",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "property-counts",
+                "--event",
+                "Purchase",
+                "--property",
+                "country",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-02",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain column headers for normalized data
@@ -829,7 +763,7 @@ class TestQueryActivityFeed:
     """Tests for mp query activity-feed command."""
 
     def test_activity_feed_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test activity-feed with required options."""
         mock_workspace.activity_feed.return_value = ActivityFeedResult(
@@ -843,28 +777,24 @@ class TestQueryActivityFeed:
             ],
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "activity-feed",
-                    "--users",
-                    "user1,user2",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "activity-feed",
+                "--users",
+                "user1,user2",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["distinct_ids"] == ["user1", "user2"]
 
     def test_activity_feed_table_format_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data with event/time/distinct_id columns."""
         mock_workspace.activity_feed.return_value = ActivityFeedResult(
@@ -885,25 +815,21 @@ class TestQueryActivityFeed:
             ],
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "activity-feed",
-                    "--users",
-                    "user1",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-02",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "activity-feed",
+                "--users",
+                "user1",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-02",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain column headers for normalized data
@@ -918,7 +844,7 @@ class TestQuerySavedReport:
     """Tests for mp query saved-report command."""
 
     def test_saved_report_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test saved-report with bookmark ID."""
         mock_workspace.query_saved_report.return_value = SavedReportResult(
@@ -930,17 +856,13 @@ class TestQuerySavedReport:
             series={"Signup": {"2024-01-01": 100}},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                ["query", "saved-report", "12345", "--format", "json"],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            ["query", "saved-report", "12345", "--format", "json"],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["bookmark_id"] == 12345
 
 
@@ -948,7 +870,7 @@ class TestQueryFrequency:
     """Tests for mp query frequency command."""
 
     def test_frequency_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test frequency with required options."""
         mock_workspace.frequency.return_value = FrequencyResult(
@@ -960,30 +882,26 @@ class TestQueryFrequency:
             data={"2024-01-01": [100, 50, 20]},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "frequency",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "frequency",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert "data" in data
 
     def test_frequency_table_format_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data with date/period_N columns."""
         mock_workspace.frequency.return_value = FrequencyResult(
@@ -998,25 +916,21 @@ class TestQueryFrequency:
             },
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "frequency",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-02",
-                    "--event",
-                    "Login",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "frequency",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-02",
+                "--event",
+                "Login",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain column headers for normalized data
@@ -1032,7 +946,7 @@ class TestQuerySegmentationNumeric:
     """Tests for mp query segmentation-numeric command."""
 
     def test_segmentation_numeric_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test segmentation-numeric with required options."""
         mock_workspace.segmentation_numeric.return_value = NumericBucketResult(
@@ -1044,35 +958,31 @@ class TestQuerySegmentationNumeric:
             series={"0-10": {"2024-01-01": 20}, "10-50": {"2024-01-01": 50}},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "segmentation-numeric",
-                    "--event",
-                    "Purchase",
-                    "--on",
-                    "price",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "segmentation-numeric",
+                "--event",
+                "Purchase",
+                "--on",
+                "price",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["event"] == "Purchase"
         assert data["property_expr"] == "price"
 
     def test_segmentation_numeric_table_format_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data with date/bucket/count columns."""
         mock_workspace.segmentation_numeric.return_value = NumericBucketResult(
@@ -1087,27 +997,23 @@ class TestQuerySegmentationNumeric:
             },
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "segmentation-numeric",
-                    "--event",
-                    "Purchase",
-                    "--on",
-                    "price",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-02",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "segmentation-numeric",
+                "--event",
+                "Purchase",
+                "--on",
+                "price",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-02",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain column headers for normalized data
@@ -1122,7 +1028,7 @@ class TestQuerySegmentationSum:
     """Tests for mp query segmentation-sum command."""
 
     def test_segmentation_sum_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test segmentation-sum with required options."""
         mock_workspace.segmentation_sum.return_value = NumericSumResult(
@@ -1134,35 +1040,31 @@ class TestQuerySegmentationSum:
             results={"2024-01-01": 500.25, "2024-01-02": 600.50},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "segmentation-sum",
-                    "--event",
-                    "Purchase",
-                    "--on",
-                    "revenue",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "segmentation-sum",
+                "--event",
+                "Purchase",
+                "--on",
+                "revenue",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["event"] == "Purchase"
         assert data["property_expr"] == "revenue"
 
     def test_segmentation_sum_table_format_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data with date/sum columns."""
         mock_workspace.segmentation_sum.return_value = NumericSumResult(
@@ -1174,27 +1076,23 @@ class TestQuerySegmentationSum:
             results={"2024-01-01": 500.25, "2024-01-02": 600.50},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "segmentation-sum",
-                    "--event",
-                    "Purchase",
-                    "--on",
-                    "revenue",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "segmentation-sum",
+                "--event",
+                "Purchase",
+                "--on",
+                "revenue",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain column headers for normalized data
@@ -1208,7 +1106,7 @@ class TestQuerySegmentationAverage:
     """Tests for mp query segmentation-average command."""
 
     def test_segmentation_average_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test segmentation-average with required options."""
         mock_workspace.segmentation_average.return_value = NumericAverageResult(
@@ -1220,35 +1118,31 @@ class TestQuerySegmentationAverage:
             results={"2024-01-01": 45.50, "2024-01-02": 52.25},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "segmentation-average",
-                    "--event",
-                    "Purchase",
-                    "--on",
-                    "price",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "json",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "segmentation-average",
+                "--event",
+                "Purchase",
+                "--on",
+                "price",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "json",
+            ],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["event"] == "Purchase"
         assert data["property_expr"] == "price"
 
     def test_segmentation_average_table_format_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data with date/average columns."""
         mock_workspace.segmentation_average.return_value = NumericAverageResult(
@@ -1260,27 +1154,23 @@ class TestQuerySegmentationAverage:
             results={"2024-01-01": 45.50, "2024-01-02": 52.25},
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                [
-                    "query",
-                    "segmentation-average",
-                    "--event",
-                    "Purchase",
-                    "--on",
-                    "price",
-                    "--from",
-                    "2024-01-01",
-                    "--to",
-                    "2024-01-31",
-                    "--format",
-                    "table",
-                ],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            [
+                "query",
+                "segmentation-average",
+                "--event",
+                "Purchase",
+                "--on",
+                "price",
+                "--from",
+                "2024-01-01",
+                "--to",
+                "2024-01-31",
+                "--format",
+                "table",
+            ],
+        )
 
         assert result.exit_code == 0
         # Table output should contain column headers for normalized data
@@ -1294,7 +1184,7 @@ class TestQueryFlows:
     """Tests for mp query flows command."""
 
     def test_flows_happy_path(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Test flows query with bookmark ID."""
         mock_workspace.query_saved_flows.return_value = FlowsResult(
@@ -1305,21 +1195,17 @@ class TestQueryFlows:
             overall_conversion_rate=0.5,
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                ["query", "flows", "12345", "--format", "json"],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            ["query", "flows", "12345", "--format", "json"],
+        )
 
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = orjson.loads(result.stdout_bytes)
         assert data["bookmark_id"] == 12345
 
     def test_flows_table_format_normalized(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, cli_command: Command, mock_workspace: MagicMock
     ) -> None:
         """Table format should use normalized data from steps."""
         mock_workspace.query_saved_flows.return_value = FlowsResult(
@@ -1333,14 +1219,10 @@ class TestQueryFlows:
             overall_conversion_rate=0.5,
         )
 
-        with patch(
-            "mixpanel_headless.cli.commands.query.get_workspace",
-            return_value=mock_workspace,
-        ):
-            result = cli_runner.invoke(
-                app,
-                ["query", "flows", "12345", "--format", "table"],
-            )
+        result = cli_runner.invoke(
+            cli_command,
+            ["query", "flows", "12345", "--format", "table"],
+        )
 
         assert result.exit_code == 0
         # Table output should contain column headers from steps data
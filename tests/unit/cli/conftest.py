@@ -6,19 +6,12 @@ from unittest.mock import MagicMock
 
 import pytest
 import typer
-from typer.testing import CliRunner
 
 from mixpanel_headless.types import (
     SegmentationResult,
 )
 
 
-@pytest.fixture
-def cli_runner() -> CliRunner:
-    """Create a CLI runner for testing commands."""
-    return CliRunner()
-
-
 @pytest.fixture
 def mock_workspace() -> MagicMock:
     """Create a mock Workspace for testing commands."""
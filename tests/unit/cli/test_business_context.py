@@ -17,9 +17,10 @@ import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-import typer.testing
+from click import Command
+from click.testing import CliRunner
 
-from mixpanel_headless.cli.main import app
+from mixpanel_headless.cli.commands import business_context as business_context_mod
 from mixpanel_headless.exceptions import (
     AuthenticationError,
     BusinessContextValidationError,
@@ -27,9 +28,6 @@ from mixpanel_headless.exceptions import (
     WorkspaceScopeError,
 )
 
-runner = typer.testing.CliRunner()
-
-
 # =============================================================================
 # Helpers
 # =============================================================================
@@ -83,14 +81,19 @@ def _chain_mock() -> MagicMock:
 class TestGet:
     """``mp business-context get`` behavior."""
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_default_level_is_project(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_default_level_is_project(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """No --level → project-scope GET, JSON includes project_id."""
         ws = MagicMock()
         ws.get_business_context.return_value = _ctx_mock(level="project")
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(app, ["business-context", "get"])
+        result = cli_runner.invoke(cli_command, ["business-context", "get"])
         assert result.exit_code == 0
         ws.get_business_context.assert_called_once_with(
             level="project",
@@ -101,8 +104,13 @@ class TestGet:
         assert data["project_id"] == "12345"
         assert data["content"] == "# Hello"
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_organization_level_with_explicit_id(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_organization_level_with_explicit_id(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--level organization --organization-id forwards both."""
         ws = MagicMock()
         ws.get_business_context.return_value = _ctx_mock(
@@ -113,8 +121,8 @@ class TestGet:
         )
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "business-context",
                 "get",
@@ -132,22 +140,32 @@ class TestGet:
         data = json.loads(result.stdout)
         assert data["organization_id"] == 42
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_jq_filter_extracts_content(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_jq_filter_extracts_content(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--jq '.content' produces the markdown body only."""
         ws = MagicMock()
         ws.get_business_context.return_value = _ctx_mock(content="markdown!")
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["business-context", "get", "--jq", ".content"],
         )
         assert result.exit_code == 0
         assert "markdown!" in result.stdout
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_invalid_level_exits_2(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_invalid_level_exits_2(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Bogus --level value exits with Click's usage error code (2).
 
         ``--level`` is now a ``click.Choice`` so Click validates it
@@ -158,14 +176,19 @@ class TestGet:
         """
         mock_get_ws.return_value = MagicMock()
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["business-context", "get", "--level", "bogus"],
         )
         assert result.exit_code == 2
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_auth_error_exits_2(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_auth_error_exits_2(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """AuthenticationError from workspace → AUTH_ERROR (2)."""
         ws = MagicMock()
         ws.get_business_context.side_effect = AuthenticationError(
@@ -173,11 +196,16 @@ class TestGet:
         )
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(app, ["business-context", "get"])
+        result = cli_runner.invoke(cli_command, ["business-context", "get"])
         assert result.exit_code == 2
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_workspace_scope_error_exits_1(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_workspace_scope_error_exits_1(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """WorkspaceScopeError → GENERAL_ERROR (1)."""
         ws = MagicMock()
         ws.get_business_context.side_effect = WorkspaceScopeError(
@@ -186,8 +214,8 @@ class TestGet:
         )
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["business-context", "get", "--level", "organization"],
         )
         assert result.exit_code == 1
@@ -201,15 +229,20 @@ class TestGet:
 class TestSet:
     """``mp business-context set`` behavior."""
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_inline_content(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_inline_content(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--content forwards the literal string to set_business_context."""
         ws = MagicMock()
         ws.set_business_context.return_value = _ctx_mock(content="# Inline")
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["business-context", "set", "--content", "# Inline"],
         )
         assert result.exit_code == 0
@@ -219,8 +252,14 @@ class TestSet:
             organization_id=None,
         )
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_file_input(self, mock_get_ws: MagicMock, tmp_path: Path) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_file_input(
+        self,
+        mock_get_ws: MagicMock,
+        tmp_path: Path,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--file reads from disk and forwards content."""
         ws = MagicMock()
         ws.set_business_context.return_value = _ctx_mock(content="from file")
@@ -229,8 +268,8 @@ class TestSet:
         ctx_file = tmp_path / "ctx.md"
         ctx_file.write_text("from file", encoding="utf-8")
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["business-context", "set", "--file", str(ctx_file)],
         )
         assert result.exit_code == 0
@@ -240,15 +279,20 @@ class TestSet:
             organization_id=None,
         )
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_stdin_input(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_stdin_input(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Piped stdin (no flags, non-tty) is forwarded as content."""
         ws = MagicMock()
         ws.set_business_context.return_value = _ctx_mock(content="from stdin")
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["business-context", "set"],
             input="from stdin",
         )
@@ -259,17 +303,21 @@ class TestSet:
             organization_id=None,
         )
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
+    @patch.object(business_context_mod, "get_workspace")
     def test_content_and_file_mutex_exits_3(
-        self, mock_get_ws: MagicMock, tmp_path: Path
+        self,
+        mock_get_ws: MagicMock,
+        tmp_path: Path,
+        cli_runner: CliRunner,
+        cli_command: Command,
     ) -> None:
         """--content + --file together → INVALID_ARGS (3)."""
         mock_get_ws.return_value = MagicMock()
         ctx_file = tmp_path / "ctx.md"
         ctx_file.write_text("hi", encoding="utf-8")
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "business-context",
                 "set",
@@ -281,8 +329,13 @@ class TestSet:
         )
         assert result.exit_code == 3
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_empty_stdin_refuses_silent_clear(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_empty_stdin_refuses_silent_clear(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Empty / whitespace-only stdin → INVALID_ARGS (3) deterministically.
 
         Regression guard for the CI/cron `</dev/null` footgun: we must
@@ -293,24 +346,31 @@ class TestSet:
         ws = MagicMock()
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(app, ["business-context", "set"], input="")
+        result = cli_runner.invoke(cli_command, ["business-context", "set"], input="")
         assert result.exit_code == 3
         ws.set_business_context.assert_not_called()
 
         # Whitespace-only stdin is also rejected (no real intent to write).
-        result = runner.invoke(app, ["business-context", "set"], input="   \n")
+        result = cli_runner.invoke(
+            cli_command, ["business-context", "set"], input="   \n"
+        )
         assert result.exit_code == 3
         ws.set_business_context.assert_not_called()
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_explicit_empty_content_clears(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_explicit_empty_content_clears(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """`--content ""` is the explicit way to clear via `set`."""
         ws = MagicMock()
         ws.set_business_context.return_value = _ctx_mock(content="")
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["business-context", "set", "--content", ""],
         )
         assert result.exit_code == 0
@@ -320,19 +380,29 @@ class TestSet:
             organization_id=None,
         )
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_missing_file_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_missing_file_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--file pointing at a non-existent path → INVALID_ARGS (3)."""
         mock_get_ws.return_value = MagicMock()
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["business-context", "set", "--file", "/nonexistent/ctx.md"],
         )
         assert result.exit_code == 3
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_oversize_content_exits_invalid_args(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_oversize_content_exits_invalid_args(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """BusinessContextValidationError from set → INVALID_ARGS (3).
 
         @handle_errors has an explicit branch for
@@ -347,14 +417,19 @@ class TestSet:
         )
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["business-context", "set", "--content", "x" * 60_000],
         )
         assert result.exit_code == 3
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_org_level_set_forwards_org_id(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_org_level_set_forwards_org_id(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--level organization --organization-id forwards the int."""
         ws = MagicMock()
         ws.set_business_context.return_value = _ctx_mock(
@@ -365,8 +440,8 @@ class TestSet:
         )
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "business-context",
                 "set",
@@ -394,14 +469,19 @@ class TestSet:
 class TestClear:
     """``mp business-context clear`` behavior."""
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_clear_default_level(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_clear_default_level(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """clear with no flags clears project-level."""
         ws = MagicMock()
         ws.clear_business_context.return_value = _ctx_mock(content="")
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(app, ["business-context", "clear"])
+        result = cli_runner.invoke(cli_command, ["business-context", "clear"])
         assert result.exit_code == 0
         ws.clear_business_context.assert_called_once_with(
             level="project",
@@ -410,8 +490,13 @@ class TestClear:
         data = json.loads(result.stdout)
         assert data["content"] == ""
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_clear_organization(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_clear_organization(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """clear --level organization --organization-id forwards both."""
         ws = MagicMock()
         ws.clear_business_context.return_value = _ctx_mock(
@@ -422,8 +507,8 @@ class TestClear:
         )
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "business-context",
                 "clear",
@@ -448,22 +533,32 @@ class TestClear:
 class TestChain:
     """``mp business-context chain`` behavior."""
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_chain_returns_both_scopes(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_chain_returns_both_scopes(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """chain returns JSON with `organization` and `project` blocks."""
         ws = MagicMock()
         ws.get_business_context_chain.return_value = _chain_mock()
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(app, ["business-context", "chain"])
+        result = cli_runner.invoke(cli_command, ["business-context", "chain"])
         assert result.exit_code == 0
         ws.get_business_context_chain.assert_called_once_with()
         data = json.loads(result.stdout)
         assert data["organization"]["organization_id"] == 100
         assert data["project"]["project_id"] == "12345"
 
-    @patch("mixpanel_headless.cli.commands.business_context.get_workspace")
-    def test_chain_query_error_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(business_context_mod, "get_workspace")
+    def test_chain_query_error_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """QueryError from chain → INVALID_ARGS (3)."""
         ws = MagicMock()
         ws.get_business_context_chain.side_effect = QueryError(
@@ -473,5 +568,5 @@ class TestChain:
         )
         mock_get_ws.return_value = ws
 
-        result = runner.invoke(app, ["business-context", "chain"])
+        result = cli_runner.invoke(cli_command, ["business-context", "chain"])
         assert result.exit_code == 3
@@ -13,9 +13,11 @@ import json
 from pathlib import Path
 
 import pytest
+import typer
 from typer.testing import CliRunner
 
 from mixpanel_headless._internal.config import ConfigManager
+from mixpanel_headless.cli.commands.account import add_account
 from mixpanel_headless.cli.main import app
 
 
@@ -103,54 +105,42 @@ class TestAccountCli:
         assert result.exit_code != 0
 
     def test_use_promotes_active(
-        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_context: typer.Context,
     ) -> None:
         """``mp account use NAME`` writes [active].account."""
         monkeypatch.setenv("MP_SECRET", "s")
-        runner.invoke(
-            app,
-            [
-                "account",
-                "add",
-                "a",
-                "--type",
-                "service_account",
-                "--region",
-                "us",
-                "--username",
-                "u",
-                "--project",
-                "3713224",
-            ],
-        )
-        runner.invoke(
-            app, ["account", "add", "b", "--type", "oauth_browser", "--region", "us"]
-        )
+        add_account(
+            mock_context,
+            "a",
+            type="service_account",
+            region="us",
+            username="u",
+            project="3713224",
+        )
+        add_account(mock_context, "b", type="oauth_browser", region="us")
         result = runner.invoke(app, ["account", "use", "b"])
         assert result.exit_code == 0
         active = ConfigManager().get_active().account
         assert active == "b"
 
     def test_remove_simple(
-        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_context: typer.Context,
     ) -> None:
         """``mp account remove NAME`` removes an unreferenced account."""
         monkeypatch.setenv("MP_SECRET", "s")
-        runner.invoke(
-            app,
-            [
-                "account",
-                "add",
-                "a",
-                "--type",
-                "service_account",
-                "--region",
-                "us",
-                "--username",
-                "u",
-                "--project",
-                "3713224",
-            ],
+        add_account(
+            mock_context,
+            "a",
+            type="service_account",
+            region="us",
+            username="u",
+            project="3713224",
         )
         result = runner.invoke(app, ["account", "remove", "a"])
         assert result.exit_code == 0
@@ -570,28 +560,23 @@ class TestProjectListScopeHint:
     """
 
     def test_project_list_403_for_service_account_surfaces_scope_hint(
-        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_context: typer.Context,
     ) -> None:
         """A 403 from /me on an SA prints E-10 wording and exits non-zero."""
         from mixpanel_headless._internal import api_client as api_client_mod
         from mixpanel_headless.exceptions import QueryError
 
         monkeypatch.setenv("MP_SECRET", "s")
-        runner.invoke(
-            app,
-            [
-                "account",
-                "add",
-                "limited-sa",
-                "--type",
-                "service_account",
-                "--region",
-                "us",
-                "--username",
-                "u",
-                "--project",
-                "1111111",
-            ],
+        add_account(
+            mock_context,
+            "limited-sa",
+            type="service_account",
+            region="us",
+            username="u",
+            project="1111111",
         )
 
         def _raise_403(self: object) -> dict[str, object]:
@@ -618,24 +603,16 @@ class TestAccountLoginNoBrowser:
     """
 
     def test_no_browser_flag_propagates_to_namespace_login(
-        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_context: typer.Context,
     ) -> None:
         """``--no-browser`` forwards to ``accounts_ns.login(open_browser=False)``."""
         from mixpanel_headless import accounts as accounts_ns
 
         # Seed an oauth_browser account so the CLI command type-checks pass.
-        runner.invoke(
-            app,
-            [
-                "account",
-                "add",
-                "personal",
-                "--type",
-                "oauth_browser",
-                "--region",
-                "us",
-            ],
-        )
+        add_account(mock_context, "personal", type="oauth_browser", region="us")
 
         captured: dict[str, object] = {}
 
@@ -678,28 +655,23 @@ class TestProjectCli:
         assert "no active project" in result.output
 
     def test_use_writes_active_account_default_project(
-        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_context: typer.Context,
     ) -> None:
         """``mp project use ID`` writes the active account's ``default_project``.
 
         Project lives on the account (FR-012), not in ``[active]``.
         """
         monkeypatch.setenv("MP_SECRET", "s")
-        runner.invoke(
-            app,
-            [
-                "account",
-                "add",
-                "a",
-                "--type",
-                "service_account",
-                "--region",
-                "us",
-                "--username",
-                "u",
-                "--project",
-                "1111111",
-            ],
+        add_account(
+            mock_context,
+            "a",
+            type="service_account",
+            region="us",
+            username="u",
+            project="1111111",
         )
         result = runner.invoke(app, ["project", "use", "3713224"])
         assert result.exit_code == 0
@@ -890,25 +862,20 @@ class TestSessionCli:
     """``mp session`` (no subcommand) prints active state."""
 
     def test_session_default_format(
-        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_context: typer.Context,
     ) -> None:
         """`mp session` prints contract-formatted four-line summary."""
         monkeypatch.setenv("MP_SECRET", "s")
-        runner.invoke(
-            app,
-            [
-                "account",
-                "add",
-                "a",
-                "--type",
-                "service_account",
-                "--region",
-                "us",
-                "--username",
-                "u",
-                "--project",
-                "3713224",
-            ],
+        add_account(
+            mock_context,
+            "a",
+            type="service_account",
+            region="us",
+            username="u",
+            project="3713224",
         )
         result = runner.invoke(app, ["session"])
         assert result.exit_code == 0
@@ -922,25 +889,20 @@ class TestSessionCli:
         assert "us" in result.output  # region annotation
 
     def test_session_json_format(
-        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_context: typer.Context,
     ) -> None:
         """``mp session --format json`` emits the contract structured payload."""
         monkeypatch.setenv("MP_SECRET", "s")
-        runner.invoke(
-            app,
-            [
-                "account",
-                "add",
-                "a",
-                "--type",
-                "service_account",
-                "--region",
-                "us",
-                "--username",
-                "u",
-                "--project",
-                "3713224",
-            ],
+        add_account(
+            mock_context,
+            "a",
+            type="service_account",
+            region="us",
+            username="u",
+            project="3713224",
         )
         result = runner.invoke(app, ["session", "--format", "json"])
         assert result.exit_code == 0, result.output
@@ -972,25 +934,20 @@ class TestGlobals:
     """The new global options behave as documented."""
 
     def test_target_with_account_exits(
-        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_context: typer.Context,
     ) -> None:
         """``--target`` combined with ``--account`` exits with code 3."""
         monkeypatch.setenv("MP_SECRET", "s")
-        runner.invoke(
-            app,
-            [
-                "account",
-                "add",
-                "a",
-                "--type",
-                "service_account",
-                "--region",
-                "us",
-                "--username",
-                "u",
-                "--project",
-                "3713224",
-            ],
+        add_account(
+            mock_context,
+            "a",
+            type="service_account",
+            region="us",
+            username="u",
+            project="3713224",
         )
         result = runner.invoke(
             app,
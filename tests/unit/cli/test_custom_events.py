@@ -12,18 +12,22 @@ from __future__ import annotations
 import json
 from unittest.mock import MagicMock, patch
 
-import typer.testing
+from click import Command
+from click.testing import CliRunner
 
-from mixpanel_headless.cli.main import app
-
-runner = typer.testing.CliRunner()
+from mixpanel_headless.cli.commands import custom_events as custom_events_mod
 
 
 class TestCustomEventsList:
     """Tests for mp custom-events list."""
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_returns_json_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_returns_json_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful list returns JSON list of custom events."""
         mock_ws = MagicMock()
         mock_ws.list_custom_events.return_value = [
@@ -32,21 +36,26 @@ class TestCustomEventsList:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["custom-events", "list"])
+        result = cli_runner.invoke(cli_command, ["custom-events", "list"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
         assert len(data) == 2
         assert data[0]["name"] == "Activated"
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_empty_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_empty_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Empty list returns empty JSON array."""
         mock_ws = MagicMock()
         mock_ws.list_custom_events.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["custom-events", "list"])
+        result = cli_runner.invoke(cli_command, ["custom-events", "list"])
         assert result.exit_code == 0
         assert json.loads(result.stdout) == []
 
@@ -54,9 +63,12 @@ class TestCustomEventsList:
 class TestCustomEventsUpdate:
     """Tests for mp custom-events update."""
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
+    @patch.object(custom_events_mod, "get_workspace")
     def test_update_by_id_with_hidden_returns_json(
-        self, mock_get_ws: MagicMock
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
     ) -> None:
         """--id update with --hidden returns JSON and skips lookup."""
         mock_ws = MagicMock()
@@ -65,8 +77,8 @@ class TestCustomEventsUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-events", "update", "--id", "2044168", "--hidden"],
         )
         assert result.exit_code == 0
@@ -78,8 +90,13 @@ class TestCustomEventsUpdate:
         assert called_id == 2044168
         assert called_params.hidden is True
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_update_by_id_with_description(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_update_by_id_with_description(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--description passes through to the params."""
         mock_ws = MagicMock()
         mock_ws.update_custom_event.return_value = MagicMock(
@@ -87,8 +104,8 @@ class TestCustomEventsUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-events",
                 "update",
@@ -102,8 +119,13 @@ class TestCustomEventsUpdate:
         data = json.loads(result.stdout)
         assert data["description"] == "User activated"
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_update_by_id_with_dropped(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_update_by_id_with_dropped(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--dropped flag passes dropped=True."""
         mock_ws = MagicMock()
         mock_ws.update_custom_event.return_value = MagicMock(
@@ -111,16 +133,21 @@ class TestCustomEventsUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-events", "update", "--id", "123", "--dropped"],
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["dropped"] is True
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_update_by_name_resolves_to_id(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_update_by_name_resolves_to_id(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--name resolves to the unique custom_event_id and passes it through."""
         from mixpanel_headless.types import EventDefinition
 
@@ -136,8 +163,8 @@ class TestCustomEventsUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-events", "update", "--name", "Activated", "--verified"],
         )
         assert result.exit_code == 0
@@ -145,23 +172,33 @@ class TestCustomEventsUpdate:
         assert called_id == 2044168
         assert called_params.verified is True
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_update_errors_when_name_not_found(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_update_errors_when_name_not_found(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--name with no matching custom event errors out and names the query."""
         mock_ws = MagicMock()
         mock_ws.list_custom_events.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-events", "update", "--name", "Nonexistent", "--hidden"],
         )
         assert result.exit_code != 0
         combined = (result.stdout or "") + (result.stderr or "")
         assert "Nonexistent" in combined
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_update_errors_when_name_is_ambiguous(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_update_errors_when_name_is_ambiguous(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--name matching multiple real custom events lists the colliding ids."""
         from mixpanel_headless.types import EventDefinition
 
@@ -172,8 +209,8 @@ class TestCustomEventsUpdate:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-events", "update", "--name", "Duplicate", "--hidden"],
         )
         assert result.exit_code != 0
@@ -182,9 +219,12 @@ class TestCustomEventsUpdate:
         assert "222" in combined
         assert "--id" in combined
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
+    @patch.object(custom_events_mod, "get_workspace")
     def test_update_errors_when_name_only_matches_orphans(
-        self, mock_get_ws: MagicMock
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
     ) -> None:
         """--name matching only orphan entries errors with an orphan-aware hint."""
         from mixpanel_headless.types import EventDefinition
@@ -196,8 +236,8 @@ class TestCustomEventsUpdate:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-events", "update", "--name", "OrphanOnly", "--hidden"],
         )
         assert result.exit_code != 0
@@ -205,8 +245,13 @@ class TestCustomEventsUpdate:
         assert "orphan" in combined.lower()
         assert "--id" in combined
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_update_with_no_verified_passes_false(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_update_with_no_verified_passes_false(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--no-verified passes verified=False (not omitted)."""
         mock_ws = MagicMock()
         mock_ws.update_custom_event.return_value = MagicMock(
@@ -214,17 +259,20 @@ class TestCustomEventsUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-events", "update", "--id", "2044168", "--no-verified"],
         )
         assert result.exit_code == 0
         _, called_params = mock_ws.update_custom_event.call_args[0]
         assert called_params.verified is False
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
+    @patch.object(custom_events_mod, "get_workspace")
     def test_update_without_verified_flag_omits_field(
-        self, mock_get_ws: MagicMock
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
     ) -> None:
         """Omitting --verified leaves verified unset (None) in params."""
         mock_ws = MagicMock()
@@ -233,8 +281,8 @@ class TestCustomEventsUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-events", "update", "--id", "2044168", "--hidden"],
         )
         assert result.exit_code == 0
@@ -243,15 +291,19 @@ class TestCustomEventsUpdate:
         # And it must drop out of the API body when serialized
         assert "verified" not in called_params.model_dump(exclude_none=True)
 
-    def test_update_errors_when_neither_id_nor_name(self) -> None:
+    def test_update_errors_when_neither_id_nor_name(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Update without --id and without --name errors out."""
-        result = runner.invoke(app, ["custom-events", "update", "--hidden"])
+        result = cli_runner.invoke(cli_command, ["custom-events", "update", "--hidden"])
         assert result.exit_code != 0
 
-    def test_update_errors_when_both_id_and_name(self) -> None:
+    def test_update_errors_when_both_id_and_name(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Update with both --id and --name errors out."""
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-events",
                 "update",
@@ -268,20 +320,32 @@ class TestCustomEventsUpdate:
 class TestCustomEventsDelete:
     """Tests for mp custom-events delete."""
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_delete_by_id_succeeds(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_delete_by_id_succeeds(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--id delete passes the int id straight to workspace.delete_custom_event."""
         mock_ws = MagicMock()
         mock_ws.delete_custom_event.return_value = None
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["custom-events", "delete", "--id", "2044168"])
+        result = cli_runner.invoke(
+            cli_command, ["custom-events", "delete", "--id", "2044168"]
+        )
         assert result.exit_code == 0
         mock_ws.delete_custom_event.assert_called_once_with(2044168)
         mock_ws.list_custom_events.assert_not_called()
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_delete_by_name_resolves_to_id(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_delete_by_name_resolves_to_id(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--name resolves to the unique custom_event_id and deletes by id."""
         from mixpanel_headless.types import EventDefinition
 
@@ -293,27 +357,39 @@ class TestCustomEventsDelete:
         mock_ws.delete_custom_event.return_value = None
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["custom-events", "delete", "--name", "OldEvent"])
+        result = cli_runner.invoke(
+            cli_command, ["custom-events", "delete", "--name", "OldEvent"]
+        )
         assert result.exit_code == 0
         mock_ws.delete_custom_event.assert_called_once_with(2044168)
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_delete_errors_when_name_not_found(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_delete_errors_when_name_not_found(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--name with no matching custom event errors out, doesn't delete."""
         mock_ws = MagicMock()
         mock_ws.list_custom_events.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app, ["custom-events", "delete", "--name", "Nonexistent"]
+        result = cli_runner.invoke(
+            cli_command, ["custom-events", "delete", "--name", "Nonexistent"]
         )
         assert result.exit_code != 0
         mock_ws.delete_custom_event.assert_not_called()
         combined = (result.stdout or "") + (result.stderr or "")
         assert "Nonexistent" in combined
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
-    def test_delete_errors_when_name_is_ambiguous(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_events_mod, "get_workspace")
+    def test_delete_errors_when_name_is_ambiguous(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """--name matching multiple real custom events lists colliding ids and aborts."""
         from mixpanel_headless.types import EventDefinition
 
@@ -324,7 +400,9 @@ class TestCustomEventsDelete:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["custom-events", "delete", "--name", "Duplicate"])
+        result = cli_runner.invoke(
+            cli_command, ["custom-events", "delete", "--name", "Duplicate"]
+        )
         assert result.exit_code != 0
         mock_ws.delete_custom_event.assert_not_called()
         combined = (result.stdout or "") + (result.stderr or "")
@@ -332,9 +410,12 @@ class TestCustomEventsDelete:
         assert "222" in combined
         assert "--id" in combined
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
+    @patch.object(custom_events_mod, "get_workspace")
     def test_delete_errors_when_name_only_matches_orphans(
-        self, mock_get_ws: MagicMock
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
     ) -> None:
         """--name matching only orphans aborts with an orphan-aware hint."""
         from mixpanel_headless.types import EventDefinition
@@ -346,22 +427,28 @@ class TestCustomEventsDelete:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["custom-events", "delete", "--name", "OrphanOnly"])
+        result = cli_runner.invoke(
+            cli_command, ["custom-events", "delete", "--name", "OrphanOnly"]
+        )
         assert result.exit_code != 0
         mock_ws.delete_custom_event.assert_not_called()
         combined = (result.stdout or "") + (result.stderr or "")
         assert "orphan" in combined.lower()
         assert "--id" in combined
 
-    def test_delete_errors_when_neither_id_nor_name(self) -> None:
+    def test_delete_errors_when_neither_id_nor_name(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Delete without --id and without --name errors out."""
-        result = runner.invoke(app, ["custom-events", "delete"])
+        result = cli_runner.invoke(cli_command, ["custom-events", "delete"])
         assert result.exit_code != 0
 
-    def test_delete_errors_when_both_id_and_name(self) -> None:
+    def test_delete_errors_when_both_id_and_name(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Delete with both --id and --name errors out."""
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-events", "delete", "--id", "123", "--name", "X"],
         )
         assert result.exit_code != 0
@@ -370,9 +457,12 @@ class TestCustomEventsDelete:
 class TestCustomEventsCreate:
     """Tests for mp custom-events create."""
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
+    @patch.object(custom_events_mod, "get_workspace")
     def test_create_with_single_alternative_returns_json(
-        self, mock_get_ws: MagicMock
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
     ) -> None:
         """Successful create returns JSON with the new custom event."""
         from mixpanel_headless.types import CustomEvent, CustomEventAlternative
@@ -385,8 +475,8 @@ class TestCustomEventsCreate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-events",
                 "create",
@@ -406,9 +496,12 @@ class TestCustomEventsCreate:
         assert called_params.name == "Metric Tree Opened"
         assert called_params.alternatives == ["Enter room"]
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
+    @patch.object(custom_events_mod, "get_workspace")
     def test_create_with_multiple_alternatives_preserves_order(
-        self, mock_get_ws: MagicMock
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
     ) -> None:
         """--alternative is repeatable and preserves order."""
         from mixpanel_headless.types import CustomEvent
@@ -419,8 +512,8 @@ class TestCustomEventsCreate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-events",
                 "create",
@@ -439,19 +532,30 @@ class TestCustomEventsCreate:
         called_params = mock_ws.create_custom_event.call_args[0][0]
         assert called_params.alternatives == ["Home", "Product", "Checkout"]
 
-    def test_create_missing_name_errors(self) -> None:
+    def test_create_missing_name_errors(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Omitting --name causes typer to exit non-zero."""
-        result = runner.invoke(app, ["custom-events", "create", "--alternative", "X"])
+        result = cli_runner.invoke(
+            cli_command, ["custom-events", "create", "--alternative", "X"]
+        )
         assert result.exit_code != 0
 
-    def test_create_missing_alternative_errors(self) -> None:
+    def test_create_missing_alternative_errors(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Omitting --alternative causes a non-zero exit (Pydantic validation error)."""
-        result = runner.invoke(app, ["custom-events", "create", "--name", "X"])
+        result = cli_runner.invoke(
+            cli_command, ["custom-events", "create", "--name", "X"]
+        )
         assert result.exit_code != 0
 
-    @patch("mixpanel_headless.cli.commands.custom_events.get_workspace")
+    @patch.object(custom_events_mod, "get_workspace")
     def test_create_empty_name_surfaces_as_input_error_not_api_error(
-        self, mock_get_ws: MagicMock
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
     ) -> None:
         """Empty --name violates Pydantic min_length and reports as INPUT error.
 
@@ -463,8 +567,8 @@ class TestCustomEventsCreate:
         """
         mock_get_ws.return_value = MagicMock()  # no workspace call should happen
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-events", "create", "--name", "", "--alternative", "X"],
         )
 
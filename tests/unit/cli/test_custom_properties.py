@@ -15,18 +15,22 @@ from __future__ import annotations
 import json
 from unittest.mock import MagicMock, patch
 
-import typer.testing
+from click import Command
+from click.testing import CliRunner
 
-from mixpanel_headless.cli.main import app
-
-runner = typer.testing.CliRunner()
+from mixpanel_headless.cli.commands import custom_properties as custom_properties_mod
 
 
 class TestCustomPropertiesList:
     """Tests for mp custom-properties list."""
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_returns_json_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_returns_json_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful list returns JSON list of custom properties."""
         mock_ws = MagicMock()
         mock_ws.list_custom_properties.return_value = [
@@ -35,21 +39,26 @@ class TestCustomPropertiesList:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["custom-properties", "list"])
+        result = cli_runner.invoke(cli_command, ["custom-properties", "list"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
         assert len(data) == 2
         assert data[0]["name"] == "Revenue Per User"
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_empty_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_empty_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Empty list returns empty JSON array."""
         mock_ws = MagicMock()
         mock_ws.list_custom_properties.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["custom-properties", "list"])
+        result = cli_runner.invoke(cli_command, ["custom-properties", "list"])
         assert result.exit_code == 0
         assert json.loads(result.stdout) == []
 
@@ -57,8 +66,13 @@ class TestCustomPropertiesList:
 class TestCustomPropertiesGet:
     """Tests for mp custom-properties get."""
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_get_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_get_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful get returns JSON dict of custom property."""
         mock_ws = MagicMock()
         mock_ws.get_custom_property.return_value = MagicMock(
@@ -70,14 +84,21 @@ class TestCustomPropertiesGet:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["custom-properties", "get", "--id", "cp1"])
+        result = cli_runner.invoke(
+            cli_command, ["custom-properties", "get", "--id", "cp1"]
+        )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["id"] == "cp1"
         assert data["name"] == "Revenue Per User"
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_get_passes_id(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_get_passes_id(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """The property ID is passed to the workspace method."""
         mock_ws = MagicMock()
         mock_ws.get_custom_property.return_value = MagicMock(
@@ -85,15 +106,20 @@ class TestCustomPropertiesGet:
         )
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(app, ["custom-properties", "get", "--id", "abc"])
+        cli_runner.invoke(cli_command, ["custom-properties", "get", "--id", "abc"])
         mock_ws.get_custom_property.assert_called_once_with("abc")
 
 
 class TestCustomPropertiesCreate:
     """Tests for mp custom-properties create."""
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_create_with_formula_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_create_with_formula_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful create with formula returns JSON."""
         mock_ws = MagicMock()
         mock_ws.create_custom_property.return_value = MagicMock(
@@ -106,8 +132,8 @@ class TestCustomPropertiesCreate:
         mock_get_ws.return_value = mock_ws
 
         composed = json.dumps({"amount": {"resource_type": "event"}})
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-properties",
                 "create",
@@ -125,8 +151,13 @@ class TestCustomPropertiesCreate:
         data = json.loads(result.stdout)
         assert data["name"] == "Revenue Per User"
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_create_with_behavior_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_create_with_behavior_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful create with behavior specification returns JSON."""
         mock_ws = MagicMock()
         mock_ws.create_custom_property.return_value = MagicMock(
@@ -139,8 +170,8 @@ class TestCustomPropertiesCreate:
         mock_get_ws.return_value = mock_ws
 
         behavior = json.dumps({"type": "first_touch", "property": "utm_source"})
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-properties",
                 "create",
@@ -156,14 +187,19 @@ class TestCustomPropertiesCreate:
         data = json.loads(result.stdout)
         assert data["name"] == "First Touch UTM"
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_create_invalid_composed_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_create_invalid_composed_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --composed-properties exits with code 3."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-properties",
                 "create",
@@ -179,14 +215,19 @@ class TestCustomPropertiesCreate:
         )
         assert result.exit_code == 3
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_create_invalid_behavior_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_create_invalid_behavior_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --behavior exits with code 3."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-properties",
                 "create",
@@ -204,8 +245,13 @@ class TestCustomPropertiesCreate:
 class TestCustomPropertiesUpdate:
     """Tests for mp custom-properties update."""
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful update returns JSON."""
         mock_ws = MagicMock()
         mock_ws.update_custom_property.return_value = MagicMock(
@@ -213,16 +259,21 @@ class TestCustomPropertiesUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-properties", "update", "--id", "cp1", "--name", "Updated Name"],
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["name"] == "Updated Name"
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_update_with_visibility(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_update_with_visibility(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Update with --no-is-visible passes is_visible=False."""
         mock_ws = MagicMock()
         mock_ws.update_custom_property.return_value = MagicMock(
@@ -230,20 +281,25 @@ class TestCustomPropertiesUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["custom-properties", "update", "--id", "cp1", "--no-is-visible"],
         )
         assert result.exit_code == 0
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_update_invalid_composed_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_update_invalid_composed_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --composed-properties on update exits with code 3."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-properties",
                 "update",
@@ -259,14 +315,21 @@ class TestCustomPropertiesUpdate:
 class TestCustomPropertiesDelete:
     """Tests for mp custom-properties delete."""
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_delete_succeeds(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_delete_succeeds(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful delete exits with code 0."""
         mock_ws = MagicMock()
         mock_ws.delete_custom_property.return_value = None
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["custom-properties", "delete", "--id", "cp1"])
+        result = cli_runner.invoke(
+            cli_command, ["custom-properties", "delete", "--id", "cp1"]
+        )
         assert result.exit_code == 0
         mock_ws.delete_custom_property.assert_called_once_with("cp1")
 
@@ -274,16 +337,21 @@ class TestCustomPropertiesDelete:
 class TestCustomPropertiesValidate:
     """Tests for mp custom-properties validate."""
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_validate_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_validate_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful validate returns JSON result."""
         mock_ws = MagicMock()
         mock_ws.validate_custom_property.return_value = {"valid": True, "errors": []}
         mock_get_ws.return_value = mock_ws
 
         composed = json.dumps({"amount": {"resource_type": "event"}})
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-properties",
                 "validate",
@@ -301,16 +369,21 @@ class TestCustomPropertiesValidate:
         data = json.loads(result.stdout)
         assert data["valid"] is True
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
-    def test_validate_with_behavior(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(custom_properties_mod, "get_workspace")
+    def test_validate_with_behavior(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Validate with --behavior passes behavior to workspace."""
         mock_ws = MagicMock()
         mock_ws.validate_custom_property.return_value = {"valid": True}
         mock_get_ws.return_value = mock_ws
 
         behavior = json.dumps({"type": "first_touch"})
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-properties",
                 "validate",
@@ -324,16 +397,19 @@ class TestCustomPropertiesValidate:
         )
         assert result.exit_code == 0
 
-    @patch("mixpanel_headless.cli.commands.custom_properties.get_workspace")
+    @patch.object(custom_properties_mod, "get_workspace")
     def test_validate_invalid_behavior_json_exits_3(
-        self, mock_get_ws: MagicMock
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
     ) -> None:
         """Invalid JSON for --behavior on validate exits with code 3."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "custom-properties",
                 "validate",
@@ -14,18 +14,22 @@ from __future__ import annotations
 import json
 from unittest.mock import MagicMock, patch
 
-import typer.testing
+from click import Command
+from click.testing import CliRunner
 
-from mixpanel_headless.cli.main import app
-
-runner = typer.testing.CliRunner()
+from mixpanel_headless.cli.commands import drop_filters as drop_filters_mod
 
 
 class TestDropFiltersList:
     """Tests for mp drop-filters list."""
 
-    @patch("mixpanel_headless.cli.commands.drop_filters.get_workspace")
-    def test_returns_json_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(drop_filters_mod, "get_workspace")
+    def test_returns_json_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful list returns JSON list of drop filters."""
         mock_ws = MagicMock()
         mock_ws.list_drop_filters.return_value = [
@@ -38,21 +42,26 @@ class TestDropFiltersList:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["drop-filters", "list"])
+        result = cli_runner.invoke(cli_command, ["drop-filters", "list"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
         assert len(data) == 2
         assert data[0]["event_name"] == "PageView"
 
-    @patch("mixpanel_headless.cli.commands.drop_filters.get_workspace")
-    def test_empty_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(drop_filters_mod, "get_workspace")
+    def test_empty_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Empty list returns empty JSON array."""
         mock_ws = MagicMock()
         mock_ws.list_drop_filters.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["drop-filters", "list"])
+        result = cli_runner.invoke(cli_command, ["drop-filters", "list"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data == []
@@ -61,8 +70,13 @@ class TestDropFiltersList:
 class TestDropFiltersCreate:
     """Tests for mp drop-filters create."""
 
-    @patch("mixpanel_headless.cli.commands.drop_filters.get_workspace")
-    def test_create_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(drop_filters_mod, "get_workspace")
+    def test_create_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful create returns JSON list of drop filters."""
         mock_ws = MagicMock()
         mock_ws.create_drop_filter.return_value = [
@@ -73,8 +87,8 @@ class TestDropFiltersCreate:
         mock_get_ws.return_value = mock_ws
 
         filters_json = json.dumps({"property": "env", "value": "test"})
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "drop-filters",
                 "create",
@@ -88,14 +102,19 @@ class TestDropFiltersCreate:
         data = json.loads(result.stdout)
         assert isinstance(data, list)
 
-    @patch("mixpanel_headless.cli.commands.drop_filters.get_workspace")
-    def test_create_invalid_filters_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(drop_filters_mod, "get_workspace")
+    def test_create_invalid_filters_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --filters exits with code 3."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "drop-filters",
                 "create",
@@ -111,8 +130,13 @@ class TestDropFiltersCreate:
 class TestDropFiltersUpdate:
     """Tests for mp drop-filters update."""
 
-    @patch("mixpanel_headless.cli.commands.drop_filters.get_workspace")
-    def test_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(drop_filters_mod, "get_workspace")
+    def test_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful update returns JSON list of drop filters."""
         mock_ws = MagicMock()
         mock_ws.update_drop_filter.return_value = [
@@ -122,16 +146,21 @@ class TestDropFiltersUpdate:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["drop-filters", "update", "--id", "1", "--no-active"],
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
 
-    @patch("mixpanel_headless.cli.commands.drop_filters.get_workspace")
-    def test_update_with_new_event_name(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(drop_filters_mod, "get_workspace")
+    def test_update_with_new_event_name(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Update with --event-name passes it to the workspace."""
         mock_ws = MagicMock()
         mock_ws.update_drop_filter.return_value = [
@@ -139,20 +168,25 @@ class TestDropFiltersUpdate:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["drop-filters", "update", "--id", "1", "--event-name", "NewEvent"],
         )
         assert result.exit_code == 0
 
-    @patch("mixpanel_headless.cli.commands.drop_filters.get_workspace")
-    def test_update_invalid_filters_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(drop_filters_mod, "get_workspace")
+    def test_update_invalid_filters_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --filters on update exits with code 3."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["drop-filters", "update", "--id", "1", "--filters", "bad{json"],
         )
         assert result.exit_code == 3
@@ -161,8 +195,13 @@ class TestDropFiltersUpdate:
 class TestDropFiltersDelete:
     """Tests for mp drop-filters delete."""
 
-    @patch("mixpanel_headless.cli.commands.drop_filters.get_workspace")
-    def test_delete_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(drop_filters_mod, "get_workspace")
+    def test_delete_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful delete returns the remaining drop filters as JSON."""
         mock_ws = MagicMock()
         mock_ws.delete_drop_filter.return_value = [
@@ -170,7 +209,7 @@ class TestDropFiltersDelete:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["drop-filters", "delete", "--id", "1"])
+        result = cli_runner.invoke(cli_command, ["drop-filters", "delete", "--id", "1"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
@@ -179,8 +218,13 @@ class TestDropFiltersDelete:
 class TestDropFiltersLimits:
     """Tests for mp drop-filters limits."""
 
-    @patch("mixpanel_headless.cli.commands.drop_filters.get_workspace")
-    def test_limits_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(drop_filters_mod, "get_workspace")
+    def test_limits_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful limits returns JSON with count and max."""
         mock_ws = MagicMock()
         mock_ws.get_drop_filter_limits.return_value = MagicMock(
@@ -188,7 +232,7 @@ class TestDropFiltersLimits:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["drop-filters", "limits"])
+        result = cli_runner.invoke(cli_command, ["drop-filters", "limits"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["current_count"] == 5
@@ -13,19 +13,8 @@ import json
 from unittest.mock import MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
-
-from mixpanel_headless.cli.main import app
-
-
-@pytest.fixture
-def cli_runner() -> CliRunner:
-    """Create a CLI runner for testing commands.
-
-    Returns:
-        CliRunner instance for invoking CLI commands.
-    """
-    return CliRunner()
+from click import Command
+from click.testing import CliRunner
 
 
 @pytest.fixture
@@ -42,7 +31,7 @@ class TestInspectEventsWithJq:
     """Integration tests for inspect events with --jq option (T069)."""
 
     def test_inspect_events_with_jq_filter(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Test that inspect events applies jq filter to output.
 
@@ -60,7 +49,7 @@ class TestInspectEventsWithJq:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 ["inspect", "events", "--format", "json", "--jq", ".[0]"],
             )
 
@@ -70,7 +59,7 @@ class TestInspectEventsWithJq:
         assert output == '"Sign Up"'
 
     def test_inspect_events_jq_extracts_all(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Test extracting all event names with jq.
 
@@ -85,7 +74,7 @@ class TestInspectEventsWithJq:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 ["inspect", "events", "--format", "json", "--jq", ".[]"],
             )
 
@@ -94,7 +83,7 @@ class TestInspectEventsWithJq:
         assert parsed == ["Event A", "Event B", "Event C"]
 
     def test_inspect_events_jq_length_filter(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Test counting events with jq length.
 
@@ -109,7 +98,7 @@ class TestInspectEventsWithJq:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 ["inspect", "events", "--format", "json", "--jq", "length"],
             )
 
@@ -121,7 +110,7 @@ class TestJqWithIncompatibleFormat:
     """Integration tests for --jq with incompatible formats (T071)."""
 
     def test_jq_with_table_format_fails(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Test that --jq with --format table produces error.
 
@@ -136,7 +125,7 @@ class TestJqWithIncompatibleFormat:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 ["inspect", "events", "--format", "table", "--jq", "."],
             )
 
@@ -147,7 +136,7 @@ class TestJqWithIncompatibleFormat:
         assert "json" in combined.lower()
 
     def test_jq_with_csv_format_fails(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Test that --jq with --format csv produces error.
 
@@ -162,14 +151,14 @@ class TestJqWithIncompatibleFormat:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 ["inspect", "events", "--format", "csv", "--jq", "."],
             )
 
         assert result.exit_code == 3
 
     def test_jq_with_plain_format_fails(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Test that --jq with --format plain produces error.
 
@@ -184,7 +173,7 @@ class TestJqWithIncompatibleFormat:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 ["inspect", "events", "--format", "plain", "--jq", "."],
             )
 
@@ -195,7 +184,7 @@ class TestJqSyntaxErrorsIntegration:
     """Integration tests for jq syntax error handling."""
 
     def test_invalid_jq_syntax_fails(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Test that invalid jq syntax produces clear error.
 
@@ -210,7 +199,7 @@ class TestJqSyntaxErrorsIntegration:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 ["inspect", "events", "--format", "json", "--jq", ".name |"],
             )
 
@@ -220,7 +209,7 @@ class TestJqSyntaxErrorsIntegration:
         assert "jq" in combined_output.lower()
 
     def test_unknown_jq_function_fails(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Test that unknown jq function produces error.
 
@@ -235,7 +224,7 @@ class TestJqSyntaxErrorsIntegration:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 ["inspect", "events", "--format", "json", "--jq", "nonexistent_func"],
             )
 
@@ -246,7 +235,7 @@ class TestJqWithJsonlFormat:
     """Integration tests for --jq with jsonl format."""
 
     def test_jq_with_jsonl_format(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Test that --jq works with jsonl format.
 
@@ -261,7 +250,7 @@ class TestJqWithJsonlFormat:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 ["inspect", "events", "--format", "jsonl", "--jq", ".[0]"],
             )
 
@@ -274,7 +263,7 @@ class TestJqEmptyResultsIntegration:
     """Integration tests for jq filter with empty results."""
 
     def test_jq_select_no_matches(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Test that jq select with no matches returns empty array.
 
@@ -289,7 +278,7 @@ class TestJqEmptyResultsIntegration:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 [
                     "inspect",
                     "events",
@@ -308,7 +297,7 @@ class TestInspectSubpropertiesWithJq:
     """Integration tests for inspect subproperties (PR #128 follow-up)."""
 
     def test_subproperties_happy_path_json(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Discovered subproperties serialize to JSON via SubPropertyInfo.to_dict."""
         from mixpanel_headless import SubPropertyInfo
@@ -322,7 +311,7 @@ class TestInspectSubpropertiesWithJq:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 [
                     "inspect",
                     "subproperties",
@@ -345,7 +334,7 @@ class TestInspectSubpropertiesWithJq:
         )
 
     def test_subproperties_empty_result(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """Empty result list serializes to an empty JSON array."""
         mock_workspace.subproperties.return_value = []
@@ -354,14 +343,14 @@ class TestInspectSubpropertiesWithJq:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 ["inspect", "subproperties", "-p", "cart", "--format", "json"],
             )
         assert result.exit_code == 0
         assert json.loads(result.stdout) == []
 
     def test_subproperties_with_jq_filter(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """jq filter applied to projected output runs end-to-end."""
         from mixpanel_headless import SubPropertyInfo
@@ -376,7 +365,7 @@ class TestInspectSubpropertiesWithJq:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 [
                     "inspect",
                     "subproperties",
@@ -392,7 +381,7 @@ class TestInspectSubpropertiesWithJq:
         assert json.loads(result.stdout) == ["Brand", "Category"]
 
     def test_subproperties_table_format_succeeds(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """``--format table`` runs without crashing (table contents unsnapped)."""
         from mixpanel_headless import SubPropertyInfo
@@ -405,7 +394,7 @@ class TestInspectSubpropertiesWithJq:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 ["inspect", "subproperties", "-p", "cart", "--format", "table"],
             )
         assert result.exit_code == 0
@@ -414,7 +403,7 @@ class TestInspectSubpropertiesWithJq:
         assert "Brand" in result.stdout
 
     def test_subproperties_sample_size_passthrough(
-        self, cli_runner: CliRunner, mock_workspace: MagicMock
+        self, cli_runner: CliRunner, mock_workspace: MagicMock, cli_command: Command
     ) -> None:
         """``--sample-size`` is forwarded to Workspace.subproperties()."""
         mock_workspace.subproperties.return_value = []
@@ -423,7 +412,7 @@ class TestInspectSubpropertiesWithJq:
             return_value=mock_workspace,
         ):
             result = cli_runner.invoke(
-                app,
+                cli_command,
                 [
                     "inspect",
                     "subproperties",
@@ -13,12 +13,10 @@ from __future__ import annotations
 import json
 from unittest.mock import MagicMock, patch
 
-import typer.testing
-
-from mixpanel_headless.cli.main import app
-
-runner = typer.testing.CliRunner()
+from click import Command
+from click.testing import CliRunner
 
+from mixpanel_headless.cli.commands import lexicon as lexicon_mod
 
 # =============================================================================
 # Event Definitions
@@ -28,8 +26,13 @@ runner = typer.testing.CliRunner()
 class TestLexiconEventsGet:
     """Tests for mp lexicon events get."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_returns_json_output(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_returns_json_output(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful get returns JSON list of event definitions."""
         mock_ws = MagicMock()
         mock_ws.get_event_definitions.return_value = [
@@ -38,8 +41,8 @@ class TestLexiconEventsGet:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app, ["lexicon", "events", "get", "--names", "Purchase,Signup"]
+        result = cli_runner.invoke(
+            cli_command, ["lexicon", "events", "get", "--names", "Purchase,Signup"]
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
@@ -48,22 +51,34 @@ class TestLexiconEventsGet:
         assert data[0]["name"] == "Purchase"
         assert data[1]["name"] == "Signup"
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_passes_names_to_workspace(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_passes_names_to_workspace(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Names are split and passed as a list to the workspace method."""
         mock_ws = MagicMock()
         mock_ws.get_event_definitions.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(app, ["lexicon", "events", "get", "--names", "A, B, C"])
+        cli_runner.invoke(
+            cli_command, ["lexicon", "events", "get", "--names", "A, B, C"]
+        )
         mock_ws.get_event_definitions.assert_called_once_with(names=["A", "B", "C"])
 
 
 class TestLexiconEventsUpdate:
     """Tests for mp lexicon events update."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful update returns the updated event definition as JSON."""
         mock_ws = MagicMock()
         mock_ws.update_event_definition.return_value = MagicMock(
@@ -71,16 +86,21 @@ class TestLexiconEventsUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "events", "update", "--name", "Purchase", "--hidden"],
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["hidden"] is True
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_update_with_description(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_update_with_description(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Update with --description passes it to the workspace."""
         mock_ws = MagicMock()
         mock_ws.update_event_definition.return_value = MagicMock(
@@ -88,8 +108,8 @@ class TestLexiconEventsUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lexicon",
                 "events",
@@ -108,15 +128,20 @@ class TestLexiconEventsUpdate:
 class TestLexiconEventsDelete:
     """Tests for mp lexicon events delete."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_delete_succeeds(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_delete_succeeds(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful delete exits with code 0."""
         mock_ws = MagicMock()
         mock_ws.delete_event_definition.return_value = None
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app, ["lexicon", "events", "delete", "--name", "OldEvent"]
+        result = cli_runner.invoke(
+            cli_command, ["lexicon", "events", "delete", "--name", "OldEvent"]
         )
         assert result.exit_code == 0
         mock_ws.delete_event_definition.assert_called_once_with("OldEvent")
@@ -125,8 +150,13 @@ class TestLexiconEventsDelete:
 class TestLexiconEventsBulkUpdate:
     """Tests for mp lexicon events bulk-update."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_bulk_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_bulk_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful bulk update returns JSON list."""
         mock_ws = MagicMock()
         mock_ws.bulk_update_event_definitions.return_value = [
@@ -135,22 +165,27 @@ class TestLexiconEventsBulkUpdate:
         mock_get_ws.return_value = mock_ws
 
         payload = json.dumps({"events": [{"name": "A", "hidden": True}]})
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "events", "bulk-update", "--data", payload],
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_bulk_update_invalid_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_bulk_update_invalid_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --data exits with code 3 (INVALID_ARGS)."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "events", "bulk-update", "--data", "not-json"],
         )
         assert result.exit_code == 3
@@ -164,8 +199,13 @@ class TestLexiconEventsBulkUpdate:
 class TestLexiconPropertiesGet:
     """Tests for mp lexicon properties get."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_returns_json_output(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_returns_json_output(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful get returns JSON list of property definitions."""
         mock_ws = MagicMock()
         mock_ws.get_property_definitions.return_value = [
@@ -173,23 +213,28 @@ class TestLexiconPropertiesGet:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app, ["lexicon", "properties", "get", "--names", "plan_type"]
+        result = cli_runner.invoke(
+            cli_command, ["lexicon", "properties", "get", "--names", "plan_type"]
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
         assert data[0]["name"] == "plan_type"
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_with_resource_type(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_with_resource_type(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Passing --resource-type includes it in the workspace call."""
         mock_ws = MagicMock()
         mock_ws.get_property_definitions.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(
-            app,
+        cli_runner.invoke(
+            cli_command,
             [
                 "lexicon",
                 "properties",
@@ -208,8 +253,13 @@ class TestLexiconPropertiesGet:
 class TestLexiconPropertiesUpdate:
     """Tests for mp lexicon properties update."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful property update returns JSON."""
         mock_ws = MagicMock()
         mock_ws.update_property_definition.return_value = MagicMock(
@@ -217,16 +267,21 @@ class TestLexiconPropertiesUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "properties", "update", "--name", "email", "--sensitive"],
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["sensitive"] is True
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_update_with_description(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_update_with_description(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Update with --description passes it through."""
         mock_ws = MagicMock()
         mock_ws.update_property_definition.return_value = MagicMock(
@@ -234,8 +289,8 @@ class TestLexiconPropertiesUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lexicon",
                 "properties",
@@ -252,8 +307,13 @@ class TestLexiconPropertiesUpdate:
 class TestLexiconPropertiesBulkUpdate:
     """Tests for mp lexicon properties bulk-update."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_bulk_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_bulk_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful bulk update returns JSON list."""
         mock_ws = MagicMock()
         mock_ws.bulk_update_property_definitions.return_value = [
@@ -268,22 +328,27 @@ class TestLexiconPropertiesBulkUpdate:
                 ]
             }
         )
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "properties", "bulk-update", "--data", payload],
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_bulk_update_invalid_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_bulk_update_invalid_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --data exits with code 3."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "properties", "bulk-update", "--data", "{bad json"],
         )
         assert result.exit_code == 3
@@ -297,8 +362,13 @@ class TestLexiconPropertiesBulkUpdate:
 class TestLexiconTagsList:
     """Tests for mp lexicon tags list."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_returns_json_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_returns_json_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful list returns JSON list of tags."""
         mock_ws = MagicMock()
         mock_ws.list_lexicon_tags.return_value = [
@@ -307,7 +377,7 @@ class TestLexiconTagsList:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "tags", "list"])
+        result = cli_runner.invoke(cli_command, ["lexicon", "tags", "list"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
@@ -317,8 +387,13 @@ class TestLexiconTagsList:
 class TestLexiconTagsCreate:
     """Tests for mp lexicon tags create."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_create_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_create_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful create returns the created tag as JSON."""
         mock_ws = MagicMock()
         mock_ws.create_lexicon_tag.return_value = MagicMock(
@@ -326,7 +401,9 @@ class TestLexiconTagsCreate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "tags", "create", "--name", "new-tag"])
+        result = cli_runner.invoke(
+            cli_command, ["lexicon", "tags", "create", "--name", "new-tag"]
+        )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["name"] == "new-tag"
@@ -335,8 +412,13 @@ class TestLexiconTagsCreate:
 class TestLexiconTagsUpdate:
     """Tests for mp lexicon tags update."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful update returns the updated tag as JSON."""
         mock_ws = MagicMock()
         mock_ws.update_lexicon_tag.return_value = MagicMock(
@@ -344,8 +426,9 @@ class TestLexiconTagsUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app, ["lexicon", "tags", "update", "--id", "1", "--name", "renamed-tag"]
+        result = cli_runner.invoke(
+            cli_command,
+            ["lexicon", "tags", "update", "--id", "1", "--name", "renamed-tag"],
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
@@ -355,14 +438,21 @@ class TestLexiconTagsUpdate:
 class TestLexiconTagsDelete:
     """Tests for mp lexicon tags delete."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_delete_succeeds(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_delete_succeeds(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful delete exits with code 0."""
         mock_ws = MagicMock()
         mock_ws.delete_lexicon_tag.return_value = None
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "tags", "delete", "--name", "old-tag"])
+        result = cli_runner.invoke(
+            cli_command, ["lexicon", "tags", "delete", "--name", "old-tag"]
+        )
         assert result.exit_code == 0
         mock_ws.delete_lexicon_tag.assert_called_once_with("old-tag")
 
@@ -375,8 +465,13 @@ class TestLexiconTagsDelete:
 class TestLexiconTrackingMetadata:
     """Tests for mp lexicon tracking-metadata."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful tracking-metadata returns JSON dict."""
         mock_ws = MagicMock()
         mock_ws.get_tracking_metadata.return_value = {
@@ -385,8 +480,8 @@ class TestLexiconTrackingMetadata:
         }
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app, ["lexicon", "tracking-metadata", "--event-name", "Purchase"]
+        result = cli_runner.invoke(
+            cli_command, ["lexicon", "tracking-metadata", "--event-name", "Purchase"]
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
@@ -396,8 +491,13 @@ class TestLexiconTrackingMetadata:
 class TestLexiconEventHistory:
     """Tests for mp lexicon event-history."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful event-history returns JSON."""
         mock_ws = MagicMock()
         mock_ws.get_event_history.return_value = [
@@ -405,8 +505,8 @@ class TestLexiconEventHistory:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app, ["lexicon", "event-history", "--event-name", "Signup"]
+        result = cli_runner.invoke(
+            cli_command, ["lexicon", "event-history", "--event-name", "Signup"]
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
@@ -416,8 +516,13 @@ class TestLexiconEventHistory:
 class TestLexiconPropertyHistory:
     """Tests for mp lexicon property-history."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful property-history returns JSON."""
         mock_ws = MagicMock()
         mock_ws.get_property_history.return_value = [
@@ -425,8 +530,8 @@ class TestLexiconPropertyHistory:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lexicon",
                 "property-history",
@@ -440,15 +545,20 @@ class TestLexiconPropertyHistory:
         data = json.loads(result.stdout)
         assert isinstance(data, list)
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_passes_entity_type(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_passes_entity_type(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Entity type is passed to the workspace method."""
         mock_ws = MagicMock()
         mock_ws.get_property_history.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(
-            app,
+        cli_runner.invoke(
+            cli_command,
             [
                 "lexicon",
                 "property-history",
@@ -464,8 +574,13 @@ class TestLexiconPropertyHistory:
 class TestLexiconExport:
     """Tests for mp lexicon export."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_export_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_export_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful export returns JSON."""
         mock_ws = MagicMock()
         mock_ws.export_lexicon.return_value = {
@@ -474,19 +589,26 @@ class TestLexiconExport:
         }
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "export"])
+        result = cli_runner.invoke(cli_command, ["lexicon", "export"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert "events" in data
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_export_with_types_filter(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_export_with_types_filter(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Export with --types passes export_types to workspace."""
         mock_ws = MagicMock()
         mock_ws.export_lexicon.return_value = {}
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(app, ["lexicon", "export", "--types", "events,user_properties"])
+        cli_runner.invoke(
+            cli_command, ["lexicon", "export", "--types", "events,user_properties"]
+        )
         mock_ws.export_lexicon.assert_called_once_with(
             export_types=["events", "user_properties"]
         )
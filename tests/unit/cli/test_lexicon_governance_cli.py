@@ -31,12 +31,10 @@ from __future__ import annotations
 import json
 from unittest.mock import MagicMock, patch
 
-import typer.testing
-
-from mixpanel_headless.cli.main import app
-
-runner = typer.testing.CliRunner()
+from click import Command
+from click.testing import CliRunner
 
+from mixpanel_headless.cli.commands import lexicon as lexicon_mod
 
 # =============================================================================
 # Enforcement
@@ -46,8 +44,13 @@ runner = typer.testing.CliRunner()
 class TestEnforcementGet:
     """Tests for mp lexicon enforcement get."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful get returns JSON dict of enforcement settings."""
         mock_ws = MagicMock()
         mock_ws.get_schema_enforcement.return_value = MagicMock(
@@ -58,14 +61,19 @@ class TestEnforcementGet:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "enforcement", "get"])
+        result = cli_runner.invoke(cli_command, ["lexicon", "enforcement", "get"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["ruleEvent"] == "Warn and Accept"
         assert data["enabled"] is True
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_passes_fields_filter(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_passes_fields_filter(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Passing --fields includes it in the workspace call."""
         mock_ws = MagicMock()
         mock_ws.get_schema_enforcement.return_value = MagicMock(
@@ -73,8 +81,9 @@ class TestEnforcementGet:
         )
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(
-            app, ["lexicon", "enforcement", "get", "--fields", "enabled,ruleEvent"]
+        cli_runner.invoke(
+            cli_command,
+            ["lexicon", "enforcement", "get", "--fields", "enabled,ruleEvent"],
         )
         mock_ws.get_schema_enforcement.assert_called_once_with(
             fields="enabled,ruleEvent"
@@ -84,8 +93,13 @@ class TestEnforcementGet:
 class TestEnforcementInit:
     """Tests for mp lexicon enforcement init."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_init_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_init_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful init returns JSON dict."""
         mock_ws = MagicMock()
         mock_ws.init_schema_enforcement.return_value = {
@@ -94,8 +108,8 @@ class TestEnforcementInit:
         }
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "enforcement", "init", "--rule-event", "Warn and Accept"],
         )
         assert result.exit_code == 0
@@ -107,8 +121,13 @@ class TestEnforcementInit:
 class TestEnforcementUpdate:
     """Tests for mp lexicon enforcement update."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful update returns JSON dict."""
         mock_ws = MagicMock()
         mock_ws.update_schema_enforcement.return_value = {
@@ -118,22 +137,27 @@ class TestEnforcementUpdate:
         mock_get_ws.return_value = mock_ws
 
         body = json.dumps({"ruleEvent": "Reject"})
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "enforcement", "update", "--body", body],
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["ruleEvent"] == "Reject"
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_update_invalid_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_update_invalid_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --body exits with code 3 (INVALID_ARGS)."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "enforcement", "update", "--body", "not-json"],
         )
         assert result.exit_code == 3
@@ -142,8 +166,13 @@ class TestEnforcementUpdate:
 class TestEnforcementReplace:
     """Tests for mp lexicon enforcement replace."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_replace_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_replace_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful replace returns JSON dict."""
         mock_ws = MagicMock()
         mock_ws.replace_schema_enforcement.return_value = {
@@ -161,8 +190,8 @@ class TestEnforcementReplace:
                 "notificationEmails": ["admin@example.com"],
             }
         )
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "enforcement", "replace", "--body", body],
         )
         assert result.exit_code == 0
@@ -170,14 +199,19 @@ class TestEnforcementReplace:
         assert data["ruleEvent"] == "Block"
         assert data["enabled"] is False
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_replace_invalid_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_replace_invalid_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --body exits with code 3 (INVALID_ARGS)."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "enforcement", "replace", "--body", "{bad"],
         )
         assert result.exit_code == 3
@@ -186,24 +220,38 @@ class TestEnforcementReplace:
 class TestEnforcementDelete:
     """Tests for mp lexicon enforcement delete."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_delete_confirms_and_succeeds(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_delete_confirms_and_succeeds(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful delete prompts for confirmation and exits with code 0."""
         mock_ws = MagicMock()
         mock_ws.delete_schema_enforcement.return_value = None
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "enforcement", "delete"], input="y\n")
+        result = cli_runner.invoke(
+            cli_command, ["lexicon", "enforcement", "delete"], input="y\n"
+        )
         assert result.exit_code == 0
         mock_ws.delete_schema_enforcement.assert_called_once()
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_delete_aborts_on_no(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_delete_aborts_on_no(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Delete aborts when user declines confirmation."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "enforcement", "delete"], input="n\n")
+        result = cli_runner.invoke(
+            cli_command, ["lexicon", "enforcement", "delete"], input="n\n"
+        )
         assert result.exit_code != 0
         mock_ws.delete_schema_enforcement.assert_not_called()
 
@@ -216,8 +264,13 @@ class TestEnforcementDelete:
 class TestLexiconAudit:
     """Tests for mp lexicon audit."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_audit_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_audit_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful audit returns JSON with violations and computed_at."""
         mock_ws = MagicMock()
         audit_data = {
@@ -235,7 +288,7 @@ class TestLexiconAudit:
         mock_ws.run_audit.return_value = mock_audit
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "audit"])
+        result = cli_runner.invoke(cli_command, ["lexicon", "audit"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert "violations" in data
@@ -246,8 +299,13 @@ class TestLexiconAudit:
         assert data["violations"][0]["count"] == 5
         assert data["computed_at"] == "2026-04-01T12:00:00Z"
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_audit_calls_run_audit(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_audit_calls_run_audit(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Without --events-only, calls run_audit on the workspace."""
         mock_ws = MagicMock()
         mock_ws.run_audit.return_value = MagicMock(
@@ -255,11 +313,16 @@ class TestLexiconAudit:
         )
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(app, ["lexicon", "audit"])
+        cli_runner.invoke(cli_command, ["lexicon", "audit"])
         mock_ws.run_audit.assert_called_once()
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_audit_events_only(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_audit_events_only(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """With --events-only, calls run_audit_events_only."""
         mock_ws = MagicMock()
         mock_ws.run_audit_events_only.return_value = MagicMock(
@@ -267,7 +330,7 @@ class TestLexiconAudit:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "audit", "--events-only"])
+        result = cli_runner.invoke(cli_command, ["lexicon", "audit", "--events-only"])
         assert result.exit_code == 0
         mock_ws.run_audit_events_only.assert_called_once()
 
@@ -280,8 +343,13 @@ class TestLexiconAudit:
 class TestAnomaliesList:
     """Tests for mp lexicon anomalies list."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_returns_json_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_returns_json_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful list returns JSON list of anomalies."""
         mock_ws = MagicMock()
         mock_ws.list_data_volume_anomalies.return_value = [
@@ -304,21 +372,28 @@ class TestAnomaliesList:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "anomalies", "list"])
+        result = cli_runner.invoke(cli_command, ["lexicon", "anomalies", "list"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
         assert len(data) == 2
         assert data[0]["status"] == "open"
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_passes_status_filter(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_passes_status_filter(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Passing --status includes it in query_params."""
         mock_ws = MagicMock()
         mock_ws.list_data_volume_anomalies.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(app, ["lexicon", "anomalies", "list", "--status", "open"])
+        cli_runner.invoke(
+            cli_command, ["lexicon", "anomalies", "list", "--status", "open"]
+        )
         mock_ws.list_data_volume_anomalies.assert_called_once_with(
             query_params={"status": "open"}
         )
@@ -327,8 +402,13 @@ class TestAnomaliesList:
 class TestAnomaliesUpdate:
     """Tests for mp lexicon anomalies update."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful update returns JSON dict."""
         mock_ws = MagicMock()
         mock_ws.update_anomaly.return_value = {
@@ -338,8 +418,8 @@ class TestAnomaliesUpdate:
         }
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lexicon",
                 "anomalies",
@@ -362,8 +442,13 @@ class TestAnomaliesUpdate:
 class TestAnomaliesBulkUpdate:
     """Tests for mp lexicon anomalies bulk-update."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_bulk_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_bulk_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful bulk update returns JSON dict."""
         mock_ws = MagicMock()
         mock_ws.bulk_update_anomalies.return_value = {
@@ -382,22 +467,27 @@ class TestAnomaliesBulkUpdate:
                 "status": "dismissed",
             }
         )
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "anomalies", "bulk-update", "--body", body],
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["updated"] == 3
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_bulk_update_invalid_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_bulk_update_invalid_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --body exits with code 3 (INVALID_ARGS)."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             ["lexicon", "anomalies", "bulk-update", "--body", "not-json"],
         )
         assert result.exit_code == 3
@@ -411,8 +501,13 @@ class TestAnomaliesBulkUpdate:
 class TestDeletionRequestsList:
     """Tests for mp lexicon deletion-requests list."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_returns_json_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_returns_json_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful list returns JSON list of deletion requests."""
         mock_ws = MagicMock()
         mock_ws.list_deletion_requests.return_value = [
@@ -428,7 +523,9 @@ class TestDeletionRequestsList:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "deletion-requests", "list"])
+        result = cli_runner.invoke(
+            cli_command, ["lexicon", "deletion-requests", "list"]
+        )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
@@ -440,8 +537,13 @@ class TestDeletionRequestsList:
 class TestDeletionRequestsCreate:
     """Tests for mp lexicon deletion-requests create."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_create_returns_json_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_create_returns_json_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful create returns JSON list of created requests."""
         mock_ws = MagicMock()
         mock_ws.create_deletion_request.return_value = [
@@ -457,8 +559,8 @@ class TestDeletionRequestsCreate:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lexicon",
                 "deletion-requests",
@@ -477,14 +579,19 @@ class TestDeletionRequestsCreate:
         assert data[0]["eventName"] == "Test"
         assert data[0]["id"] == 42
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_create_with_invalid_filters_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_create_with_invalid_filters_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --filters exits with code 3 (INVALID_ARGS)."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lexicon",
                 "deletion-requests",
@@ -505,8 +612,13 @@ class TestDeletionRequestsCreate:
 class TestDeletionRequestsCancel:
     """Tests for mp lexicon deletion-requests cancel."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_cancel_returns_json_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_cancel_returns_json_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful cancel returns JSON list."""
         mock_ws = MagicMock()
         mock_ws.cancel_deletion_request.return_value = [
@@ -520,28 +632,40 @@ class TestDeletionRequestsCancel:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lexicon", "deletion-requests", "cancel", "42"])
+        result = cli_runner.invoke(
+            cli_command, ["lexicon", "deletion-requests", "cancel", "42"]
+        )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
         assert data[0]["status"] == "cancelled"
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_cancel_passes_id_to_workspace(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_cancel_passes_id_to_workspace(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Request ID is passed as an integer to the workspace method."""
         mock_ws = MagicMock()
         mock_ws.cancel_deletion_request.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(app, ["lexicon", "deletion-requests", "cancel", "42"])
+        cli_runner.invoke(cli_command, ["lexicon", "deletion-requests", "cancel", "42"])
         mock_ws.cancel_deletion_request.assert_called_once_with(request_id=42)
 
 
 class TestDeletionRequestsPreview:
     """Tests for mp lexicon deletion-requests preview."""
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_preview_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_preview_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful preview returns JSON list of matching data."""
         mock_ws = MagicMock()
         mock_ws.preview_deletion_filters.return_value = [
@@ -549,8 +673,8 @@ class TestDeletionRequestsPreview:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lexicon",
                 "deletion-requests",
@@ -569,14 +693,19 @@ class TestDeletionRequestsPreview:
         assert data[0]["eventName"] == "Test"
         assert data[0]["count"] == 150
 
-    @patch("mixpanel_headless.cli.commands.lexicon.get_workspace")
-    def test_preview_with_invalid_filters_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lexicon_mod, "get_workspace")
+    def test_preview_with_invalid_filters_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --filters exits with code 3 (INVALID_ARGS)."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lexicon",
                 "deletion-requests",
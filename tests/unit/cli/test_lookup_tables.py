@@ -17,18 +17,22 @@ import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-import typer.testing
+from click import Command
+from click.testing import CliRunner
 
-from mixpanel_headless.cli.main import app
-
-runner = typer.testing.CliRunner()
+from mixpanel_headless.cli.commands import lookup_tables as lookup_tables_mod
 
 
 class TestLookupTablesList:
     """Tests for mp lookup-tables list."""
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_returns_json_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_returns_json_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful list returns JSON list of lookup tables."""
         mock_ws = MagicMock()
         mock_ws.list_lookup_tables.return_value = [
@@ -42,38 +46,56 @@ class TestLookupTablesList:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lookup-tables", "list"])
+        result = cli_runner.invoke(cli_command, ["lookup-tables", "list"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
         assert data[0]["name"] == "countries"
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_list_with_data_group_id(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_list_with_data_group_id(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """List with --data-group-id passes it to workspace."""
         mock_ws = MagicMock()
         mock_ws.list_lookup_tables.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(app, ["lookup-tables", "list", "--data-group-id", "42"])
+        cli_runner.invoke(
+            cli_command, ["lookup-tables", "list", "--data-group-id", "42"]
+        )
         mock_ws.list_lookup_tables.assert_called_once_with(data_group_id=42)
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_list_without_data_group_id(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_list_without_data_group_id(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """List without --data-group-id passes None."""
         mock_ws = MagicMock()
         mock_ws.list_lookup_tables.return_value = []
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(app, ["lookup-tables", "list"])
+        cli_runner.invoke(cli_command, ["lookup-tables", "list"])
         mock_ws.list_lookup_tables.assert_called_once_with(data_group_id=None)
 
 
 class TestLookupTablesUpload:
     """Tests for mp lookup-tables upload."""
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_upload_returns_json(self, mock_get_ws: MagicMock, tmp_path: Path) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_upload_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        tmp_path: Path,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful upload returns JSON."""
         csv_file = tmp_path / "data.csv"
         csv_file.write_text("id,name\n1,foo\n2,bar\n")
@@ -88,8 +110,8 @@ class TestLookupTablesUpload:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lookup-tables",
                 "upload",
@@ -103,14 +125,19 @@ class TestLookupTablesUpload:
         data = json.loads(result.stdout)
         assert data["name"] == "my-table"
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_upload_missing_file_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_upload_missing_file_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Missing CSV file exits with code 3 (INVALID_ARGS)."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lookup-tables",
                 "upload",
@@ -122,9 +149,13 @@ class TestLookupTablesUpload:
         )
         assert result.exit_code == 3
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
+    @patch.object(lookup_tables_mod, "get_workspace")
     def test_upload_with_data_group_id(
-        self, mock_get_ws: MagicMock, tmp_path: Path
+        self,
+        mock_get_ws: MagicMock,
+        tmp_path: Path,
+        cli_runner: CliRunner,
+        cli_command: Command,
     ) -> None:
         """Upload with --data-group-id includes it in params."""
         csv_file = tmp_path / "data.csv"
@@ -139,8 +170,8 @@ class TestLookupTablesUpload:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lookup-tables",
                 "upload",
@@ -158,8 +189,13 @@ class TestLookupTablesUpload:
 class TestLookupTablesUpdate:
     """Tests for mp lookup-tables update."""
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful update returns JSON."""
         mock_ws = MagicMock()
         mock_ws.update_lookup_table.return_value = MagicMock(
@@ -167,8 +203,8 @@ class TestLookupTablesUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lookup-tables",
                 "update",
@@ -182,8 +218,13 @@ class TestLookupTablesUpdate:
         data = json.loads(result.stdout)
         assert data["name"] == "renamed-table"
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_update_passes_params(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_update_passes_params(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Update passes data_group_id and params to workspace."""
         mock_ws = MagicMock()
         mock_ws.update_lookup_table.return_value = MagicMock(
@@ -191,8 +232,8 @@ class TestLookupTablesUpdate:
         )
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(
-            app,
+        cli_runner.invoke(
+            cli_command,
             [
                 "lookup-tables",
                 "update",
@@ -209,27 +250,37 @@ class TestLookupTablesUpdate:
 class TestLookupTablesDelete:
     """Tests for mp lookup-tables delete."""
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_delete_succeeds(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_delete_succeeds(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful delete exits with code 0."""
         mock_ws = MagicMock()
         mock_ws.delete_lookup_tables.return_value = None
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app, ["lookup-tables", "delete", "--data-group-ids", "1,2,3"]
+        result = cli_runner.invoke(
+            cli_command, ["lookup-tables", "delete", "--data-group-ids", "1,2,3"]
         )
         assert result.exit_code == 0
         mock_ws.delete_lookup_tables.assert_called_once_with([1, 2, 3])
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_delete_invalid_ids_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_delete_invalid_ids_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Non-integer data group IDs exit with code 3."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app, ["lookup-tables", "delete", "--data-group-ids", "abc,def"]
+        result = cli_runner.invoke(
+            cli_command, ["lookup-tables", "delete", "--data-group-ids", "abc,def"]
         )
         assert result.exit_code == 3
 
@@ -237,8 +288,13 @@ class TestLookupTablesDelete:
 class TestLookupTablesUploadUrl:
     """Tests for mp lookup-tables upload-url."""
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_upload_url_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_upload_url_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful upload-url returns JSON with URL info."""
         mock_ws = MagicMock()
         mock_ws.get_lookup_upload_url.return_value = MagicMock(
@@ -250,13 +306,18 @@ class TestLookupTablesUploadUrl:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["lookup-tables", "upload-url"])
+        result = cli_runner.invoke(cli_command, ["lookup-tables", "upload-url"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert "url" in data
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_upload_url_with_content_type(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_upload_url_with_content_type(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Upload-url with --content-type passes it to workspace."""
         mock_ws = MagicMock()
         mock_ws.get_lookup_upload_url.return_value = MagicMock(
@@ -264,8 +325,9 @@ class TestLookupTablesUploadUrl:
         )
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(
-            app, ["lookup-tables", "upload-url", "--content-type", "application/json"]
+        cli_runner.invoke(
+            cli_command,
+            ["lookup-tables", "upload-url", "--content-type", "application/json"],
         )
         mock_ws.get_lookup_upload_url.assert_called_once_with("application/json")
 
@@ -273,29 +335,40 @@ class TestLookupTablesUploadUrl:
 class TestLookupTablesDownload:
     """Tests for mp lookup-tables download."""
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_download_to_stdout(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_download_to_stdout(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Download without --output prints CSV to stdout."""
         mock_ws = MagicMock()
         mock_ws.download_lookup_table.return_value = b"id,name\n1,foo\n2,bar\n"
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app, ["lookup-tables", "download", "--data-group-id", "1"]
+        result = cli_runner.invoke(
+            cli_command, ["lookup-tables", "download", "--data-group-id", "1"]
         )
         assert result.exit_code == 0
         assert "id,name" in result.stdout
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_download_to_file(self, mock_get_ws: MagicMock, tmp_path: Path) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_download_to_file(
+        self,
+        mock_get_ws: MagicMock,
+        tmp_path: Path,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Download with --output writes CSV to file."""
         mock_ws = MagicMock()
         mock_ws.download_lookup_table.return_value = b"id,name\n1,foo\n"
         mock_get_ws.return_value = mock_ws
 
         out_file = tmp_path / "output.csv"
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "lookup-tables",
                 "download",
@@ -309,15 +382,20 @@ class TestLookupTablesDownload:
         assert out_file.exists()
         assert out_file.read_text() == "id,name\n1,foo\n"
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_download_with_options(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_download_with_options(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Download passes file_name and limit to workspace."""
         mock_ws = MagicMock()
         mock_ws.download_lookup_table.return_value = b"data"
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(
-            app,
+        cli_runner.invoke(
+            cli_command,
             [
                 "lookup-tables",
                 "download",
@@ -337,8 +415,13 @@ class TestLookupTablesDownload:
 class TestLookupTablesDownloadUrl:
     """Tests for mp lookup-tables download-url."""
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_download_url_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_download_url_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful download-url returns JSON with url field."""
         mock_ws = MagicMock()
         mock_ws.get_lookup_download_url.return_value = (
@@ -346,19 +429,26 @@ class TestLookupTablesDownloadUrl:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app, ["lookup-tables", "download-url", "--data-group-id", "1"]
+        result = cli_runner.invoke(
+            cli_command, ["lookup-tables", "download-url", "--data-group-id", "1"]
         )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["url"] == "https://storage.example.com/download/abc"
 
-    @patch("mixpanel_headless.cli.commands.lookup_tables.get_workspace")
-    def test_download_url_passes_id(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(lookup_tables_mod, "get_workspace")
+    def test_download_url_passes_id(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Download-url passes data_group_id to workspace."""
         mock_ws = MagicMock()
         mock_ws.get_lookup_download_url.return_value = "https://example.com"
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(app, ["lookup-tables", "download-url", "--data-group-id", "99"])
+        cli_runner.invoke(
+            cli_command, ["lookup-tables", "download-url", "--data-group-id", "99"]
+        )
         mock_ws.get_lookup_download_url.assert_called_once_with(99)
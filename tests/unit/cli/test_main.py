@@ -5,31 +5,30 @@ from __future__ import annotations
 import signal
 
 import pytest
-from typer.testing import CliRunner
+from click import Command
+from click.testing import CliRunner
 
-from mixpanel_headless.cli.main import _handle_interrupt, app
+from mixpanel_headless.cli.main import _handle_interrupt
 from mixpanel_headless.cli.utils import ExitCode
 
 
-@pytest.fixture
-def cli_runner() -> CliRunner:
-    """Create a CLI runner for testing commands."""
-    return CliRunner()
-
-
 class TestVersionCallback:
     """Tests for version callback."""
 
-    def test_version_flag_shows_version(self, cli_runner: CliRunner) -> None:
+    def test_version_flag_shows_version(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Test that --version shows version and exits."""
-        result = cli_runner.invoke(app, ["--version"])
+        result = cli_runner.invoke(cli_command, ["--version"])
 
         assert result.exit_code == 0
         assert "mp version" in result.stdout
 
-    def test_version_flag_with_command(self, cli_runner: CliRunner) -> None:
+    def test_version_flag_with_command(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Test that --version takes precedence over commands."""
-        result = cli_runner.invoke(app, ["--version", "auth", "list"])
+        result = cli_runner.invoke(cli_command, ["--version", "auth", "list"])
 
         assert result.exit_code == 0
         assert "mp version" in result.stdout
@@ -60,18 +59,22 @@ class TestInterruptHandler:
 class TestMainCallback:
     """Tests for main callback and context setup."""
 
-    def test_no_args_shows_help(self, cli_runner: CliRunner) -> None:
+    def test_no_args_shows_help(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Test that no arguments shows help (exit code 2 per Typer convention)."""
-        result = cli_runner.invoke(app, [])
+        result = cli_runner.invoke(cli_command, [])
 
         # Typer returns exit code 2 when no_args_is_help=True and no args provided
         assert result.exit_code == 2
         # Help goes to output (combined stdout/stderr) when exit_code=2
         assert "Usage:" in result.output or "usage:" in result.output.lower()
 
-    def test_help_flag_shows_help(self, cli_runner: CliRunner) -> None:
+    def test_help_flag_shows_help(
+        self, cli_runner: CliRunner, cli_command: Command
+    ) -> None:
         """Test that --help shows help."""
-        result = cli_runner.invoke(app, ["--help"])
+        result = cli_runner.invoke(cli_command, ["--help"])
 
         assert result.exit_code == 0
         assert "Mixpanel data CLI" in result.stdout
@@ -15,12 +15,10 @@ from __future__ import annotations
 import json
 from unittest.mock import MagicMock, patch
 
-import typer.testing
-
-from mixpanel_headless.cli.main import app
-
-runner = typer.testing.CliRunner()
+from click import Command
+from click.testing import CliRunner
 
+from mixpanel_headless.cli.commands import schemas as schemas_mod
 
 # =============================================================================
 # List
@@ -30,8 +28,13 @@ runner = typer.testing.CliRunner()
 class TestSchemasList:
     """Tests for mp schemas list."""
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_returns_json_list(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_returns_json_list(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful list returns JSON list of schema entries."""
         mock_ws = MagicMock()
         mock_ws.list_schema_registry.return_value = [
@@ -52,7 +55,7 @@ class TestSchemasList:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["schemas", "list"])
+        result = cli_runner.invoke(cli_command, ["schemas", "list"])
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
@@ -60,8 +63,13 @@ class TestSchemasList:
         assert data[0]["name"] == "Purchase"
         assert data[1]["name"] == "Signup"
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_with_entity_type_filter(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_with_entity_type_filter(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Passing --entity-type filters by entity type."""
         mock_ws = MagicMock()
         mock_ws.list_schema_registry.return_value = [
@@ -74,7 +82,9 @@ class TestSchemasList:
         ]
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["schemas", "list", "--entity-type", "event"])
+        result = cli_runner.invoke(
+            cli_command, ["schemas", "list", "--entity-type", "event"]
+        )
         assert result.exit_code == 0
         mock_ws.list_schema_registry.assert_called_once_with(entity_type="event")
 
@@ -87,8 +97,13 @@ class TestSchemasList:
 class TestSchemasCreate:
     """Tests for mp schemas create."""
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_create_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_create_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful create returns the created schema as JSON."""
         mock_ws = MagicMock()
         mock_ws.create_schema.return_value = {
@@ -99,8 +114,8 @@ class TestSchemasCreate:
         mock_get_ws.return_value = mock_ws
 
         schema = json.dumps({"properties": {"amount": {"type": "number"}}})
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "schemas",
                 "create",
@@ -117,16 +132,21 @@ class TestSchemasCreate:
         assert data["name"] == "Purchase"
         assert data["entityType"] == "event"
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_create_passes_args_to_workspace(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_create_passes_args_to_workspace(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Arguments are passed correctly to the workspace method."""
         mock_ws = MagicMock()
         mock_ws.create_schema.return_value = {}
         mock_get_ws.return_value = mock_ws
 
         schema_dict = {"properties": {"plan": {"type": "string"}}}
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "schemas",
                 "create",
@@ -141,14 +161,19 @@ class TestSchemasCreate:
         assert result.exit_code == 0
         mock_ws.create_schema.assert_called_once_with("user", "Profile", schema_dict)
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_create_invalid_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_create_invalid_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --schema-json exits with code 3 (INVALID_ARGS)."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "schemas",
                 "create",
@@ -171,8 +196,13 @@ class TestSchemasCreate:
 class TestSchemasCreateBulk:
     """Tests for mp schemas create-bulk."""
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_create_bulk_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_create_bulk_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful bulk create returns JSON with added/deleted counts."""
         mock_ws = MagicMock()
         mock_ws.create_schemas_bulk.return_value = MagicMock(
@@ -194,19 +224,28 @@ class TestSchemasCreateBulk:
                 },
             ]
         )
-        result = runner.invoke(app, ["schemas", "create-bulk", "--entries", entries])
+        result = cli_runner.invoke(
+            cli_command, ["schemas", "create-bulk", "--entries", entries]
+        )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert data["added"] == 2
         assert data["deleted"] == 0
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_create_bulk_invalid_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_create_bulk_invalid_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --entries exits with code 3 (INVALID_ARGS)."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["schemas", "create-bulk", "--entries", "{bad"])
+        result = cli_runner.invoke(
+            cli_command, ["schemas", "create-bulk", "--entries", "{bad"]
+        )
         assert result.exit_code == 3
 
 
@@ -218,8 +257,13 @@ class TestSchemasCreateBulk:
 class TestSchemasUpdate:
     """Tests for mp schemas update."""
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_update_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_update_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful update returns the updated schema as JSON."""
         mock_ws = MagicMock()
         mock_ws.update_schema.return_value = {
@@ -230,8 +274,8 @@ class TestSchemasUpdate:
         mock_get_ws.return_value = mock_ws
 
         schema = json.dumps({"properties": {"amount": {"type": "number"}}})
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "schemas",
                 "update",
@@ -247,16 +291,21 @@ class TestSchemasUpdate:
         data = json.loads(result.stdout)
         assert data["name"] == "Purchase"
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_update_passes_args_to_workspace(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_update_passes_args_to_workspace(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Arguments are passed correctly to the workspace method."""
         mock_ws = MagicMock()
         mock_ws.update_schema.return_value = {}
         mock_get_ws.return_value = mock_ws
 
         schema_dict = {"description": "Updated"}
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "schemas",
                 "update",
@@ -271,14 +320,19 @@ class TestSchemasUpdate:
         assert result.exit_code == 0
         mock_ws.update_schema.assert_called_once_with("event", "Purchase", schema_dict)
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_update_invalid_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_update_invalid_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --schema-json exits with code 3 (INVALID_ARGS)."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "schemas",
                 "update",
@@ -301,8 +355,13 @@ class TestSchemasUpdate:
 class TestSchemasUpdateBulk:
     """Tests for mp schemas update-bulk."""
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_update_bulk_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_update_bulk_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful bulk update returns JSON list of updated entries."""
         mock_ws = MagicMock()
         mock_ws.update_schemas_bulk.return_value = [
@@ -325,20 +384,29 @@ class TestSchemasUpdateBulk:
                 },
             ]
         )
-        result = runner.invoke(app, ["schemas", "update-bulk", "--entries", entries])
+        result = cli_runner.invoke(
+            cli_command, ["schemas", "update-bulk", "--entries", entries]
+        )
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert isinstance(data, list)
         assert len(data) == 1
         assert data[0]["name"] == "Purchase"
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_update_bulk_invalid_json_exits_3(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_update_bulk_invalid_json_exits_3(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Invalid JSON for --entries exits with code 3 (INVALID_ARGS)."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["schemas", "update-bulk", "--entries", "not-json"])
+        result = cli_runner.invoke(
+            cli_command, ["schemas", "update-bulk", "--entries", "not-json"]
+        )
         assert result.exit_code == 3
 
 
@@ -350,8 +418,13 @@ class TestSchemasUpdateBulk:
 class TestSchemasDelete:
     """Tests for mp schemas delete."""
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_delete_returns_json(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_delete_returns_json(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Successful delete returns JSON with deleteCount."""
         mock_ws = MagicMock()
         mock_ws.delete_schemas.return_value = MagicMock(
@@ -359,8 +432,8 @@ class TestSchemasDelete:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(
-            app,
+        result = cli_runner.invoke(
+            cli_command,
             [
                 "schemas",
                 "delete",
@@ -374,8 +447,13 @@ class TestSchemasDelete:
         data = json.loads(result.stdout)
         assert data["deleteCount"] == 1
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_delete_passes_filters_to_workspace(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_delete_passes_filters_to_workspace(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Entity type and name filters are passed to the workspace method."""
         mock_ws = MagicMock()
         mock_ws.delete_schemas.return_value = MagicMock(
@@ -383,8 +461,8 @@ class TestSchemasDelete:
         )
         mock_get_ws.return_value = mock_ws
 
-        runner.invoke(
-            app,
+        cli_runner.invoke(
+            cli_command,
             [
                 "schemas",
                 "delete",
@@ -398,8 +476,13 @@ class TestSchemasDelete:
             entity_type="event", entity_name="Purchase"
         )
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_delete_without_filters_confirms(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_delete_without_filters_confirms(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Delete without filters prompts for confirmation and proceeds on 'y'."""
         mock_ws = MagicMock()
         mock_ws.delete_schemas.return_value = MagicMock(
@@ -407,18 +490,23 @@ class TestSchemasDelete:
         )
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["schemas", "delete"], input="y\n")
+        result = cli_runner.invoke(cli_command, ["schemas", "delete"], input="y\n")
         assert result.exit_code == 0
         mock_ws.delete_schemas.assert_called_once_with(
             entity_type=None, entity_name=None
         )
 
-    @patch("mixpanel_headless.cli.commands.schemas.get_workspace")
-    def test_delete_without_filters_aborts(self, mock_get_ws: MagicMock) -> None:
+    @patch.object(schemas_mod, "get_workspace")
+    def test_delete_without_filters_aborts(
+        self,
+        mock_get_ws: MagicMock,
+        cli_runner: CliRunner,
+        cli_command: Command,
+    ) -> None:
         """Delete without filters aborts on 'n'."""
         mock_ws = MagicMock()
         mock_get_ws.return_value = mock_ws
 
-        result = runner.invoke(app, ["schemas", "delete"], input="n\n")
+        result = cli_runner.invoke(cli_command, ["schemas", "delete"], input="n\n")
         assert result.exit_code != 0
         mock_ws.delete_schemas.assert_not_called()
@@ -22,8 +22,9 @@ from pathlib import Path
 from typing import Any
 
 import pytest
+from click import Command
+from click.testing import CliRunner
 from pydantic import SecretStr, TypeAdapter, ValidationError
-from typer.testing import CliRunner
 
 from mixpanel_headless._internal.auth.account import (
     Account,
@@ -40,7 +41,6 @@ from mixpanel_headless._internal.auth.session import (
 )
 from mixpanel_headless._internal.auth.token_resolver import OnDiskTokenResolver
 from mixpanel_headless._internal.config import ConfigManager
-from mixpanel_headless.cli.main import app
 from mixpanel_headless.cli.utils import ExitCode
 from mixpanel_headless.exceptions import ConfigError, OAuthError
 
@@ -523,12 +523,6 @@ class TestConfigManagerEdgeCases:
 # =============================================================================
 
 
-@pytest.fixture
-def cli_runner() -> CliRunner:
-    """A Typer CLI runner for invoking the `mp` app in-process."""
-    return CliRunner()
-
-
 @pytest.fixture(autouse=True)
 def _isolated_home_for_cli(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Isolate $HOME, MP_CONFIG_PATH, and MP_OAUTH_STORAGE_DIR for hermetic tests.
@@ -551,11 +545,11 @@ class TestCliExitCodes:
     """CLI subcommands return the documented ExitCode constants."""
 
     def test_account_add_invalid_region_returns_invalid_args(
-        self, cli_runner: CliRunner
+        self, cli_runner: CliRunner, cli_command: Command
     ) -> None:
         """``mp account add ... --region magic`` exits ExitCode.INVALID_ARGS."""
         result = cli_runner.invoke(
-            app,
+            cli_command,
             [
                 "account",
                 "add",
@@ -571,11 +565,11 @@ class TestCliExitCodes:
         assert result.exit_code == int(ExitCode.INVALID_ARGS)
 
     def test_account_add_invalid_type_returns_invalid_args(
-        self, cli_runner: CliRunner
+        self, cli_runner: CliRunner, cli_command: Command
     ) -> None:
         """``mp account add ... --type magic`` exits ExitCode.INVALID_ARGS."""
         result = cli_runner.invoke(
-            app,
+            cli_command,
             [
                 "account",
                 "add",
@@ -591,11 +585,11 @@ class TestCliExitCodes:
         assert result.exit_code == int(ExitCode.INVALID_ARGS)
 
     def test_account_add_sa_no_secret_returns_invalid_args(
-        self, cli_runner: CliRunner
+        self, cli_runner: CliRunner, cli_command: Command
     ) -> None:
         """SA without --secret-stdin and without MP_SECRET env exits INVALID_ARGS."""
         result = cli_runner.invoke(
-            app,
+            cli_command,
             [
                 "account",
                 "add",
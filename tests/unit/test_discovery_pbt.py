@@ -8,14 +8,21 @@ Properties tested:
 - _parse_lexicon_property: Type default invariant, metadata propagation
 - _parse_lexicon_schema: Field preservation invariants
 - _parse_bookmark_info: Required field preservation invariants
+
+The parser properties overlap heavily (several drive the same input
+strategy), so they run 50 examples each with no per-example deadline.
+Field-level invariants for metadata and bookmarks are checked over
+fixed-size batches of inputs per example instead.
 """
 
 from __future__ import annotations
 
 import json
 import warnings as _warnings
+from datetime import datetime
 from typing import Any, get_args
 
+import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 
@@ -33,33 +40,38 @@ from mixpanel_headless.types import BookmarkType
 # Custom Strategies
 # =============================================================================
 
+# Short printable-ASCII text. The parsers only copy strings through, so the
+# full Unicode range adds generation and shrinking cost without exercising
+# anything new; the schema entity_type/name properties keep full text since
+# they assert exact preservation.
+ascii_text = st.text(
+    alphabet=st.characters(min_codepoint=32, max_codepoint=126), max_size=32
+)
+
 # Strategy for JSON-serializable primitive values
 json_primitives = st.one_of(
     st.none(),
     st.booleans(),
     st.integers(),
     st.floats(allow_nan=False, allow_infinity=False),
-    st.text(),
+    ascii_text,
 )
 
 # Strategy for JSON-serializable values (recursive: primitives, lists, dicts)
 json_values: st.SearchStrategy[Any] = st.recursive(
     json_primitives,
     lambda children: st.one_of(
-        st.lists(children, max_size=5),
-        st.dictionaries(st.text(), children, max_size=5),
+        st.lists(children, max_size=3),
+        st.dictionaries(ascii_text, children, max_size=3),
     ),
-    max_leaves=15,
+    max_leaves=6,
 )
 
-# Strategy for arbitrary dictionaries (what API might return)
-arbitrary_dicts = st.dictionaries(st.text(), json_values, max_size=10)
-
 # Strategy for valid bookmark types
 bookmark_types = st.sampled_from(get_args(BookmarkType))
 
 # Strategy for timestamps in ISO format
-iso_timestamps = st.datetimes().map(lambda dt: dt.isoformat())
+iso_timestamps = st.datetimes().map(datetime.isoformat)
 
 
 # =============================================================================
@@ -67,40 +79,37 @@ iso_timestamps = st.datetimes().map(lambda dt: dt.isoformat())
 # =============================================================================
 
 
-@st.composite
-def com_mixpanel_headless(draw: st.DrawFn) -> dict[str, Any]:
-    """Generate com.mixpanel metadata as returned by Mixpanel API.
-
-    The API returns metadata in this format:
-    {
-        "$source": "api",
-        "displayName": "Event Name",
-        "tags": ["tag1", "tag2"],
-        "hidden": false,
-        "dropped": false,
-        "contacts": ["email@example.com"],
-        "teamContacts": ["team"]
-    }
-    """
-    result: dict[str, Any] = {}
-
-    # All fields are optional
-    if draw(st.booleans()):
-        result["$source"] = draw(st.text())
-    if draw(st.booleans()):
-        result["displayName"] = draw(st.text())
-    if draw(st.booleans()):
-        result["tags"] = draw(st.lists(st.text(), max_size=5))
-    if draw(st.booleans()):
-        result["hidden"] = draw(st.booleans())
-    if draw(st.booleans()):
-        result["dropped"] = draw(st.booleans())
-    if draw(st.booleans()):
-        result["contacts"] = draw(st.lists(st.text(), max_size=5))
-    if draw(st.booleans()):
-        result["teamContacts"] = draw(st.lists(st.text(), max_size=5))
+# Strategy for com.mixpanel metadata as returned by Mixpanel API.
+#
+# The API returns metadata in this format (every field is optional):
+# {
+#     "$source": "api",
+#     "displayName": "Event Name",
+#     "tags": ["tag1", "tag2"],
+#     "hidden": false,
+#     "dropped": false,
+#     "contacts": ["email@example.com"],
+#     "teamContacts": ["team"]
+# }
+com_mixpanel_headless: st.SearchStrategy[dict[str, Any]] = st.fixed_dictionaries(
+    {},
+    optional={
+        "$source": ascii_text,
+        "displayName": ascii_text,
+        "tags": st.lists(ascii_text, max_size=5),
+        "hidden": st.booleans(),
+        "dropped": st.booleans(),
+        "contacts": st.lists(ascii_text, max_size=5),
+        "teamContacts": st.lists(ascii_text, max_size=5),
+    },
+)
 
-    return result
+# Extra top-level keys that may sit beside com.mixpanel in a metadata dict.
+_metadata_extras = st.dictionaries(
+    ascii_text.filter(lambda s: s != "com.mixpanel"),
+    json_values,
+    max_size=3,
+)
 
 
 @st.composite
@@ -119,85 +128,67 @@ def lexicon_metadata_input(draw: st.DrawFn) -> dict[str, Any] | None:
         # Dict without com.mixpanel key
         return draw(
             st.dictionaries(
-                st.text().filter(lambda s: s != "com.mixpanel"),
+                ascii_text.filter(lambda s: s != "com.mixpanel"),
                 json_values,
                 max_size=5,
             )
         )
     else:
         # Dict with com.mixpanel key
-        mp_data = draw(com_mixpanel_headless())
-        other_data = draw(
-            st.dictionaries(
-                st.text().filter(lambda s: s != "com.mixpanel"),
-                json_values,
-                max_size=3,
-            )
-        )
+        mp_data = draw(com_mixpanel_headless)
+        other_data = draw(_metadata_extras)
         return {"com.mixpanel": mp_data, **other_data}
 
 
+_lexicon_metadata = lexicon_metadata_input()
+
+
 @st.composite
 def valid_lexicon_metadata_input(draw: st.DrawFn) -> dict[str, Any]:
     """Generate input that will produce a non-None LexiconMetadata.
 
     Must have 'com.mixpanel' key with non-empty content.
     """
-    mp_data = draw(com_mixpanel_headless())
+    mp_data = draw(com_mixpanel_headless)
     # Ensure at least one field is present
     if not mp_data:
-        mp_data["displayName"] = draw(st.text())
+        mp_data["displayName"] = draw(ascii_text)
 
-    other_data = draw(
-        st.dictionaries(
-            st.text().filter(lambda s: s != "com.mixpanel"),
-            json_values,
-            max_size=3,
-        )
-    )
+    other_data = draw(_metadata_extras)
     return {"com.mixpanel": mp_data, **other_data}
 
 
-@st.composite
-def lexicon_property_input(draw: st.DrawFn) -> dict[str, Any]:
-    """Generate input for _parse_lexicon_property.
-
-    The API returns property definitions in this format:
-    {
-        "type": "string",
-        "description": "Property description",
-        "metadata": {"com.mixpanel": {...}}
-    }
-    """
-    result: dict[str, Any] = {}
-
-    # type is optional (defaults to "string")
-    if draw(st.booleans()):
-        result["type"] = draw(
-            st.sampled_from(
+# Built once and shared by every strategy that embeds valid metadata.
+_valid_lexicon_metadata = valid_lexicon_metadata_input()
+
+
+# Strategy for _parse_lexicon_property input.
+#
+# The API returns property definitions in this format (every field is
+# optional; ``type`` defaults to "string"), possibly alongside extra keys:
+# {
+#     "type": "string",
+#     "description": "Property description",
+#     "metadata": {"com.mixpanel": {...}}
+# }
+lexicon_property_input: st.SearchStrategy[dict[str, Any]] = st.builds(
+    lambda known, extra: {**known, **extra},
+    st.fixed_dictionaries(
+        {},
+        optional={
+            "type": st.sampled_from(
                 ["string", "number", "boolean", "array", "object", "integer", "null"]
-            )
-        )
-
-    # description is optional
-    if draw(st.booleans()):
-        result["description"] = draw(st.text())
-
-    # metadata is optional
-    if draw(st.booleans()):
-        result["metadata"] = draw(valid_lexicon_metadata_input())
-
-    # Extra fields that might be present
-    extra = draw(
-        st.dictionaries(
-            st.text().filter(lambda s: s not in ("type", "description", "metadata")),
-            json_values,
-            max_size=3,
-        )
-    )
-    result.update(extra)
-
-    return result
+            ),
+            "description": ascii_text,
+            "metadata": _valid_lexicon_metadata,
+        },
+    ),
+    st.dictionaries(
+        ascii_text.filter(lambda s: s not in ("type", "description", "metadata")),
+        json_values,
+        max_size=3,
+    ),
+)
 
 
 @st.composite
@@ -221,18 +212,18 @@ def lexicon_schema_input(draw: st.DrawFn) -> dict[str, Any]:
     # schemaJson structure
     schema_json: dict[str, Any] = {}
     if draw(st.booleans()):
-        schema_json["description"] = draw(st.text())
+        schema_json["description"] = draw(ascii_text)
 
     # properties dict
     num_props = draw(st.integers(min_value=0, max_value=5))
     properties = {
-        draw(st.text(min_size=1)): draw(lexicon_property_input())
+        draw(ascii_text.filter(bool)): draw(lexicon_property_input)
         for _ in range(num_props)
     }
     schema_json["properties"] = properties
 
     if draw(st.booleans()):
-        schema_json["metadata"] = draw(valid_lexicon_metadata_input())
+        schema_json["metadata"] = draw(_valid_lexicon_metadata)
 
     return {
         "entityType": entity_type,
@@ -241,48 +232,43 @@ def lexicon_schema_input(draw: st.DrawFn) -> dict[str, Any]:
     }
 
 
-@st.composite
-def bookmark_info_input(draw: st.DrawFn) -> dict[str, Any]:
-    """Generate input for _parse_bookmark_info.
-
-    The API returns bookmarks in this format:
+_lexicon_schema = lexicon_schema_input()
+
+
+# Strategy for _parse_bookmark_info input.
+#
+# The API returns bookmarks in this format (workspace_id, dashboard_id,
+# description, creator_id, and creator_name are optional):
+# {
+#     "id": 12345,
+#     "name": "Report Name",
+#     "type": "insights",
+#     "project_id": 67890,
+#     "created": "2024-01-15T10:30:00",
+#     "modified": "2024-01-15T10:30:00",
+#     "workspace_id": 111,
+#     "dashboard_id": 222,
+#     "description": "...",
+#     "creator_id": 333,
+#     "creator_name": "User Name"
+# }
+bookmark_info_input: st.SearchStrategy[dict[str, Any]] = st.fixed_dictionaries(
     {
-        "id": 12345,
-        "name": "Report Name",
-        "type": "insights",
-        "project_id": 67890,
-        "created": "2024-01-15T10:30:00",
-        "modified": "2024-01-15T10:30:00",
-        "workspace_id": 111,
-        "dashboard_id": 222,
-        "description": "...",
-        "creator_id": 333,
-        "creator_name": "User Name"
-    }
-    """
-    # Required fields
-    result: dict[str, Any] = {
-        "id": draw(st.integers()),
-        "name": draw(st.text()),
-        "type": draw(bookmark_types),
-        "project_id": draw(st.integers()),
-        "created": draw(iso_timestamps),
-        "modified": draw(iso_timestamps),
-    }
-
-    # Optional fields
-    if draw(st.booleans()):
-        result["workspace_id"] = draw(st.integers())
-    if draw(st.booleans()):
-        result["dashboard_id"] = draw(st.integers())
-    if draw(st.booleans()):
-        result["description"] = draw(st.text())
-    if draw(st.booleans()):
-        result["creator_id"] = draw(st.integers())
-    if draw(st.booleans()):
-        result["creator_name"] = draw(st.text())
-
-    return result
+        "id": st.integers(),
+        "name": ascii_text,
+        "type": bookmark_types,
+        "project_id": st.integers(),
+        "created": iso_timestamps,
+        "modified": iso_timestamps,
+    },
+    optional={
+        "workspace_id": st.integers(),
+        "dashboard_id": st.integers(),
+        "description": ascii_text,
+        "creator_id": st.integers(),
+        "creator_name": ascii_text,
+    },
+)
 
 
 # =============================================================================
@@ -290,6 +276,7 @@ def bookmark_info_input(draw: st.DrawFn) -> dict[str, Any]:
 # =============================================================================
 
 
+@pytest.mark.xdist_group("discovery_pbt")
 class TestParseLexiconMetadataProperties:
     """Property-based tests for _parse_lexicon_metadata function.
 
@@ -300,8 +287,8 @@ class TestParseLexiconMetadataProperties:
     3. Apply correct defaults for missing fields
     """
 
-    @given(data=lexicon_metadata_input())
-    @settings(max_examples=100)
+    @given(data=_lexicon_metadata)
+    @settings(max_examples=50, deadline=None)
     def test_null_handling_invariant(self, data: dict[str, Any] | None) -> None:
         """_parse_lexicon_metadata returns None if and only if input lacks valid com.mixpanel.
 
@@ -315,10 +302,7 @@ class TestParseLexiconMetadataProperties:
 
         # Determine if input should produce None
         should_be_none = (
-            data is None
-            or data == {}
-            or "com.mixpanel" not in data
-            or not data.get("com.mixpanel")  # empty dict
+            not data or "com.mixpanel" not in data or not data["com.mixpanel"]
         )
 
         if should_be_none:
@@ -328,10 +312,10 @@ class TestParseLexiconMetadataProperties:
                 f"Expected LexiconMetadata for input {data!r}, got None"
             )
 
-    @given(data=valid_lexicon_metadata_input())
-    @settings(max_examples=100)
-    def test_field_defaults_applied(self, data: dict[str, Any]) -> None:
-        """_parse_lexicon_metadata applies correct defaults for missing fields.
+    @given(batch=st.lists(_valid_lexicon_metadata, min_size=8, max_size=8))
+    @settings(max_examples=20, deadline=None)
+    def test_field_invariants_batched(self, batch: list[dict[str, Any]]) -> None:
+        """_parse_lexicon_metadata applies defaults and preserves present values.
 
         When parsing valid input, missing fields should receive defaults:
         - tags: []
@@ -340,44 +324,25 @@ class TestParseLexiconMetadataProperties:
         - contacts: []
         - team_contacts: []
 
-        Args:
-            data: Valid input with com.mixpanel key.
-        """
-        result = _parse_lexicon_metadata(data)
-        assert result is not None
-
-        mp_data = data["com.mixpanel"]
-
-        # Verify defaults are applied for missing fields
-        assert result.tags == mp_data.get("tags", [])
-        assert result.hidden == mp_data.get("hidden", False)
-        assert result.dropped == mp_data.get("dropped", False)
-        assert result.contacts == mp_data.get("contacts", [])
-        assert result.team_contacts == mp_data.get("teamContacts", [])
-
-    @given(data=valid_lexicon_metadata_input())
-    def test_field_extraction_preserves_values(self, data: dict[str, Any]) -> None:
-        """_parse_lexicon_metadata preserves field values when present.
+        Fields present in the input are preserved as-is. Inputs are drawn in
+        batches of eight so Hypothesis' per-example overhead is shared.
 
         Args:
-            data: Valid input with com.mixpanel key.
+            batch: Valid inputs with com.mixpanel key.
         """
-        result = _parse_lexicon_metadata(data)
-        assert result is not None
+        for data in batch:
+            result = _parse_lexicon_metadata(data)
+            assert result is not None
 
-        mp_data = data["com.mixpanel"]
+            mp_data = data["com.mixpanel"]
 
-        # Values should match input when present
-        if "$source" in mp_data:
-            assert result.source == mp_data["$source"]
-        if "displayName" in mp_data:
-            assert result.display_name == mp_data["displayName"]
-        if "tags" in mp_data:
-            assert result.tags == mp_data["tags"]
-        if "hidden" in mp_data:
-            assert result.hidden == mp_data["hidden"]
-        if "dropped" in mp_data:
-            assert result.dropped == mp_data["dropped"]
+            assert result.source == mp_data.get("$source")
+            assert result.display_name == mp_data.get("displayName")
+            assert result.tags == mp_data.get("tags", [])
+            assert result.hidden == mp_data.get("hidden", False)
+            assert result.dropped == mp_data.get("dropped", False)
+            assert result.contacts == mp_data.get("contacts", [])
+            assert result.team_contacts == mp_data.get("teamContacts", [])
 
 
 # =============================================================================
@@ -385,6 +350,7 @@ class TestParseLexiconMetadataProperties:
 # =============================================================================
 
 
+@pytest.mark.xdist_group("discovery_pbt")
 class TestParseLexiconPropertyProperties:
     """Property-based tests for _parse_lexicon_property function.
 
@@ -395,8 +361,8 @@ class TestParseLexiconPropertyProperties:
     3. Propagate metadata when present
     """
 
-    @given(data=lexicon_property_input())
-    @settings(max_examples=100)
+    @given(data=lexicon_property_input)
+    @settings(max_examples=50, deadline=None)
     def test_always_returns_lexicon_property(self, data: dict[str, Any]) -> None:
         """_parse_lexicon_property always returns a valid LexiconProperty.
 
@@ -411,8 +377,8 @@ class TestParseLexiconPropertyProperties:
         assert hasattr(result, "description")
         assert hasattr(result, "metadata")
 
-    @given(data=lexicon_property_input())
-    @settings(max_examples=100)
+    @given(data=lexicon_property_input)
+    @settings(max_examples=50, deadline=None)
     def test_type_default_invariant(self, data: dict[str, Any]) -> None:
         """_parse_lexicon_property defaults type to "string" when not specified.
 
@@ -434,7 +400,8 @@ class TestParseLexiconPropertyProperties:
                 f"Type should default to 'string', got {result.type!r}"
             )
 
-    @given(data=lexicon_property_input())
+    @given(data=lexicon_property_input)
+    @settings(max_examples=50, deadline=None)
     def test_description_preserved(self, data: dict[str, Any]) -> None:
         """_parse_lexicon_property preserves description when present.
 
@@ -454,6 +421,7 @@ class TestParseLexiconPropertyProperties:
 # =============================================================================
 
 
+@pytest.mark.xdist_group("discovery_pbt")
 class TestParseLexiconSchemaProperties:
     """Property-based tests for _parse_lexicon_schema function.
 
@@ -464,8 +432,8 @@ class TestParseLexiconSchemaProperties:
     3. Parse nested schemaJson correctly
     """
 
-    @given(data=lexicon_schema_input())
-    @settings(max_examples=100)
+    @given(data=_lexicon_schema)
+    @settings(max_examples=50, deadline=None)
     def test_entity_type_preserved_exactly(self, data: dict[str, Any]) -> None:
         """_parse_lexicon_schema preserves entity_type without modification.
 
@@ -482,8 +450,8 @@ class TestParseLexiconSchemaProperties:
             f"expected {data['entityType']!r}, got {result.entity_type!r}"
         )
 
-    @given(data=lexicon_schema_input())
-    @settings(max_examples=100)
+    @given(data=_lexicon_schema)
+    @settings(max_examples=50, deadline=None)
     def test_name_preserved_exactly(self, data: dict[str, Any]) -> None:
         """_parse_lexicon_schema preserves name without modification.
 
@@ -500,7 +468,8 @@ class TestParseLexiconSchemaProperties:
             f"expected {data['name']!r}, got {result.name!r}"
         )
 
-    @given(data=lexicon_schema_input())
+    @given(data=_lexicon_schema)
+    @settings(max_examples=50, deadline=None)
     def test_properties_count_preserved(self, data: dict[str, Any]) -> None:
         """_parse_lexicon_schema preserves the number of properties.
 
@@ -523,6 +492,7 @@ class TestParseLexiconSchemaProperties:
 # =============================================================================
 
 
+@pytest.mark.xdist_group("discovery_pbt")
 class TestParseBookmarkInfoProperties:
     """Property-based tests for _parse_bookmark_info function.
 
@@ -532,83 +502,40 @@ class TestParseBookmarkInfoProperties:
     2. Handle optional fields correctly (None when missing)
     """
 
-    @given(data=bookmark_info_input())
-    @settings(max_examples=100)
-    def test_required_fields_preserved_exactly(self, data: dict[str, Any]) -> None:
-        """_parse_bookmark_info preserves required fields without modification.
+    @given(batch=st.lists(bookmark_info_input, min_size=8, max_size=8))
+    @settings(max_examples=20, deadline=None)
+    def test_bookmark_invariants_batched(self, batch: list[dict[str, Any]]) -> None:
+        """_parse_bookmark_info preserves required fields and defaults optionals.
 
-        These fields are used for identification and display, so any
-        transformation would cause incorrect behavior.
+        Required fields are used for identification and display, so any
+        transformation would cause incorrect behavior. Optional fields should
+        be None when not present in input, and preserved when present.
+        Inputs are drawn in batches of eight so Hypothesis' per-example
+        overhead is shared.
 
         Args:
-            data: Bookmark data with all required fields.
+            batch: Bookmark data with all required and some optional fields.
         """
-        result = _parse_bookmark_info(data)
-
-        assert result.id == data["id"], (
-            f"id must be preserved: expected {data['id']}, got {result.id}"
-        )
-        assert result.name == data["name"], (
-            f"name must be preserved: expected {data['name']!r}, got {result.name!r}"
-        )
-        assert result.type == data["type"], (
-            f"type must be preserved: expected {data['type']!r}, got {result.type!r}"
-        )
-        assert result.project_id == data["project_id"], (
-            f"project_id must be preserved: "
-            f"expected {data['project_id']}, got {result.project_id}"
-        )
-        assert result.created == data["created"], (
-            f"created must be preserved: "
-            f"expected {data['created']!r}, got {result.created!r}"
-        )
-        assert result.modified == data["modified"], (
-            f"modified must be preserved: "
-            f"expected {data['modified']!r}, got {result.modified!r}"
-        )
-
-    @given(data=bookmark_info_input())
-    @settings(max_examples=100)
-    def test_optional_fields_handled_correctly(self, data: dict[str, Any]) -> None:
-        """_parse_bookmark_info returns None for missing optional fields.
-
-        Optional fields should be None when not present in input,
-        and preserved when present.
-
-        Args:
-            data: Bookmark data with optional fields.
-        """
-        result = _parse_bookmark_info(data)
-
-        # workspace_id
-        if "workspace_id" in data:
-            assert result.workspace_id == data["workspace_id"]
-        else:
-            assert result.workspace_id is None
-
-        # dashboard_id
-        if "dashboard_id" in data:
-            assert result.dashboard_id == data["dashboard_id"]
-        else:
-            assert result.dashboard_id is None
-
-        # description
-        if "description" in data:
-            assert result.description == data["description"]
-        else:
-            assert result.description is None
-
-        # creator_id
-        if "creator_id" in data:
-            assert result.creator_id == data["creator_id"]
-        else:
-            assert result.creator_id is None
-
-        # creator_name
-        if "creator_name" in data:
-            assert result.creator_name == data["creator_name"]
-        else:
-            assert result.creator_name is None
+        for data in batch:
+            result = _parse_bookmark_info(data)
+
+            for field in ("id", "name", "type", "project_id", "created", "modified"):
+                assert getattr(result, field) == data[field], (
+                    f"{field} must be preserved: "
+                    f"expected {data[field]!r}, got {getattr(result, field)!r}"
+                )
+
+            for field in (
+                "workspace_id",
+                "dashboard_id",
+                "description",
+                "creator_id",
+                "creator_name",
+            ):
+                assert getattr(result, field) == data.get(field), (
+                    f"{field} should be {data.get(field)!r}, "
+                    f"got {getattr(result, field)!r}"
+                )
 
 
 # =============================================================================
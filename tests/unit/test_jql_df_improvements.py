@@ -120,6 +120,13 @@ class TestJQLResultReduceStructure:
         # Should have a sensible column name, e.g. "value" or "result"
         assert "value" in df.columns or "result" in df.columns
 
+    def test_single_scalar_reduce_keeps_native_dtype(self) -> None:
+        """Single-scalar reduce() results should infer the scalar's dtype."""
+        assert JQLResult(_raw=[42]).df["value"].dtype == "int64"
+        assert JQLResult(_raw=[0.5]).df["value"].dtype == "float64"
+        assert JQLResult(_raw=[True]).df["value"].dtype == "bool"
+        assert JQLResult(_raw=["n/a"]).df["value"].tolist() == ["n/a"]
+
     def test_object_reduce(self) -> None:
         """reduce() returning object should expand to columns."""
         # Common pattern: .reduce(mixpanel.reducer.numeric_summary())
@@ -210,6 +217,21 @@ class TestJQLResultEdgeCases:
         with pytest.raises(ValueError, match="Inconsistent value types"):
             _ = result.df
 
+    def test_ragged_groupby_rows_pad_missing_cells(self) -> None:
+        """Rows with differing key lengths or fields should pad with NaN."""
+        result = JQLResult(
+            _raw=[
+                {"key": ["US"], "value": 100},
+                {"key": ["UK", "London"], "value": 50, "name": "Britain"},
+            ]
+        )
+
+        df = result.df
+        assert list(df.columns) == ["key_0", "value", "name", "key_1"]
+        assert pd.isna(df.loc[0, "key_1"])
+        assert pd.isna(df.loc[0, "name"])
+        assert df.loc[1, "key_1"] == "London"
+
     def test_deeply_nested_values(self) -> None:
         """Deeply nested values should be preserved."""
         result = JQLResult(
@@ -255,6 +277,11 @@ class TestJQLResultBackwardCompatibility:
         assert "value" in df.columns
         assert len(df) == 5
 
+    def test_scalar_list_wrapping_infers_numeric_dtype(self) -> None:
+        """Homogeneous numeric lists should get a numeric, not object, column."""
+        assert JQLResult(_raw=[1, 2, 3, 4, 5]).df["value"].dtype == "int64"
+        assert JQLResult(_raw=[1, 2.5, 3]).df["value"].dtype == "float64"
+
     def test_df_caching_still_works(self) -> None:
         """DataFrame caching should still work after improvements."""
         result = JQLResult(_raw=[{"key": ["US"], "value": 100}])
@@ -262,3 +289,12 @@ class TestJQLResultBackwardCompatibility:
         df1 = result.df
         df2 = result.df
         assert df1 is df2  # Same object, cached
+
+    def test_df_not_built_until_accessed(self) -> None:
+        """Construction and to_dict() should not build the DataFrame."""
+        result = JQLResult(_raw=[{"key": ["US"], "value": 100}])
+
+        assert result.to_dict() == {"raw": result.raw, "row_count": 1}
+        assert result._df_cache is None
+        _ = result.df
+        assert result._df_cache is not None
@@ -10,29 +10,38 @@ Properties tested:
 
 from __future__ import annotations
 
-from typing import Any
-
-from hypothesis import given, settings
+import datetime as dt
+import string
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, TypeVar
+
+import pytest
+from hypothesis import example, given, settings
 from hypothesis import strategies as st
 
 from mixpanel_headless._internal.services.live_query import (
     _transform_funnel,
     _transform_retention,
 )
+from mixpanel_headless._literal_types import TimeUnit
 
 # =============================================================================
 # Custom Strategies
 # =============================================================================
 
-# Strategy for valid date strings (YYYY-MM-DD format)
-date_strings = st.dates().map(lambda d: d.strftime("%Y-%m-%d"))
-
-# Strategy for event names
-event_names = st.text(
-    alphabet=st.characters(categories=("L", "N", "P", "S")),
-    min_size=1,
-    max_size=50,
+# Strategy for valid date strings (YYYY-MM-DD format). The transforms only
+# key and sort on these strings, so sampling from a fixed pool of ~11 years
+# of consecutive days avoids building and formatting a date per draw.
+_DATE_POOL = tuple(
+    (dt.date(2010, 1, 1) + dt.timedelta(days=i)).isoformat() for i in range(4096)
 )
+date_strings = st.sampled_from(_DATE_POOL)
+
+# Strategy for event names. The transforms only pass these through, so a
+# fixed ASCII alphabet avoids per-character Unicode category draws.
+_EVENT_ALPHABET = string.ascii_letters + string.digits + "._-"
+event_names = st.text(alphabet=_EVENT_ALPHABET, min_size=1, max_size=20)
 
 # Strategy for funnel step counts (non-negative integers)
 step_counts = st.integers(min_value=0, max_value=1_000_000)
@@ -43,6 +52,12 @@ cohort_sizes = st.integers(min_value=0, max_value=1_000_000)
 # Strategy for retention count arrays (values <= cohort_size)
 time_units = st.sampled_from(["day", "week", "month"])
 
+# Shape strategies for the raw responses, built once rather than per draw
+_num_funnel_dates = st.integers(min_value=0, max_value=5)
+_num_funnel_steps = st.integers(min_value=0, max_value=10)
+_num_cohorts = st.integers(min_value=0, max_value=10)
+_num_periods = st.integers(min_value=0, max_value=20)
+
 
 @st.composite
 def funnel_step(draw: st.DrawFn) -> dict[str, Any]:
@@ -52,13 +67,22 @@ def funnel_step(draw: st.DrawFn) -> dict[str, Any]:
     return {"event": event, "count": count}
 
 
+_funnel_step = funnel_step()
+
+
 @st.composite
 def funnel_day_data(draw: st.DrawFn, num_steps: int) -> dict[str, Any]:
     """Generate funnel data for a single date."""
-    steps = [draw(funnel_step()) for _ in range(num_steps)]
+    steps = [draw(_funnel_step) for _ in range(num_steps)]
     return {"steps": steps, "analysis": {}}
 
 
+@lru_cache(maxsize=32)
+def _funnel_day(num_steps: int) -> st.SearchStrategy[dict[str, Any]]:
+    """Return the cached ``funnel_day_data`` strategy for ``num_steps`` steps."""
+    return funnel_day_data(num_steps)
+
+
 @st.composite
 def raw_funnel_response(draw: st.DrawFn) -> dict[str, Any]:
     """Generate a raw funnel API response.
@@ -71,16 +95,17 @@ def raw_funnel_response(draw: st.DrawFn) -> dict[str, Any]:
         }
     }
     """
-    num_dates = draw(st.integers(min_value=0, max_value=5))
-    num_steps = draw(st.integers(min_value=0, max_value=10))
+    num_dates = draw(_num_funnel_dates)
+    num_steps = draw(_num_funnel_steps)
 
     dates = draw(
         st.lists(date_strings, min_size=num_dates, max_size=num_dates, unique=True)
     )
 
+    day_data = _funnel_day(num_steps)
     data: dict[str, Any] = {}
     for date in dates:
-        data[date] = draw(funnel_day_data(num_steps))
+        data[date] = draw(day_data)
 
     return {"data": data}
 
@@ -95,8 +120,8 @@ def raw_retention_response(draw: st.DrawFn) -> dict[str, Any]:
         "2024-01-02": {"first": cohort_size, "counts": [...]},
     }
     """
-    num_cohorts = draw(st.integers(min_value=0, max_value=10))
-    num_periods = draw(st.integers(min_value=0, max_value=20))
+    num_cohorts = draw(_num_cohorts)
+    num_periods = draw(_num_periods)
 
     dates = draw(
         st.lists(date_strings, min_size=num_cohorts, max_size=num_cohorts, unique=True)
@@ -123,6 +148,50 @@ def raw_retention_response(draw: st.DrawFn) -> dict[str, Any]:
 # _transform_funnel Property Tests
 # =============================================================================
 
+# Edge-case funnels pinned with @example so the weaker properties can run
+# fewer random examples: no dates, a single step, and a zero-count step
+# followed by another step (prev_count == 0).
+_EMPTY_FUNNEL: dict[str, Any] = {"data": {}}
+_SINGLE_STEP_FUNNEL: dict[str, Any] = {
+    "data": {"2024-01-01": {"steps": [{"event": "A", "count": 5}], "analysis": {}}}
+}
+_ZERO_PREV_FUNNEL: dict[str, Any] = {
+    "data": {
+        "2024-01-01": {
+            "steps": [{"event": "A", "count": 0}, {"event": "B", "count": 0}],
+            "analysis": {},
+        }
+    }
+}
+_EDGE_FUNNELS = (_EMPTY_FUNNEL, _SINGLE_STEP_FUNNEL, _ZERO_PREV_FUNNEL)
+
+_Test = TypeVar("_Test", bound=Callable[..., None])
+
+
+def _funnel_edge_examples(test: _Test) -> _Test:
+    """Pin every edge-case funnel as an explicit ``raw`` example of a test.
+
+    Args:
+        test: Test taking ``raw``, ``funnel_id``, ``from_date`` and ``to_date``.
+
+    Returns:
+        The test with one ``@example`` per edge-case funnel attached.
+    """
+    for raw in _EDGE_FUNNELS:
+        test = example(
+            raw=raw, funnel_id=1, from_date="2024-01-01", to_date="2024-01-02"
+        )(test)
+    return test
+
+
+# Step payloads for hand-built funnels, copied per example instead of rebuilt;
+# the step-count strategy draws up to _MAX_HAND_BUILT_STEPS so slices never
+# run short.
+_MAX_HAND_BUILT_STEPS = 5
+_STEP_TEMPLATES = tuple(
+    {"event": f"Step {i}", "count": 100} for i in range(_MAX_HAND_BUILT_STEPS)
+)
+
 
 class TestTransformFunnelProperties:
     """Property-based tests for _transform_funnel function.
@@ -140,6 +209,7 @@ class TestTransformFunnelProperties:
         from_date=date_strings,
         to_date=date_strings,
     )
+    @_funnel_edge_examples
     @settings(max_examples=100)
     def test_first_step_conversion_is_always_one(
         self,
@@ -165,15 +235,21 @@ class TestTransformFunnelProperties:
             assert result.steps[0].conversion_rate == 1.0
 
     @given(
-        raw=raw_funnel_response(),
+        batch=st.lists(raw_funnel_response(), min_size=8, max_size=8),
         funnel_id=st.integers(min_value=1, max_value=1_000_000),
         from_date=date_strings,
         to_date=date_strings,
     )
-    @settings(max_examples=100)
+    @example(
+        batch=list(_EDGE_FUNNELS),
+        funnel_id=1,
+        from_date="2024-01-01",
+        to_date="2024-01-02",
+    )
+    @settings(max_examples=20, deadline=None)
     def test_conversion_rates_are_non_negative(
         self,
-        raw: dict[str, Any],
+        batch: list[dict[str, Any]],
         funnel_id: int,
         from_date: str,
         to_date: str,
@@ -181,21 +257,25 @@ class TestTransformFunnelProperties:
         """All conversion rates should be non-negative.
 
         Conversion rates represent percentages and cannot be negative.
+        Responses are drawn in batches of eight so Hypothesis' per-example
+        overhead is shared.
 
         Args:
-            raw: Raw funnel API response.
+            batch: Raw funnel API responses.
             funnel_id: Funnel identifier.
             from_date: Query start date.
             to_date: Query end date.
         """
-        result = _transform_funnel(raw, funnel_id, from_date, to_date)
+        for raw in batch:
+            result = _transform_funnel(raw, funnel_id, from_date, to_date)
 
-        for step in result.steps:
-            assert step.conversion_rate >= 0.0, (
-                f"Step {step.event} has negative conversion_rate: {step.conversion_rate}"
-            )
+            for step in result.steps:
+                assert step.conversion_rate >= 0.0, (
+                    f"Step {step.event} has negative conversion_rate: "
+                    f"{step.conversion_rate}"
+                )
 
-        assert result.conversion_rate >= 0.0
+            assert result.conversion_rate >= 0.0
 
     @given(
         raw=raw_funnel_response(),
@@ -203,6 +283,7 @@ class TestTransformFunnelProperties:
         from_date=date_strings,
         to_date=date_strings,
     )
+    @_funnel_edge_examples
     @settings(max_examples=100)
     def test_overall_conversion_formula(
         self,
@@ -243,7 +324,8 @@ class TestTransformFunnelProperties:
         from_date=date_strings,
         to_date=date_strings,
     )
-    @settings(max_examples=100)
+    @_funnel_edge_examples
+    @settings(max_examples=30)
     def test_empty_funnel_has_zero_conversion(
         self,
         raw: dict[str, Any],
@@ -269,7 +351,7 @@ class TestTransformFunnelProperties:
         from_date=date_strings,
         to_date=date_strings,
         date=date_strings,
-        num_steps=st.integers(min_value=2, max_value=5),
+        num_steps=st.integers(min_value=2, max_value=_MAX_HAND_BUILT_STEPS),
     )
     def test_zero_previous_count_yields_zero_conversion(
         self,
@@ -292,7 +374,7 @@ class TestTransformFunnelProperties:
             num_steps: Number of steps to generate.
         """
         # Create a funnel where one step has count=0
-        steps = [{"event": f"Step {i}", "count": 100} for i in range(num_steps)]
+        steps = [dict(step) for step in _STEP_TEMPLATES[:num_steps]]
         # Set a middle step to 0 to test division by zero
         zero_step_idx = num_steps // 2
         steps[zero_step_idx]["count"] = 0
@@ -310,6 +392,11 @@ class TestTransformFunnelProperties:
 # _transform_retention Property Tests
 # =============================================================================
 
+# Return counts for hand-built cohorts; slicing gives each example a fresh list,
+# and the period strategy draws up to _MAX_HAND_BUILT_PERIODS.
+_MAX_HAND_BUILT_PERIODS = 10
+_RETURN_COUNTS = [10] * _MAX_HAND_BUILT_PERIODS
+
 
 class TestTransformRetentionProperties:
     """Property-based tests for _transform_retention function.
@@ -415,7 +502,7 @@ class TestTransformRetentionProperties:
         to_date=date_strings,
         unit=time_units,
         date=date_strings,
-        num_periods=st.integers(min_value=1, max_value=10),
+        num_periods=st.integers(min_value=1, max_value=_MAX_HAND_BUILT_PERIODS),
     )
     def test_zero_cohort_size_yields_zero_retention(
         self,
@@ -442,7 +529,7 @@ class TestTransformRetentionProperties:
             num_periods: Number of retention periods.
         """
         # Create a cohort with size 0 but with counts (edge case)
-        raw = {date: {"first": 0, "counts": [10] * num_periods}}
+        raw = {date: {"first": 0, "counts": _RETURN_COUNTS[:num_periods]}}
 
         result = _transform_retention(
             raw,
@@ -517,39 +604,18 @@ class TestTransformRetentionProperties:
                 f"Period {i}: expected {expected}, got {cohort.retention[i]}"
             )
 
-    @given(
-        born_event=event_names,
-        return_event=event_names,
-        from_date=date_strings,
-        to_date=date_strings,
-        unit=time_units,
-    )
-    def test_empty_response_yields_empty_cohorts(
-        self,
-        born_event: str,
-        return_event: str,
-        from_date: str,
-        to_date: str,
-        unit: str,
-    ) -> None:
+    @pytest.mark.parametrize("unit", ["day", "week", "month"])
+    def test_empty_response_yields_empty_cohorts(self, unit: TimeUnit) -> None:
         """Empty API response should produce empty cohorts list.
 
+        The other arguments are passed through untouched, so only the time
+        unit is varied rather than drawn by Hypothesis.
+
         Args:
-            born_event: Event defining cohort membership.
-            return_event: Event defining return.
-            from_date: Query start date.
-            to_date: Query end date.
             unit: Time unit for retention periods.
         """
-        raw: dict[str, Any] = {}
-
         result = _transform_retention(
-            raw,
-            born_event,
-            return_event,
-            from_date,
-            to_date,
-            unit,  # type: ignore[arg-type]
+            {}, "born", "return", "2024-01-01", "2024-01-02", unit
         )
 
         assert result.cohorts == []
@@ -20,13 +20,15 @@ from __future__ import annotations
 import dataclasses
 import datetime
 import json
+import operator
+import string
 from datetime import datetime as dt_datetime
 from pathlib import Path
 from typing import get_args
 
 import pandas as pd
 import pytest
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from mixpanel_headless._internal.bookmark_enums import VALID_FREQUENCY_FILTER_OPERATORS
@@ -73,25 +75,44 @@ from mixpanel_headless.types import (
 # =============================================================================
 
 # Strategy for generating valid date strings (YYYY-MM-DD format).
-# Constrained to 4-digit years (1000-9999) to match _DATE_RE regex.
+# Constrained to 4-digit years (1000-9999) to match _DATE_RE regex, where
+# isoformat() gives the same string as strftime at a fraction of the cost.
 date_strings = st.dates(
     min_value=datetime.date(1000, 1, 1),
     max_value=datetime.date(9999, 12, 31),
-).map(lambda d: d.strftime("%Y-%m-%d"))
+).map(datetime.date.isoformat)
+
+# Strategy for event names (non-empty, no whitespace). The result types only
+# carry event names through, so a fixed ASCII alphabet is enough and is far
+# cheaper to draw from than a Unicode category filter.
+_EVENT_ALPHABET = string.ascii_letters + string.digits + "._-"
+event_names = st.text(alphabet=_EVENT_ALPHABET, min_size=1, max_size=20)
+
+# Identifiers: a letter followed by letters or digits. The first character
+# is drawn from letters directly; filtering on s[0].isalpha() rejected many
+# draws because Hypothesis favours digits among these categories.
+_identifier_starts = st.characters(categories=("Lu", "Ll", "Lt", "Lm", "Lo"))
+_identifier_chars = st.characters(categories=("L", "N"))
+
+
+def identifiers(max_size: int) -> st.SearchStrategy[str]:
+    """Build a strategy for identifiers of up to ``max_size`` characters.
+
+    Args:
+        max_size: Maximum identifier length, at least 1.
+
+    Returns:
+        Strategy producing non-empty strings that start with a letter.
+    """
+    return st.builds(
+        operator.add,
+        _identifier_starts,
+        st.text(alphabet=_identifier_chars, max_size=max_size - 1),
+    )
 
-# Strategy for event names (non-empty printable strings)
-event_names = st.text(
-    alphabet=st.characters(categories=("L", "N", "P", "S")),
-    min_size=1,
-    max_size=50,
-).filter(lambda s: s.strip())
 
 # Strategy for table names (valid identifiers)
-table_names = st.text(
-    alphabet=st.characters(categories=("L", "N")),
-    min_size=1,
-    max_size=30,
-).filter(lambda s: s and s[0].isalpha())
+table_names = identifiers(30)
 
 # Strategy for valid conversion rates (0.0 to 1.0)
 conversion_rates = st.floats(min_value=0.0, max_value=1.0, allow_nan=False)
@@ -208,11 +229,7 @@ class TestResultWithDataFrameProperties:
     @given(
         num_rows=st.integers(min_value=1, max_value=20),
         col_names=st.lists(
-            st.text(
-                alphabet=st.characters(categories=("L", "N")),
-                min_size=1,
-                max_size=15,
-            ).filter(lambda s: s and s[0].isalpha()),
+            identifiers(15),
             min_size=1,
             max_size=8,
             unique=True,
@@ -339,6 +356,7 @@ class TestSegmentationResultProperties:
         unit=time_units,
         total=st.integers(min_value=0, max_value=10_000_000),
     )
+    @settings(max_examples=50)
     def test_to_dict_always_json_serializable(
         self, event: str, from_date: str, to_date: str, unit: str, total: int
     ) -> None:
@@ -354,8 +372,7 @@ class TestSegmentationResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         event=event_names,
@@ -371,6 +388,7 @@ class TestSegmentationResultProperties:
             max_size=5,
         ),
     )
+    @settings(max_examples=25)
     def test_df_row_count_matches_series_structure(
         self, event: str, segments: dict[str, dict[str, int]]
     ) -> None:
@@ -389,6 +407,7 @@ class TestSegmentationResultProperties:
         assert len(result.df) == expected_rows
 
     @given(event=event_names)
+    @settings(max_examples=50)
     def test_df_has_required_columns(self, event: str) -> None:
         """DataFrame should always have date, segment, count columns."""
         result = SegmentationResult(
@@ -421,6 +440,7 @@ class TestFunnelResultProperties:
         conversion_rate=conversion_rates,
         step_count=st.integers(min_value=0, max_value=10),
     )
+    @settings(max_examples=50)
     def test_to_dict_always_json_serializable(
         self, funnel_id: int, funnel_name: str, conversion_rate: float, step_count: int
     ) -> None:
@@ -444,11 +464,11 @@ class TestFunnelResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert len(data["steps"]) == step_count
 
     @given(step_count=st.integers(min_value=0, max_value=20))
+    @settings(max_examples=50)
     def test_df_row_count_matches_steps(self, step_count: int) -> None:
         """DataFrame should have one row per funnel step."""
         steps = [
@@ -482,6 +502,7 @@ class TestRetentionResultProperties:
         unit=time_units,
         cohort_count=st.integers(min_value=0, max_value=10),
     )
+    @settings(max_examples=50)
     def test_to_dict_always_json_serializable(
         self, born_event: str, return_event: str, unit: str, cohort_count: int
     ) -> None:
@@ -505,12 +526,12 @@ class TestRetentionResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         retention=retention_lists,
     )
+    @settings(max_examples=50)
     def test_cohort_retention_preserved(self, retention: list[float]) -> None:
         """Retention percentages should be preserved through serialization."""
         cohort = CohortInfo(
@@ -619,6 +640,7 @@ class TestJQLResultProperties:
             max_size=20,
         )
     )
+    @settings(max_examples=50)
     def test_to_dict_always_json_serializable(
         self, raw_data: list[dict[str, object]]
     ) -> None:
@@ -626,13 +648,13 @@ class TestJQLResultProperties:
         result = JQLResult(_raw=raw_data)
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert data["row_count"] == len(raw_data)
 
     @given(
         values=st.lists(st.integers(), min_size=0, max_size=50),
     )
+    @settings(max_examples=50)
     def test_df_wraps_simple_lists_in_value_column(self, values: list[int]) -> None:
         """Simple lists should be wrapped in 'value' column."""
         result = JQLResult(_raw=values)
@@ -654,6 +676,7 @@ class TestJQLResultProperties:
             max_size=10,
         )
     )
+    @settings(max_examples=25)
     def test_df_preserves_dict_structure(self, raw_data: list[dict[str, int]]) -> None:
         """Dict lists should become DataFrame columns."""
         result = JQLResult(_raw=raw_data)
@@ -662,8 +685,9 @@ class TestJQLResultProperties:
         assert len(df) == len(raw_data)
 
         # All keys from first dict should be columns
+        columns = set(df.columns)
         for key in raw_data[0]:
-            assert key in df.columns
+            assert key in columns
 
     @given(
         raw_data=st.one_of(
@@ -681,6 +705,7 @@ class TestJQLResultProperties:
             groupby_structure(),
         )
     )
+    @settings(max_examples=50)
     def test_deterministic_dataframe_conversion(self, raw_data: list[object]) -> None:
         """Same input should always produce structurally identical DataFrames.
 
@@ -721,6 +746,7 @@ class TestJQLResultProperties:
             nested_percentile_structure(),
         )
     )
+    @settings(max_examples=50)
     def test_df_never_crashes_on_valid_jql_output(self, raw_data: list[object]) -> None:
         """DataFrame conversion should never crash on valid JQL output."""
         result = JQLResult(_raw=raw_data)
@@ -745,6 +771,7 @@ class TestJQLResultProperties:
             groupby_structure(),
         )
     )
+    @settings(max_examples=50)
     def test_df_caching_works_for_all_structures(self, raw_data: list[object]) -> None:
         """DataFrame should be cached regardless of structure."""
         result = JQLResult(_raw=raw_data)
@@ -759,6 +786,7 @@ class TestJQLResultProperties:
         key_count=st.integers(min_value=1, max_value=5),
         row_count=st.integers(min_value=1, max_value=20),
     )
+    @settings(max_examples=50)
     def test_groupby_key_expansion_is_consistent(
         self, key_count: int, row_count: int
     ) -> None:
@@ -784,6 +812,7 @@ class TestJQLResultProperties:
         reducer_count=st.integers(min_value=2, max_value=6),
         row_count=st.integers(min_value=1, max_value=20),
     )
+    @settings(max_examples=50)
     def test_multiple_reducer_expansion_is_consistent(
         self, reducer_count: int, row_count: int
     ) -> None:
@@ -808,6 +837,7 @@ class TestJQLResultProperties:
     @given(
         num_rows=st.integers(min_value=2, max_value=10),
     )
+    @settings(max_examples=50)
     def test_heterogeneous_value_types_raise_error(self, num_rows: int) -> None:
         """Heterogeneous value types (mixed scalar/array) should raise ValueError.
 
@@ -869,14 +899,11 @@ class TestCrossTypeInvariants:
         )
         jql = JQLResult()
 
-        # All should produce valid to_dict output
-        all_results = [seg, funnel, retention, jql]
-        for r in all_results:
-            data = r.to_dict()  # type: ignore[attr-defined]
+        # All should produce valid to_dict output and valid DataFrames
+        for r in (seg, funnel, retention, jql):
+            data = r.to_dict()
             json.dumps(data)  # Should not raise
 
-        # All should produce valid DataFrames
-        for r in all_results:
             df = r.df
             assert df is not None
             assert len(df) >= 0
@@ -916,8 +943,7 @@ class TestEventCountsResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         series=st.dictionaries(
@@ -1003,8 +1029,7 @@ class TestPropertyCountsResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         series=st.dictionaries(
@@ -1066,8 +1091,7 @@ class TestNumericBucketResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         series=st.dictionaries(
@@ -1156,8 +1180,7 @@ class TestNumericSumResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         results=st.dictionaries(
@@ -1237,8 +1260,7 @@ class TestNumericAverageResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         results=st.dictionaries(
@@ -1311,8 +1333,7 @@ class TestFrequencyResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         data=st.dictionaries(
@@ -1379,8 +1400,7 @@ class TestActivityFeedResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert data["event_count"] == event_count
 
     @given(event_count=st.integers(min_value=0, max_value=20), event_time=datetimes)
@@ -1435,8 +1455,7 @@ class TestSavedReportResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         headers=st.lists(st.text(min_size=1, max_size=30), min_size=0, max_size=5),
@@ -1507,8 +1526,7 @@ class TestFlowsResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert len(data["steps"]) == step_count
 
     @given(step_count=st.integers(min_value=0, max_value=20))
@@ -1546,8 +1564,7 @@ class TestHelperTypeProperties:
         """FunnelInfo.to_dict() should always be JSON-serializable."""
         result = FunnelInfo(funnel_id=funnel_id, name=name)
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         id=st.integers(min_value=1, max_value=10_000_000),
@@ -1576,8 +1593,7 @@ class TestHelperTypeProperties:
             is_visible=is_visible,
         )
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         id=st.integers(min_value=1, max_value=10_000_000),
@@ -1608,8 +1624,7 @@ class TestHelperTypeProperties:
             modified=modified,
         )
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         event=event_names,
@@ -1622,8 +1637,7 @@ class TestHelperTypeProperties:
         """TopEvent.to_dict() should always be JSON-serializable."""
         result = TopEvent(event=event, count=count, percent_change=percent_change)
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
     @given(
         event=event_names,
@@ -1647,8 +1661,7 @@ class TestHelperTypeProperties:
         """UserEvent.to_dict() should always be JSON-serializable."""
         result = UserEvent(event=event, time=event_time, properties=properties)
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
 
 
 # =============================================================================
@@ -1691,8 +1704,7 @@ class TestPropertyValueCountProperties:
         result = PropertyValueCount(value=value, count=count, percentage=percentage)
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert data["count"] == count
 
     @given(
@@ -1754,8 +1766,7 @@ class TestPropertyDistributionResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert len(data["values"]) == value_count
 
     @given(value_count=st.integers(min_value=0, max_value=30))
@@ -1862,8 +1873,7 @@ class TestNumericPropertySummaryResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert data["count"] == count
 
     @given(
@@ -1917,8 +1927,7 @@ class TestDailyCountProperties:
         result = DailyCount(date=date, event=event, count=count)
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert data["count"] == count
 
 
@@ -1954,8 +1963,7 @@ class TestDailyCountsResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert len(data["counts"]) == count_count
 
     @given(count_count=st.integers(min_value=0, max_value=30))
@@ -2030,8 +2038,7 @@ class TestEngagementBucketProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert data["user_count"] == user_count
 
 
@@ -2073,8 +2080,7 @@ class TestEngagementDistributionResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert len(data["buckets"]) == bucket_count
 
     @given(bucket_count=st.integers(min_value=0, max_value=20))
@@ -2162,8 +2168,7 @@ class TestPropertyCoverageProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert data["defined_count"] == defined_count
 
 
@@ -2205,8 +2210,7 @@ class TestPropertyCoverageResultProperties:
         )
 
         data = result.to_dict()
-        json_str = json.dumps(data)
-        assert isinstance(json_str, str)
+        json.dumps(data)  # Should not raise
         assert len(data["coverage"]) == coverage_count
 
     @given(coverage_count=st.integers(min_value=0, max_value=20))